@@ -0,0 +1,49 @@
+// LatencyListener.cpp
+
+// Times every test with a steady clock and, if COVERAGE_BENCHMARK_LATENCIES names a file, writes a
+// "Suite.Test nanoseconds" line per test to it when the tests finish. gtest's own per-test times
+// only have millisecond resolution.
+
+#include <chrono>
+#include <cstdlib>
+#include <fstream>
+#include <sstream>
+#include <string>
+
+#include <gtest/gtest.h>
+
+namespace {
+
+class LatencyListener : public ::testing::EmptyTestEventListener {
+public:
+    explicit LatencyListener(const char* path) : path(path) {}
+
+    void OnTestStart(const ::testing::TestInfo&) override {
+        start = std::chrono::steady_clock::now();
+    }
+
+    void OnTestEnd(const ::testing::TestInfo& test_info) override {
+        auto elapsed = std::chrono::steady_clock::now() - start;
+        latencies << test_info.test_suite_name() << "." << test_info.name() << " "
+                  << std::chrono::duration_cast<std::chrono::nanoseconds>(elapsed).count() << "\n";
+    }
+
+    void OnTestProgramEnd(const ::testing::UnitTest&) override {
+        std::ofstream(path) << latencies.str();
+    }
+
+private:
+    std::string path;
+    std::chrono::steady_clock::time_point start;
+    std::ostringstream latencies;
+};
+
+// Registers the listener before gtest_main runs the tests.
+const bool registered = [] {
+    if (const char* path = std::getenv("COVERAGE_BENCHMARK_LATENCIES")) {
+        ::testing::UnitTest::GetInstance()->listeners().Append(new LatencyListener(path));
+    }
+    return true;
+}();
+
+}
@@ -1,16 +1,35 @@
-import seutil as su
+import abc
 import logging
 import os
 import argparse
-import re
+import sys
 import math
 import json
+import hashlib
+import importlib
+import functools
+import shutil
+import concurrent.futures
+import contextlib
+import socket
+import sqlite3
+import uuid
+import itertools
+import copy
+import csv
+import difflib
+import gzip
+import html
+import random
+import shlex
+import signal
+import subprocess
+import tempfile
+import time
 
 from datetime import datetime
 from pathlib import Path
-from seutil.bash import BashError
-from statistics import mean, stdev
-from tabulate import tabulate
+from statistics import mean, median, stdev
 
 WORKLOAD=[100, 1000, 10000]
 
@@ -23,23 +42,267 @@ CPP_SRC_DIR = _DIR / "cpp"
 GTEST_DIR = _DIR / ".gtest"
 GTEST_INCLUDE_DIR = GTEST_DIR / "googletest/include"
 GTEST_LIB_DIR = GTEST_DIR / "build/lib"
+CACHE_DIR = _DIR / ".cache"
+RESULTS_DIR = _DIR / ".results"
+RESULTS_DB = RESULTS_DIR / "results.db"
 
-## Set up logging
-su.io.mkdir(LOG_DIR)
-log_file = Path(LOG_DIR / f"{datetime.now().isoformat()}.log")
-su.log.setup(
-    log_file=log_file,
-    level_stderr=logging.WARNING,
-    level_file=logging.DEBUG,
-    maxBytes=1_000_000_000, # 1G per log file
-    backupCount=10) # 10 log files
-logger = su.log.get_logger(__name__, level=logging.DEBUG)
-logger.warning(f"See log file: {log_file}")
+# Marks a finished build in the build cache.
+BUILD_STAMP = ".built"
 
+CPP_FLAGS = f"-isystem {GTEST_INCLUDE_DIR} -pthread"
 
-#Rust coverage tools
-RUST_COVERAGE_TOOLS = ['llvm-cov', 'tarpaulin']
-CPP_COVERAGE_TOOLS = ['gcov']
+class _LazyModule:
+    """
+    Stands in for a module that is imported when one of its attributes is first used, so that importing
+    the harness does not import seutil.
+    """
+    def __init__(self, name: str)->None:
+        self._name = name
+    #fed
+
+    def __getattr__(self, attribute: str):
+        return getattr(importlib.import_module(self._name), attribute)
+    #fed
+#ssalc
+
+su = _LazyModule("seutil")
+
+def tabulate(*args, **kwargs)->str:
+    """
+    Formats a table with tabulate, imported on first use.
+    """
+    return importlib.import_module("tabulate").tabulate(*args, **kwargs)
+#fed
+
+## Logging
+# Until _setup_logging runs, e.g. when the harness is imported as a library, warnings go to stderr only.
+logger = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def _setup_logging()->Path:
+    """
+    Logs to a new timestamped log file in LOG_DIR, and warnings to stderr, once per process, when the
+    first session starts. Returns the log file.
+    """
+    global logger
+    su.io.mkdir(LOG_DIR)
+    log_file = Path(LOG_DIR / f"{datetime.now().isoformat()}.log")
+    su.log.setup(
+        log_file=log_file,
+        level_stderr=logging.WARNING,
+        level_file=logging.DEBUG,
+        maxBytes=1_000_000_000, # 1G per log file
+        backupCount=10) # 10 log files
+    logger = su.log.get_logger(__name__, level=logging.DEBUG)
+    logger.warning(f"See log file: {log_file}")
+    return log_file
+#fed
+
+def _new_run_id()->str:
+    """
+    Returns a new id identifying the measurements of a session in the results store.
+    """
+    return f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+#fed
+
+
+# Coverage tools measured unless others are selected. COVERAGE_ADAPTERS lists every supported tool.
+DEFAULT_COVERAGE_TOOLS = ['llvm-cov', 'tarpaulin', 'gcov']
+
+# Directory of a build that source-based coverage writes its raw profiles to.
+PROFILE_DIR = "profiles"
+
+# Directory on tmpfs that coverage data is written to instead of the build directory, to take the disk
+# out of the I/O cost of coverage.
+TMPFS_DIR = Path("/dev/shm/coverage-benchmark")
+
+# Phases timed separately for every run. Tools that produce their report while
+# running the tests (tarpaulin) and runs without coverage have no report phase.
+# Runs only have a rebuild phase, the build after a scripted edit, with a rebuild target.
+PHASES = ['build', 'rebuild', 'test', 'report']
+
+# Files a scripted edit before the rebuild phase changes: the task sources, or the first generated test shard.
+REBUILD_TARGETS = ['source', 'test']
+# Starts the comment line a scripted edit appends to a file, replacing the one the previous edit appended.
+EDIT_MARKER = "// coverage-benchmark edit "
+
+# Phase of the runs of --test-impact, recorded with IMPACT_METRICS instead of the measurements of a phase.
+IMPACT_PHASE = 'impact'
+# Recorded with the impact phase: the wall times in seconds of running all tests with coverage and, built
+# by the baseline, without, of selecting the tests affected by an edit from the coverage index, of running
+# only those, which is not recorded if none were selected, of indexing them again and of rebuilding after
+# the edit with coverage and without, the end-to-end wall times in seconds of the edit-rebuild-test loop
+# with all tests, with coverage and without, and with the selected ones, index update included, the
+# numbers of tests and of selected tests, and the wall time in seconds of building the coverage index and
+# its size in bytes.
+IMPACT_METRICS = ['full_time', 'plain_time', 'select_time', 'selective_time', 'index_update_time', 'rebuild_time',
+                  'plain_rebuild_time', 'full_cycle_time', 'plain_cycle_time', 'selective_cycle_time', 'tests',
+                  'selected_tests', 'index_time', 'index_bytes']
+# Coverage index of --test-impact in the build directory: gzipped JSON with the impact sources as indexed
+# and, for every test, a hex bitmap of the lines it covers in each of them.
+COVERAGE_INDEX = "coverage-index.json.gz"
+# Starts the comment a test impact edit appends to a covered line, replacing the one a previous edit appended.
+IMPACT_MARKER = " // coverage-benchmark impact "
+
+# Launches the commands of the JSON list in the first argument, each a list of the file its standard output
+# is written to, the variables added to its environment and its argv, at most as many at once as the second
+# argument, and prints as JSON the wall time from the first start to the last exit and the return code,
+# wall time and resource usage of every command. A process inherits the peak memory of the process that
+# spawned it, so measuring from a fresh, small interpreter instead of the harness keeps the harness out of
+# max_rss, and its startup, once for all the commands, off the clock.
+_LAUNCHER = """
+import json, os, sys, time
+commands, jobs = json.loads(sys.argv[1]), int(sys.argv[2])
+runs, started, running = [None] * len(commands), {}, {}
+start = time.monotonic_ns()
+while len(started) < len(commands) or running:
+    while len(started) < len(commands) and len(running) < jobs:
+        k = len(started)
+        stdout, env, argv = commands[k]
+        pid = os.posix_spawnp(argv[0], argv, {**os.environ, **env},
+                              file_actions=[(os.POSIX_SPAWN_OPEN, 1, stdout, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)])
+        started[k], running[pid] = time.monotonic_ns(), k
+    pid, status, rusage = os.wait4(-1, 0)
+    k = running.pop(pid)
+    runs[k] = {
+        'returncode': os.waitstatus_to_exitcode(status),
+        'wall_time': (time.monotonic_ns() - started[k]) / 1e9,
+        'user_time': rusage.ru_utime,
+        'sys_time': rusage.ru_stime,
+        'max_rss': rusage.ru_maxrss,
+        'minor_faults': rusage.ru_minflt,
+        'major_faults': rusage.ru_majflt,
+        'voluntary_switches': rusage.ru_nvcsw,
+        'involuntary_switches': rusage.ru_nivcsw,
+        'block_inputs': rusage.ru_inblock,
+        'block_outputs': rusage.ru_oublock,
+    }
+print(json.dumps({'wall_time': (time.monotonic_ns() - start) / 1e9, 'runs': runs}))
+"""
+
+# Defaults of the sampling engine: warmup runs per cell, location estimator (mean, median or trimmed),
+# bootstrap resamples, confidence level and seed of the overhead ratio CIs and, for adaptive sampling,
+# the target relative CI width, the run limit and the time budget in seconds, whether test runs
+# count hardware events, the order runs are measured in, the CPUs measurements are pinned to and the
+# seconds after which a build, test or report run is killed, which files, if any, an edit before the
+# rebuild phase changes, and whether null runs are measured to calibrate the fixed costs.
+SAMPLING_DEFAULTS: dict = {
+    'warmup': 0,
+    'estimator': 'mean',
+    'bootstrap': 1000,
+    'confidence': 0.95,
+    'seed': 0,
+    'ci_target': None,
+    'max_runs': 50,
+    'time_budget': None,
+    'counters': False,
+    'order': 'fixed',
+    'cpus': None,
+    'timeout': None,
+    'rebuild': None,
+    'calibrate': False,
+}
+
+# Orders in which the runs are measured, see _order_repetition.
+ORDERS = ['fixed', 'random', 'abba', 'latin']
+# Fraction of samples trimmed from either end by the trimmed estimator.
+TRIM_FRACTION = 0.1
+# Relative increase of an overhead ratio, significant at the confidence level, that compare_results flags as a regression.
+REGRESSION_THRESHOLD = 0.05
+
+# Columns of the results store every measurement has.
+MEASUREMENT_COLUMNS = ['run_id', 'timestamp', 'git_revision', 'host', 'language', 'tool', 'tool_version',
+                       'workload', 'repetition', 'phase', 'metric', 'value']
+
+# Columns of the per-test durations in the results store.
+TEST_LATENCY_COLUMNS = ['run_id', 'language', 'tool', 'workload', 'repetition', 'test', 'duration']
+
+# Columns of the session manifest in the results store, one row per finished or failed run of a variant.
+MANIFEST_COLUMNS = ['run_id', 'timestamp', 'language', 'tool', 'workload', 'repetition', 'status', 'error']
+
+# Directory of a build that the test frameworks write their per-test results to.
+TEST_RESULTS_DIR = "test-results"
+# Names the file the C++ tests write the nanosecond duration of every test to, see cpp/LatencyListener.cpp.
+LATENCIES_ENV = "COVERAGE_BENCHMARK_LATENCIES"
+
+# Colors of the series of the exported charts, reused when there are more series.
+CHART_COLORS = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+
+# Percentiles of the per-test latencies reported.
+LATENCY_PERCENTILES = [50, 95, 99]
+
+# Columns of the results store recording when and where a run was measured: its position in the
+# measurement order of its session and the CPUs it was pinned to, with the values of runs recorded
+# before they existed.
+ORDER_COLUMNS: dict = {
+    'sequence': 0,
+    'cpus': '',
+}
+
+# Benchmark dimensions besides language, tool and workload, with their default values. Measurements
+# recorded before a dimension was added are read back with its default.
+DIMENSIONS: dict = {
+    'shards': 1,
+    'profile': 'constructor',
+    'threads': 0,
+    'opt_level': '0',
+    'counter_update': 'default',
+    'artifact_dir': 'build',
+    'counters': 'none',
+}
+
+# Optimization levels of the builds, -O<level> for C++ and the opt-level of the cargo profiles for Rust.
+OPT_LEVELS = ['0', '1', '2', '3', 's']
+
+# How instrumented builds update their coverage counters, -fprofile-update for gcc and clang. LLVM
+# instrumentation of Rust only tells single from atomic updates, so prefer-atomic means atomic there.
+# default leaves the choice to the compiler.
+COUNTER_UPDATES = ['default', 'single', 'atomic', 'prefer-atomic']
+
+# Where the tests write coverage data: the build directory, or TMPFS_DIR.
+ARTIFACT_DIRS = ['build', 'tmpfs']
+# Workload profiles of the generated tests. Under the constructor profile every test constructs one Task
+# and checks one field. Under the others every test adds loop tasks to a TaskManager, completes a fraction
+# branch of them, lists them and saves and loads them io times, so the coverage counters of the
+# TaskManager loops get hot.
+WORKLOAD_PROFILES: dict = {
+    'constructor': {'loop': 0, 'branch': 0.0, 'io': 0},
+    'manager': {'loop': 1000, 'branch': 0.25, 'io': 0},
+    'branchy': {'loop': 1000, 'branch': 0.9, 'io': 0},
+    'io': {'loop': 1000, 'branch': 0.25, 'io': 5},
+}
+
+# Buffer size of the test generators.
+GEN_BUFFER_SIZE = 1 << 20
+
+# Measured for every phase: wall time and CPU times in seconds, peak resident set size in kilobytes,
+# page faults, context switches and block input and output operations.
+METRICS = ['wall_time', 'user_time', 'sys_time', 'max_rss', 'minor_faults', 'major_faults',
+           'voluntary_switches', 'involuntary_switches', 'block_inputs', 'block_outputs']
+# Hardware events counted with perf stat in the test phase when hardware counters are enabled and
+# perf is permitted, by perf event name, with the names of their metrics.
+PERF_EVENTS: dict = {
+    'instructions': 'instructions',
+    'cycles': 'cycles',
+    'branch-misses': 'branch_misses',
+    'cache-misses': 'cache_misses',
+}
+# Recorded with the test phase: total size in bytes of the test binaries that ran.
+BINARY_SIZE = 'binary_size'
+# Recorded with some phases of coverage runs: the number and total size in bytes of the coverage artifacts
+# after the build, test and report phases, the wall time in seconds of the test phase outside the tests as
+# timed by the test framework, which includes writing the coverage data at exit, and the wall time in
+# seconds of merging raw profiles in the report phase.
+ARTIFACT_METRICS = ['artifact_count', 'artifact_bytes', 'exit_time', 'merge_time']
+# Recorded with the test phase of null runs: wall time in seconds of measuring a command that does nothing,
+# the cost of the harness itself in every measured run.
+HARNESS_TIME = 'harness_time'
+# Shown instead of the build and total of runs that all reused a build cached by an earlier session or
+# built concurrently with other builds.
+CACHED = 'cached'
+# Workload of the null runs --calibrate adds, test binaries without tests, whose times are the fixed
+# cost of starting and exiting them with each tool.
+NULL_WORKLOAD = 0
 
 def install_rust()->None:
     """
@@ -52,7 +315,7 @@ def install_rust()->None:
             check_returncode=0
         )
         logger.info(f"Rust already installed. Skipping installation.")
-    except BashError as e:
+    except su.bash.BashError as e:
         logger.info("Installing Rust...")
         su.bash.run("curl --proto '=https' --tlsv1.2 -sSf https://sh.rustup.rs | sh")
     #yrt
@@ -64,7 +327,7 @@ def install_rust()->None:
             check_returncode=0
         )
         logger.info(f"Rust installation successful.")
-    except BashError as e:
+    except su.bash.BashError as e:
         logger.warning(f"Rust installation failed due to:"
                        f"{e}"
         )
@@ -81,19 +344,21 @@ def install_rust_coverage_tools()->None:
             "cargo --help",
             check_returncode=0
         )
-    except BashError as e:
+    except su.bash.BashError as e:
         logger.error("Install Rust first!")
         return
     #yrt
     
-    logger.info(f"Installing {RUST_COVERAGE_TOOLS}...")
-    for tool in RUST_COVERAGE_TOOLS:
+    adapters: list = [adapter for adapter in COVERAGE_ADAPTERS.values() if adapter.language == 'Rust' and adapter.install_cmd]
+    logger.info(f"Installing {[adapter.name for adapter in adapters]}...")
+    for adapter in adapters:
+        tool = adapter.name
         try:
             su.bash.run(
-                f"cargo install cargo-{tool}",
+                adapter.install_cmd,
                 check_returncode=0
             )
-        except BashError as e:
+        except su.bash.BashError as e:
             logger.error(f"Could not install coverage tool {tool}.")
             continue
         #yrt
@@ -104,88 +369,549 @@ def install_cpp_coverage_tools()->None:
     """
     Installs coverage tools for C++.
     """
-    logger.info(f"Install gcov manually from terminal with apt-get")
+    for adapter in COVERAGE_ADAPTERS.values():
+        if adapter.language == 'Cpp' and adapter.install_cmd:
+            logger.info(f"Install {adapter.name} manually from terminal with: sudo {adapter.install_cmd}")
+        #fi
+    #rof
 #fed
 
-def _process_time_stdout(
-    time_stdout: str,
-)->float:
-    pattern = r"real\s+(\d+)m([\d.]+)s"
-    match = re.search(pattern, time_stdout)
-
-    if match:
-        minutes = int(match.group(1))
-        seconds = float(match.group(2))
-        total_seconds = minutes * 60 + seconds
-        return total_seconds
-    else:
-        return -1
+class MeasuredRunError(subprocess.CalledProcessError):
+    """
+    Raised when a command run by _measured_run exits with a non-zero code.
+    """
+    def __str__(self)->str:
+        return f"{super().__str__()}\n{self.stderr}"
+    #fed
+#ssalc
+
+@functools.lru_cache(maxsize=None)
+def _perf_available()->bool:
+    """
+    Checks whether perf stat can count hardware events here. Hosts without perf, or which do not permit
+    it to read the counters, fall back to rusage metrics only.
+    """
+    try:
+        counts = _perf_counts(subprocess.run(
+            ["perf", "stat", "-x", ",", "-e", ",".join(PERF_EVENTS), "--", "true"],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stderr)
+    except (OSError, subprocess.CalledProcessError) as e:
+        counts = {}
+    #yrt
+    if not counts:
+        logger.warning("perf stat cannot count hardware events on this host, recording rusage metrics only.")
     #fi
+    return bool(counts)
 #fed
 
-def gen_rust_tests(
-    num_tests: int
-)->None:
+def _perf_counts(
+    output: str,
+)->dict:
     """
-    Generates tests for Rust in module tests.rs with num_tests number of tests.
-    """
-    logger.info(f"Generating tests for Rust for workload {num_tests}...")
-    with open(RUST_SRC_DIR / "tests.rs", 'w') as f:
-        f.write("#[cfg(test)]\n")
-        f.write("mod tests {\n\n")
-        f.write("\tuse crate::tasks::{Task};\n")
-
-        for i in range(1, num_tests + 1):
-            f.write("\t#[test]\n")
-            f.write(f"\tfn test{i}_tasks() {{\n")
-            if i % 3 == 0:
-                f.write('\t\tlet task = Task::new("Test Task".to_string());\n')
-                f.write('\t\tassert_eq!(task.description, "Test Task");\n')
-            elif i % 2 == 0:
-                f.write('\t\tlet task = Task::new("Test Task".to_string());\n')
-                f.write(f"\t\tassert!(!task.completed);\n")
-            else:
-                f.write('\t\tlet mut task = Task::new("Test Task".to_string());\n')
-                f.write(f"\t\ttask.completed = true;\n")
-                f.write(f"\t\tassert!(task.completed);\n")
+    Parses the CSV output of perf stat -x, into the counts of PERF_EVENTS, keyed by metric name.
+    Events perf could not count are left out.
+    """
+    counts: dict = {}
+    for line in output.splitlines():
+        fields = line.split(",")
+        if len(fields) < 3:
+            continue
+        #fi
+        event = fields[2].split(":")[0]
+        if event in PERF_EVENTS and fields[0].replace(".", "", 1).isdigit():
+            counts[PERF_EVENTS[event]] = float(fields[0])
+        #fi
+    #rof
+    return counts
+#fed
+
+def _launch(
+    commands: list[tuple],
+    cwd: Path,
+    jobs: int,
+    counters: bool,
+    timeout: float,
+)->tuple[float, list[dict]]:
+    """
+    Runs commands, each a tuple of its argv, the variables added to its environment and the file its
+    standard output goes to or None to discard it, from one launcher in cwd without a shell, at most
+    jobs at once. Returns the wall time from the first start to the last exit and the measurements of
+    every command, see _measured_run. If any command fails, raises MeasuredRunError with the standard
+    error of all of them. Taking longer than timeout seconds in all, the launcher is killed together with
+    every process it started and subprocess.TimeoutExpired is raised.
+    """
+    counters = counters and _perf_available()
+    with tempfile.TemporaryFile() as stderr, contextlib.ExitStack() as stack:
+        perf_outputs: list = [stack.enter_context(tempfile.NamedTemporaryFile(mode='r', suffix=".perf")) if counters else None
+                              for command in commands]
+        argvs: list[list[str]] = [
+            ["perf", "stat", "-x", ",", "-o", perf_output.name, "-e", ",".join(PERF_EVENTS), "--", *argv] if counters else list(argv)
+            for (argv, env, stdout), perf_output in zip(commands, perf_outputs)
+        ]
+        launched = json.dumps([[str(stdout or os.devnull), env or {}, [str(arg) for arg in argv]]
+                               for (_, env, stdout), argv in zip(commands, argvs)])
+        # Its own process group lets a timeout kill the tools along with the launcher.
+        process = subprocess.Popen(
+            [sys.executable, "-S", "-c", _LAUNCHER, launched, str(jobs)],
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            text=True,
+            start_new_session=True
+        )
+        try:
+            output, _ = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.communicate()
+            raise subprocess.TimeoutExpired(argvs[0] if len(argvs) == 1 else argvs, timeout)
+        #yrt
+        launch = json.loads(output) if process.returncode == 0 else {'runs': [{'returncode': process.returncode}]}
+        failed = next((k for k, run in enumerate(launch['runs']) if run['returncode'] != 0), None)
+        if failed is not None:
+            stderr.seek(0)
+            raise MeasuredRunError(launch['runs'][failed]['returncode'], argvs[min(failed, len(argvs) - 1)],
+                                   stderr=stderr.read().decode(errors='replace'))
+        #fi
+        for run, perf_output in zip(launch['runs'], perf_outputs):
+            del run['returncode']
+            if counters:
+                run.update(_perf_counts(perf_output.read()))
             #fi
-            f.write("\t}\n")
         #rof
-        f.write("}\n")
     #htiw
-    logger.info(f"Test generation for Rust finished.")
+    return launch['wall_time'], launch['runs']
 #fed
 
-def gen_cpp_tests(
-    num_tests: int
+def _measured_run(
+    argv: list[str],
+    cwd: Path,
+    env: dict = None,
+    stdout: Path = None,
+    counters: bool = False,
+    timeout: float = None,
+)->dict:
+    """
+    Runs argv in cwd without a shell, with env added to the environment, and returns its monotonic
+    wall time together with the resource usage of the process and of the children it waited for.
+    Times are in seconds and max_rss in kilobytes. The standard output of argv goes to the file
+    stdout, or is discarded. With counters, and where perf is permitted, argv runs under perf stat
+    and the counts of PERF_EVENTS are returned too. A run taking longer than timeout seconds is
+    killed together with every process it started and raises subprocess.TimeoutExpired.
+    """
+    return _launch([(argv, env, stdout)], cwd, 1, counters, timeout)[1][0]
+#fed
+
+def _combine_metrics(
+    metrics: list[dict],
+)->dict:
+    """
+    Combines the measurements of commands run one after another: peak memory is the largest peak,
+    everything else adds up.
+    """
+    combined: dict = {}
+    counted: list[str] = [metric for metric in PERF_EVENTS.values() if metrics and all(metric in m for m in metrics)]
+    for metric in METRICS + counted:
+        values = [m[metric] for m in metrics]
+        combined[metric] = max(values) if metric == 'max_rss' else sum(values)
+    #rof
+    return combined
+#fed
+
+def _measured_concurrent_runs(
+    argvs: list[list[str]],
+    cwd: Path,
+    envs: list[dict] = None,
+    jobs: int = None,
+    counters: bool = False,
+    timeout: float = None,
+)->dict:
+    """
+    Runs the commands in argvs at the same time from one launcher, at most jobs of them at once, the i-th
+    with envs[i] added to the environment, and combines their
+    measurements, with the wall time from the first start to the last exit as timed by the launcher, so
+    that starting it is not part of it. The commands are killed after timeout seconds in all.
+    """
+    envs = envs or [None] * len(argvs)
+    wall_time, metrics = _launch([(argv, env, None) for argv, env in zip(argvs, envs)], cwd, jobs or len(argvs), counters, timeout)
+    combined = _combine_metrics(metrics)
+    combined['wall_time'] = wall_time
+    return combined
+#fed
+
+@functools.lru_cache(maxsize=None)
+def _toolchain_version(
+    version_cmd: str,
+)->str:
+    """
+    Returns the output of version_cmd, commands joined by &&, or an empty string if a tool is not available.
+    """
+    try:
+        return "\n".join(
+            subprocess.run(shlex.split(command), capture_output=True, text=True, check=True).stdout.strip()
+            for command in version_cmd.split("&&")
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        return ""
+    #yrt
+#fed
+
+def _rust_sources()->list[str]:
+    """
+    Lists the files of the Rust crate, relative to RUST_DIR, that go into a build.
+    """
+    sources: list[str] = ["Cargo.toml"]
+    sources.extend(str(path.relative_to(RUST_DIR)) for path in sorted(RUST_SRC_DIR.rglob("*")) if path.is_file())
+    return sources
+#fed
+
+def _cpp_sources()->list[str]:
+    """
+    Lists the files, relative to CPP_SRC_DIR, that go into a build of the C++ tests.
+    """
+    sources: list[str] = ["Task.h", "Task.cpp", "TaskManager.h", "TaskManager.cpp", "LatencyListener.cpp", "tests.cpp"]
+    sources.extend(sorted(path.name for path in CPP_SRC_DIR.glob("tests_*.cpp")))
+    return sources
+#fed
+
+def _build_cache_key(
+    language: str,
+    tool: str,
+    flags: str,
+    version_cmd: str,
+    source_dir: Path,
+    sources: list[str],
+)->str:
+    """
+    Hashes the sources, build flags, tool and toolchain version of a build.
+    """
+    hasher = hashlib.sha256()
+    for part in [language, tool, flags, _toolchain_version(version_cmd)]:
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+    #rof
+    for source in sources:
+        hasher.update(source.encode())
+        hasher.update(b"\0")
+        hasher.update((source_dir / source).read_bytes())
+        hasher.update(b"\0")
+    #rof
+    return hasher.hexdigest()[:16]
+#fed
+
+def _prepare_build_dir(
+    language: str,
+    tool: str,
+    flags: str,
+    version_cmd: str,
+    source_dir: Path,
+    sources: list[str],
+    use_build_cache: bool,
+    run: int = 1,
+    scenario: str = None,
+)->tuple[Path, bool]:
+    """
+    Returns the cache directory of a build and whether it already holds the finished build.
+    On a miss the directory is recreated with a fresh copy of the sources. Without use_build_cache
+    every run gets a fresh directory of its own. Builds whose sources a scenario edits in place are
+    cached apart from the unedited ones under the scenario's name, so that no other run reuses them.
+    """
+    key = _build_cache_key(language, tool, f"{flags} scenario={scenario}" if scenario else flags, version_cmd, source_dir, sources)
+    name = f"{tool}-{scenario}" if scenario else tool
+    build_dir = CACHE_DIR / language / f"{name}-{key}"
+    if not use_build_cache:
+        build_dir = CACHE_DIR / language / f"{name}-{key}-run{run}"
+    #fi
+    if use_build_cache and (build_dir / BUILD_STAMP).is_file():
+        logger.info(f"Build cache hit for {language} {tool} in {build_dir}.")
+        return build_dir, True
+    #fi
+    logger.info(f"Build cache miss for {language} {tool}, building in {build_dir}...")
+    if build_dir.exists():
+        shutil.rmtree(build_dir)
+    #fi
+    for source in sources:
+        (build_dir / source).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source_dir / source, build_dir / source)
+    #rof
+    return build_dir, False
+#fed
+
+def _mark_built(
+    build_dir: Path,
 )->None:
     """
-    Generates tests for Cpp with num_tests number of tests.
+    Marks the build in build_dir as finished so later runs can reuse it.
     """
-    logger.info(f"Generating tests for Cpp for workload {num_tests}...")
-    with open(CPP_SRC_DIR / "tests.cpp", 'w') as f:
-        f.write("#include <gtest/gtest.h>\n")
-        f.write("#include \"Task.h\"\n\n")
+    (build_dir / BUILD_STAMP).touch()
+#fed
 
-        for i in range(1, num_tests + 1):
-            f.write(f"TEST(TaskTest, Test_{i}_Tasks) {{\n")
-            f.write('\tTask task("Test Task");\n')
-            if i % 3 == 0:
-                f.write('\tEXPECT_EQ(task.getDescription(), "Test Task");\n')
-            elif i % 2 == 0:
-                f.write(f"\tEXPECT_FALSE(task.isCompleted());\n")
-            else:
-                f.write(f"\ttask.setCompleted(true);\n")
-                f.write(f"\tEXPECT_FALSE(task.isCompleted());\n")
-            #fi
+def _shard_ranges(
+    num_tests: int,
+    shards: int,
+)->list[range]:
+    """
+    Splits tests 1 to num_tests into shards contiguous ranges whose sizes differ by at most one.
+    """
+    bounds = [1 + num_tests * k // shards for k in range(shards + 1)]
+    return [range(bounds[k], bounds[k + 1]) for k in range(shards)]
+#fed
+
+def _workload_profile(
+    value: str,
+)->str:
+    """
+    Parses a workload profile from the command line: the name of one of WORKLOAD_PROFILES, or its
+    parameters, such as loop=10000,branch=0.5,io=2, with the parameters left out taken from manager.
+    """
+    if value in WORKLOAD_PROFILES:
+        return value
+    #fi
+    try:
+        parameters = _profile_parameters(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid workload profile {value}: {e}")
+    #yrt
+    return ",".join(f"{name}={parameters[name]}" for name in WORKLOAD_PROFILES['manager'])
+#fed
+
+def _profile_parameters(
+    profile: str,
+)->dict:
+    """
+    Returns the loop count, branch density and I/O round trips of a workload profile.
+    """
+    if profile in WORKLOAD_PROFILES:
+        return dict(WORKLOAD_PROFILES[profile])
+    #fi
+    parameters: dict = dict(WORKLOAD_PROFILES['manager'])
+    for assignment in profile.split(","):
+        name, _, value = assignment.partition("=")
+        if name not in parameters:
+            raise ValueError(f"unknown parameter {name}, expected one of {', '.join(parameters)}")
+        #fi
+        parameters[name] = type(parameters[name])(value)
+    #rof
+    if parameters['loop'] < 1 or not 0 <= parameters['branch'] <= 1 or parameters['io'] < 0:
+        raise ValueError("loop must be positive, branch between 0 and 1 and io not negative")
+    #fi
+    return parameters
+#fed
+
+def _completion_period(
+    branch: float,
+)->int:
+    """
+    Returns the period with which generated tests complete tasks so that about a fraction branch of them
+    is completed, or 0 to complete none.
+    """
+    return max(1, round(1 / branch)) if branch > 0 else 0
+#fed
+
+def _completed_tasks(
+    i: int,
+    loop: int,
+    period: int,
+)->int:
+    """
+    Returns how many of tasks 0 to loop - 1 the i-th generated test completes, those with (j + i) % period == 0.
+    """
+    if not period:
+        return 0
+    #fi
+    first = (-i) % period
+    return 0 if first >= loop else (loop - 1 - first) // period + 1
+#fed
+
+def _rust_test(
+    i: int,
+    indent: str,
+    profile: str = 'constructor',
+)->str:
+    """
+    Returns the source of the i-th Rust test of profile, indented by indent.
+    """
+    parameters = _profile_parameters(profile)
+    lines: list[str] = ["#[test]", f"fn test{i}_tasks() {{"]
+    if parameters['loop']:
+        period = _completion_period(parameters['branch'])
+        lines.append("\tlet mut manager = TaskManager::new();")
+        lines.append(f"\tfor j in 0..{parameters['loop']}usize {{")
+        lines.append('\t\tmanager.add_task(format!("Task {}", j));')
+        if period:
+            lines.append(f"\t\tif (j + {i}) % {period} == 0 {{")
+            lines.append("\t\t\tmanager.complete_task(j);")
+            lines.append("\t\t}")
+        #fi
+        lines.append("\t}")
+        lines.append('\tlet completed = manager.list_tasks().iter().filter(|line| line.starts_with("[x]")).count();')
+        lines.append(f"\tassert_eq!(completed, {_completed_tasks(i, parameters['loop'], period)});")
+        if parameters['io']:
+            lines.append(f'\tlet path = std::env::temp_dir().join(format!("todo_app_test{i}_{{}}.txt", std::process::id()));')
+            lines.append("\tlet path = path.to_str().unwrap();")
+            lines.append(f"\tfor _ in 0..{parameters['io']} {{")
+            lines.append("\t\tmanager.save_tasks(path).unwrap();")
+            lines.append("\t\tmanager.load_tasks(path).unwrap();")
+            lines.append("\t}")
+            lines.append("\tstd::fs::remove_file(path).unwrap();")
+        #fi
+        lines.append(f"\tassert_eq!(manager.tasks.len(), {parameters['loop']});")
+    elif i % 3 == 0:
+        lines.append('\tlet task = Task::new("Test Task".to_string());')
+        lines.append('\tassert_eq!(task.description, "Test Task");')
+    elif i % 2 == 0:
+        lines.append('\tlet task = Task::new("Test Task".to_string());')
+        lines.append("\tassert!(!task.completed);")
+    else:
+        lines.append('\tlet mut task = Task::new("Test Task".to_string());')
+        lines.append("\ttask.completed = true;")
+        lines.append("\tassert!(task.completed);")
+    #fi
+    lines.append("}")
+    return "".join(f"{indent}{line}\n" for line in lines)
+#fed
+
+def gen_rust_tests(
+    num_tests: int,
+    shards: int = 1,
+    profile: str = 'constructor',
+)->None:
+    """
+    Generates tests for Rust in module tests.rs with num_tests number of tests of workload profile.
+    With more than one shard, tests.rs only declares the submodules in src/tests that hold the tests.
+    """
+    logger.info(f"Generating tests for Rust for workload {num_tests} in {shards} shards with profile {profile}...")
+    imports = "{Task}" if profile == 'constructor' else "{TaskManager}"
+    shard_dir = RUST_SRC_DIR / "tests"
+    if shard_dir.exists():
+        shutil.rmtree(shard_dir)
+    #fi
+    if shards == 1:
+        with open(RUST_SRC_DIR / "tests.rs", 'w', buffering=GEN_BUFFER_SIZE) as f:
+            f.write("#[cfg(test)]\n")
+            f.write("mod tests {\n\n")
+            f.write(f"\tuse crate::tasks::{imports};\n")
+            for i in range(1, num_tests + 1):
+                f.write(_rust_test(i, "\t", profile))
+            #rof
             f.write("}\n")
+        #htiw
+    else:
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        with open(RUST_SRC_DIR / "tests.rs", 'w') as f:
+            for k in range(shards):
+                f.write(f"mod shard_{k};\n")
+            #rof
+        #htiw
+        for k, tests in enumerate(_shard_ranges(num_tests, shards)):
+            with open(shard_dir / f"shard_{k}.rs", 'w', buffering=GEN_BUFFER_SIZE) as f:
+                f.write(f"use crate::tasks::{imports};\n")
+                for i in tests:
+                    f.write(_rust_test(i, "", profile))
+                #rof
+            #htiw
         #rof
+    #fi
+    logger.info(f"Test generation for Rust finished.")
+#fed
+
+def _cpp_test(
+    i: int,
+    profile: str = 'constructor',
+)->str:
+    """
+    Returns the source of the i-th C++ test of profile.
+    """
+    parameters = _profile_parameters(profile)
+    if parameters['loop']:
+        period = _completion_period(parameters['branch'])
+        lines: list[str] = [f"TEST(TaskManagerTest, Test_{i}_Tasks) {{", "\tTaskManager manager;"]
+        lines.append(f"\tfor (int j = 0; j < {parameters['loop']}; ++j) {{")
+        lines.append('\t\tmanager.addTask("Task " + std::to_string(j));')
+        if period:
+            lines.append(f"\t\tif ((j + {i}) % {period} == 0) {{")
+            lines.append("\t\t\tmanager.completeTask(j + 1);")
+            lines.append("\t\t}")
+        #fi
+        lines.append("\t}")
+        lines.append("\tstd::ostringstream listing;")
+        lines.append("\tmanager.listTasks(listing);")
+        lines.append("\tconst std::string text = listing.str();")
+        lines.append("\tint completed = 0;")
+        lines.append('\tfor (size_t at = text.find("[x]"); at != std::string::npos; at = text.find("[x]", at + 1)) {')
+        lines.append("\t\t++completed;")
+        lines.append("\t}")
+        lines.append(f"\tEXPECT_EQ(completed, {_completed_tasks(i, parameters['loop'], period)});")
+        if parameters['io']:
+            lines.append(f'\tconst std::string path = ::testing::TempDir() + "todo_app_test{i}_" + std::to_string(getpid()) + ".txt";')
+            lines.append(f"\tfor (int k = 0; k < {parameters['io']}; ++k) {{")
+            lines.append("\t\tmanager.saveTasks(path);")
+            lines.append("\t\tmanager.loadTasks(path);")
+            lines.append("\t}")
+            lines.append("\tstd::remove(path.c_str());")
+        #fi
+        lines.append(f"\tEXPECT_EQ(manager.getTasks().size(), {parameters['loop']}u);")
+        lines.append("}")
+        return "".join(f"{line}\n" for line in lines)
+    #fi
+    lines: list[str] = [f"TEST(TaskTest, Test_{i}_Tasks) {{", '\tTask task("Test Task");']
+    if i % 3 == 0:
+        lines.append('\tEXPECT_EQ(task.getDescription(), "Test Task");')
+    elif i % 2 == 0:
+        lines.append("\tEXPECT_FALSE(task.isCompleted());")
+    else:
+        lines.append("\ttask.setCompleted(true);")
+        lines.append("\tEXPECT_TRUE(task.isCompleted());")
+    #fi
+    lines.append("}")
+    return "".join(f"{line}\n" for line in lines)
+#fed
+
+def gen_cpp_tests(
+    num_tests: int,
+    shards: int = 1,
+    profile: str = 'constructor',
+)->None:
+    """
+    Generates tests for Cpp with num_tests number of tests of workload profile.
+    With more than one shard, the tests go to translation units tests_<k>.cpp and tests.cpp only holds main.
+    """
+    logger.info(f"Generating tests for Cpp for workload {num_tests} in {shards} shards with profile {profile}...")
+    includes = "#include <gtest/gtest.h>\n#include \"Task.h\"\n\n"
+    if profile != 'constructor':
+        includes = ("#include <gtest/gtest.h>\n#include <unistd.h>\n#include <cstdio>\n#include <sstream>\n#include <string>\n"
+                    "#include \"TaskManager.h\"\n\n")
+    #fi
+    for shard in CPP_SRC_DIR.glob("tests_*.cpp"):
+        shard.unlink()
+    #rof
+    with open(CPP_SRC_DIR / "tests.cpp", 'w', buffering=GEN_BUFFER_SIZE) as f:
+        f.write(includes)
+        if shards == 1:
+            for i in range(1, num_tests + 1):
+                f.write(_cpp_test(i, profile))
+            #rof
+        #fi
 
         f.write("int main(int argc, char **argv) {\n")
         f.write("\t::testing::InitGoogleTest(&argc, argv);\n")
         f.write("\treturn RUN_ALL_TESTS();\n}")
 
     #htiw
+    if shards > 1:
+        for k, tests in enumerate(_shard_ranges(num_tests, shards)):
+            with open(CPP_SRC_DIR / f"tests_{k}.cpp", 'w', buffering=GEN_BUFFER_SIZE) as f:
+                f.write(includes)
+                for i in tests:
+                    f.write(_cpp_test(i, profile))
+                #rof
+            #htiw
+        #rof
+    #fi
     logger.info(f"Test generation for Cpp finished.")
 #fed
 
@@ -198,20 +924,21 @@ def _install_gtest()->None:
     try:
         su.bash.run(
             "git clone https://github.com/google/googletest .gtest",
-            check_returncode=0
+            check_returncode=0,
+            cwd=_DIR
         )
         su.io.mkdir(f'{GTEST_DIR}/build')
-        os.chdir(f'{GTEST_DIR}/build')
         su.bash.run(
             "cmake ..",
-            check_returncode=0
+            check_returncode=0,
+            cwd=f'{GTEST_DIR}/build'
         )
         su.bash.run(
             "make",
-            check_returncode=0
+            check_returncode=0,
+            cwd=f'{GTEST_DIR}/build'
         )
-        os.chdir(_DIR)
-    except BashError as e:
+    except su.bash.BashError as e:
         logger.error("GoogleTest installation failed due to"
                      f"{e}")
         return
@@ -219,296 +946,3266 @@ def _install_gtest()->None:
     logger.info("GoogleTest installation successful!")
 #fed
 
-def _run_test_without_coverage_cpp(
-    workload: int
-)->None:
-    logger.info(f"Running test without coverage for cpp workload {workload}...")
-    if not Path(f'{CPP_SRC_DIR}/tests.cpp').is_file():
-        logger.error(f"Generate test for workload {workload} for Cpp first!")
-        return
+def _log_prefix(
+    language: str,
+    tool: str,
+)->str:
+    """
+    Returns the prefix identifying runs of tool for language in the log file.
+    """
+    if tool == 'none':
+        return f'{language}_Without_Coverage'
+    elif _adapter(language, tool).baseline is None:
+        return f'{language}_Without_Coverage_{tool}'
+    elif language == 'Cpp' and tool == 'gcov':
+        return 'Cpp_With_Coverage'
+    else:
+        return f'{language}_With_Coverage_{tool}'
     #fi
+#fed
+
+def _connect_results(
+    results_db: Path = None,
+)->sqlite3.Connection:
+    """
+    Opens the results store results_db, RESULTS_DB by default, creating it if needed and adding the columns
+    of dimensions and of the measurement order its tables do not have yet, filled with their default values.
+    """
+    results_db = results_db or RESULTS_DB
+    results_db.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(results_db)
+    conn.executescript("""
+        CREATE TABLE IF NOT EXISTS measurements (
+            id INTEGER PRIMARY KEY,
+            run_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            git_revision TEXT NOT NULL,
+            host TEXT NOT NULL,
+            language TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            tool_version TEXT NOT NULL,
+            workload INTEGER NOT NULL,
+            repetition INTEGER NOT NULL,
+            phase TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            value REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS measurements_cell
+            ON measurements (workload, language, tool, phase, metric);
+        CREATE INDEX IF NOT EXISTS measurements_run
+            ON measurements (run_id);
+        CREATE TABLE IF NOT EXISTS test_latencies (
+            id INTEGER PRIMARY KEY,
+            run_id TEXT NOT NULL,
+            language TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            workload INTEGER NOT NULL,
+            repetition INTEGER NOT NULL,
+            test TEXT NOT NULL,
+            duration REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS test_latencies_cell
+            ON test_latencies (workload, language, tool);
+        CREATE INDEX IF NOT EXISTS test_latencies_run
+            ON test_latencies (run_id);
+        CREATE TABLE IF NOT EXISTS manifest (
+            id INTEGER PRIMARY KEY,
+            run_id TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            language TEXT NOT NULL,
+            tool TEXT NOT NULL,
+            workload INTEGER NOT NULL,
+            repetition INTEGER NOT NULL,
+            status TEXT NOT NULL,
+            error TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS manifest_run
+            ON manifest (run_id);
+    """)
+    sql_types: dict = {int: 'INTEGER', float: 'REAL', str: 'TEXT'}
+    for table, added_columns in [('measurements', {**DIMENSIONS, **ORDER_COLUMNS}), ('test_latencies', DIMENSIONS), ('manifest', DIMENSIONS)]:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for column, default in added_columns.items():
+            if column not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {sql_types[type(default)]} NOT NULL DEFAULT {default!r}")
+            #fi
+        #rof
+    #rof
+    conn.commit()
+    return conn
+#fed
+
+@functools.lru_cache(maxsize=None)
+def _git_revision()->str:
+    """
+    Returns the git revision of the harness, or an empty string outside of a git checkout.
+    """
     try:
-        os.chdir(CPP_SRC_DIR)
-        su.bash.run(
-            "rm -f *.gcno *.gcda tests",
-            check_returncode=0
-        )
-        su.bash.run(
-            f"g++ -isystem {GTEST_INCLUDE_DIR} -pthread tests.cpp Task.cpp TaskManager.cpp {GTEST_LIB_DIR}/libgtest.a  {GTEST_LIB_DIR}/libgtest_main.a -o tests",
-            check_returncode=0
-        )
-        output = su.bash.run(
-            "time ./tests",
-        ).stderr
-        logger.info(f'Cpp_Without_Coverage_{workload}_exec_time: {_process_time_stdout(output)}s')
-        os.chdir(_DIR)
-    except BashError as e:
-        os.chdir(_DIR)
-        logger.error(f"Running tests for workload {workload} for Cpp failed!"
-                     f"{e}")
-        return
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError) as e:
+        return ""
     #yrt
-    logger.info(f"Finished running tests without coverage for workload {workload} for Cpp.")
 #fed
 
-def _run_test_with_coverage_cpp(
-    workload: int
+def _record_phase_metrics(
+    variant: dict,
+    phase_metrics: dict,
 )->None:
-    logger.info(f"Running test with coverage for cpp workload {workload}...")
-    if not Path(f'{CPP_SRC_DIR}/tests.cpp').is_file():
-        logger.error(f"Generate test for workload {workload} for Cpp first!")
-        return
+    """
+    Logs the measurements of each phase in phase_metrics for a run of variant and appends them to the results store.
+    The total is only recorded for runs that built from scratch, runs reusing a cached build have no build phase.
+    It leaves out the rebuild phase, which is a scenario of its own.
+    """
+    prefix = _log_prefix(variant['language'], variant['tool'])
+    workload = variant['workload']
+    phase_metrics = dict(phase_metrics)
+    if 'build' in phase_metrics:
+        phase_metrics['total'] = _combine_metrics([metrics for phase, metrics in phase_metrics.items() if phase != 'rebuild'])
     #fi
-    try:
-        os.chdir(CPP_SRC_DIR)
-        su.bash.run(
-            "rm -f *.gcno *.gcda tests",
-            check_returncode=0
-        )
-        su.bash.run(
-            f"g++ -isystem {GTEST_INCLUDE_DIR} -pthread --coverage tests.cpp Task.cpp TaskManager.cpp {GTEST_LIB_DIR}/libgtest.a  {GTEST_LIB_DIR}/libgtest_main.a -o tests",
-            check_returncode=0
+    for phase, metrics in phase_metrics.items():
+        if 'wall_time' in metrics:
+            logger.info(f'{prefix}_{workload}_{phase}_time: {metrics["wall_time"]}s')
+        #fi
+        logger.debug(f'{prefix}_{workload}_{phase}_metrics: {json.dumps(metrics)}')
+    #rof
+
+    timestamp = datetime.now().isoformat()
+    tool_version = _toolchain_version(_adapter(variant['language'], variant['tool']).version_cmd)
+    rows: list[tuple] = [
+        (variant['run_id'], timestamp, _git_revision(), socket.gethostname(), variant['language'], variant['tool'],
+         tool_version, workload, variant['run'], phase, metric, value,
+         *(variant[dimension] for dimension in DIMENSIONS),
+         variant.get('sequence', ORDER_COLUMNS['sequence']), ",".join(str(cpu) for cpu in variant.get('cpus') or []))
+        for phase, metrics in phase_metrics.items()
+        for metric, value in metrics.items()
+    ]
+    columns = MEASUREMENT_COLUMNS + list(DIMENSIONS) + list(ORDER_COLUMNS)
+    with contextlib.closing(_connect_results()) as conn, conn:
+        conn.executemany(
+            f"INSERT INTO measurements ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows
         )
-        output = su.bash.run(
-            "time (./tests && gcov -n *.gcno)",
-        ).stderr
-        logger.info(f'Cpp_With_Coverage_{workload}_exec_time: {_process_time_stdout(output)}s')
-        os.chdir(_DIR)
-    except BashError as e:
-        os.chdir(_DIR)
-        logger.error(f"Running tests for workload {workload} for Cpp failed!"
-                     f"{e}")
-        return
-    #yrt
-    logger.info(f"Finished running tests with coverage for workload {workload} for Cpp.")
+    #htiw
 #fed
 
-def _run_test_without_coverage_rust(
-    workload: int
+def _record_test_latencies(
+    variant: dict,
+    latencies: dict,
 )->None:
-    logger.info(f"Running test without coverage for rust workload {workload}...")
-    if not Path(f'{RUST_SRC_DIR}/tests.rs').is_file():
-        logger.error(f"Generate test for workload {workload} for Rust first!")
-        return
-    #fi
-    try:
-        os.chdir(RUST_DIR)
-        su.bash.run(
-            "cargo clean",
-            check_returncode=0
+    """
+    Appends the duration in seconds of every test in latencies, keyed by test name, for a run of variant
+    to the results store.
+    """
+    rows: list[tuple] = [
+        (variant['run_id'], variant['language'], variant['tool'], variant['workload'], variant['run'], test, duration,
+         *(variant[dimension] for dimension in DIMENSIONS))
+        for test, duration in latencies.items()
+    ]
+    columns = TEST_LATENCY_COLUMNS + list(DIMENSIONS)
+    with contextlib.closing(_connect_results()) as conn, conn:
+        conn.executemany(
+            f"INSERT INTO test_latencies ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            rows
         )
-        output = su.bash.run(
-            "time cargo test 2>/dev/null",
-        ).stderr
-        logger.info(f'Rust_Without_Coverage_{workload}_exec_time: {_process_time_stdout(output)}s')
-        os.chdir(_DIR)
-    except BashError as e:
-        os.chdir(_DIR)
-        logger.error(f"Running tests for workload {workload} for Rust failed!"
-                     f"{e}")
-        return
-    #yrt
-    logger.info(f"Finished running tests without coverage for workload {workload} for Rust.")
+    #htiw
 #fed
 
-def _run_test_with_coverage_rust(
-    workload: int,
-    rust_coverage_tool: str,    
+def _run_key(
+    variant: dict,
+)->tuple:
+    """
+    Returns the run of a variant, its language, workload, dimension values, tool and repetition, as recorded in the manifest.
+    """
+    return (*_cell_key(variant), variant['tool'], variant['run'])
+#fed
+
+def _record_run_status(
+    variant: dict,
+    status: str,
+    error: str = "",
 )->None:
-    logger.info(f"Running test with coverage for rust coverage tool {rust_coverage_tool} with workload {workload}...")
-    if not Path(f'{RUST_SRC_DIR}/tests.rs').is_file():
-        logger.error(f"Generate test for workload {workload} for Rust first!")
-        return
-    #fi
-    try:
-        os.chdir(RUST_DIR)
-        su.bash.run(
-            "cargo clean",
-            check_returncode=0
+    """
+    Appends a run of variant to the manifest of its session as done, once its measurements are recorded, or as
+    failed with its error.
+    """
+    columns = MANIFEST_COLUMNS + list(DIMENSIONS)
+    with contextlib.closing(_connect_results()) as conn, conn:
+        conn.execute(
+            f"INSERT INTO manifest ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            (variant['run_id'], datetime.now().isoformat(), variant['language'], variant['tool'], variant['workload'], variant['run'],
+             status, error, *(variant[dimension] for dimension in DIMENSIONS))
         )
-        output = su.bash.run(
-            f"time cargo {rust_coverage_tool} --tests 2>/dev/null",
-        ).stderr
-        logger.info(f'Rust_With_Coverage_{rust_coverage_tool}_{workload}_exec_time: {_process_time_stdout(output)}s')
-        os.chdir(_DIR)
-    except BashError as e:
-        os.chdir(_DIR)
-        logger.error(f"Running tests for workload {workload} for Rust failed!"
-                     f"{e}")
-        return
-    #yrt
-    logger.info(f"Finished running tests with coverage for rust coverage tool {rust_coverage_tool} with workload {workload}.")
+    #htiw
 #fed
 
-def collect_coverage_overhead_rust(
-    workloads: list[int],
-    average: int,
-    should_process_log_file: bool,
+def _discard_run(
+    variant: dict,
 )->None:
-    logger.info(f"Collecting coverage for {workloads} for rust over {average} runs...")
-    for workload in workloads:
-        for i in range(1, average + 1):
-            logger.info(f"Collecting coverage for rust workload {workload} for run {i}")
-            gen_rust_tests(workload)
-            _run_test_without_coverage_rust(workload=workload)
-            for tool in RUST_COVERAGE_TOOLS:
-                _run_test_with_coverage_rust(workload=workload, rust_coverage_tool=tool)
-            #rof
-            logger.info(f"Finished collecting coverage for rust workload {workload} for run {i}!")
+    """
+    Deletes whatever a run of variant recorded in its session without being marked done, e.g. when the
+    session died while recording it.
+    """
+    condition = " AND ".join(f"{column} = ?" for column in ['run_id', 'language', 'tool', 'workload', 'repetition', *DIMENSIONS])
+    params = (variant['run_id'], variant['language'], variant['tool'], variant['workload'], variant['run'],
+              *(variant[dimension] for dimension in DIMENSIONS))
+    with contextlib.closing(_connect_results()) as conn, conn:
+        for table in ['measurements', 'test_latencies']:
+            conn.execute(f"DELETE FROM {table} WHERE {condition}", params)
         #rof
-    #rof
-    logger.info(f"Finished collecting coverage for {workloads} for rust over {average} runs")
-
-    if should_process_log_file:
-        logger.info("Processing log file...")
-        process_log_file(log_file=log_file, workloads=workloads)
-        logger.info("Finishing...")
-    #fi
+    #htiw
 #fed
 
-def collect_coverage_overhead_cpp(
-    workloads: list[int],
+def _finished_runs(
+    run_id: str,
+)->set[tuple]:
+    """
+    Returns the runs, as keyed by _run_key, the session run_id finished.
+    """
+    with contextlib.closing(_connect_results()) as conn:
+        return {(language, workload, *configuration, tool, repetition) for language, workload, tool, repetition, *configuration in conn.execute(
+            f"SELECT language, workload, tool, repetition, {', '.join(DIMENSIONS)} FROM manifest WHERE run_id = ? AND status = 'done'",
+            (run_id,)
+        )}
+    #htiw
+#fed
+
+def _last_sequence(
+    run_id: str,
+)->int:
+    """
+    Returns the position in the measurement order of the last run the session run_id measured, 0 if none.
+    """
+    with contextlib.closing(_connect_results()) as conn:
+        return conn.execute("SELECT COALESCE(MAX(sequence), 0) FROM measurements WHERE run_id = ?", (run_id,)).fetchone()[0]
+    #htiw
+#fed
+
+def merge_results(
+    results_dbs: list[Path],
+)->None:
+    """
+    Copies the measurements of sessions in other results stores, e.g. from other machines, into this one.
+    Sessions already in this store are skipped.
+    """
+    tables: dict = {
+        'measurements': ", ".join(MEASUREMENT_COLUMNS + list(DIMENSIONS) + list(ORDER_COLUMNS)),
+        'test_latencies': ", ".join(TEST_LATENCY_COLUMNS + list(DIMENSIONS)),
+        'manifest': ", ".join(MANIFEST_COLUMNS + list(DIMENSIONS)),
+    }
+    with contextlib.closing(_connect_results()) as conn, conn:
+        for results_db in results_dbs:
+            logger.info(f"Merging results from {results_db}...")
+            # Brings stores recorded before a dimension or table existed up to date.
+            _connect_results(results_db).close()
+            conn.execute("ATTACH DATABASE ? AS other", (str(results_db),))
+            for table, columns in tables.items():
+                conn.execute(
+                    f"INSERT INTO {table} ({columns}) SELECT {columns} FROM other.{table}"
+                    f" WHERE run_id NOT IN (SELECT DISTINCT run_id FROM main.{table})"
+                )
+            #rof
+            conn.commit()
+            conn.execute("DETACH DATABASE other")
+        #rof
+    #htiw
+#fed
+
+def _llvm_cov_env(
+    build_dir: Path,
+    timeout: float = None,
+)->dict:
+    """
+    Returns the environment that instruments plain cargo commands in build_dir the way cargo-llvm-cov would,
+    so that building, running and reporting can be timed on their own. cargo is killed after timeout seconds.
+    """
+    output = subprocess.run(
+        ["cargo", "llvm-cov", "show-env"],
+        cwd=build_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=timeout
+    ).stdout
+    env: dict = {}
+    for line in output.splitlines():
+        key, _, value = line.partition("=")
+        if key:
+            env[key] = shlex.split(value)[0] if value else ""
+        #fi
+    #rof
+    return env
+#fed
+
+def _rust_test_executables(
+    build_dir: Path,
+    env: dict,
+    timeout: float = None,
+)->list[str]:
+    """
+    Returns the test executables cargo built in build_dir, so they can be launched without cargo, which is
+    killed after timeout seconds.
+    """
+    output = subprocess.run(
+        ["cargo", "test", "--no-run", "--message-format=json"],
+        cwd=build_dir,
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=timeout
+    ).stdout
+    executables: list[str] = []
+    for line in output.splitlines():
+        message = json.loads(line)
+        if message.get('reason') == 'compiler-artifact' and message['profile']['test'] and message.get('executable'):
+            executables.append(message['executable'])
+        #fi
+    #rof
+    return executables
+#fed
+
+def _measured_cpp_build(
+    build_dir: Path,
+    flags: str,
+    compiler: str = "g++",
+    timeout: float = None,
+)->dict:
+    """
+    Compiles the translation units in build_dir concurrently with compiler and links them into the tests binary.
+    Like make, only units whose object is missing or older than the unit or a header are compiled, so
+    building again after an edit is incremental.
+    Returns the combined measurements of all compiler invocations, with the wall time of the compile batch,
+    from its first start to its last exit, plus that of the link, as timed by their launchers, so that neither
+    the harness checking the objects nor starting the launchers is part of it.
+    Compiling and linking are each killed after timeout seconds.
+    """
+    units: list[str] = sorted(path.name for path in build_dir.glob("*.cpp"))
+    headers_changed = max((header.stat().st_mtime_ns for header in build_dir.glob("*.h")), default=0)
+    stale: list[str] = [
+        unit for unit in units
+        if not (build_dir / f"{Path(unit).stem}.o").is_file()
+        or (build_dir / f"{Path(unit).stem}.o").stat().st_mtime_ns < max((build_dir / unit).stat().st_mtime_ns, headers_changed)
+    ]
+    metrics: list[dict] = []
+    if stale:
+        metrics.append(_measured_concurrent_runs(
+            [[compiler, *shlex.split(flags), "-c", unit, "-o", f"{Path(unit).stem}.o"] for unit in stale],
+            cwd=build_dir,
+            jobs=os.cpu_count(),
+            timeout=timeout
+        ))
+    #fi
+    metrics.append(_measured_run(
+        [compiler, *shlex.split(flags), *(f"{Path(unit).stem}.o" for unit in units),
+         f"{GTEST_LIB_DIR}/libgtest.a", f"{GTEST_LIB_DIR}/libgtest_main.a", "-o", "tests"],
+        cwd=build_dir,
+        timeout=timeout
+    ))
+    return _combine_metrics(metrics)
+#fed
+
+@functools.lru_cache(maxsize=None)
+def _rust_llvm_tool(
+    name: str,
+)->str:
+    """
+    Returns the LLVM tool name from the llvm-tools component of the Rust toolchain, whose profile format
+    matches rustc's, or name itself to take it from the PATH if the component is not installed.
+    """
+    try:
+        sysroot = subprocess.run(["rustc", "--print", "sysroot"], capture_output=True, text=True, check=True).stdout.strip()
+        version = subprocess.run(["rustc", "-vV"], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as e:
+        return name
+    #yrt
+    host = next((line.split(":", 1)[1].strip() for line in version.splitlines() if line.startswith("host:")), "")
+    path = Path(sysroot) / "lib/rustlib" / host / "bin" / name
+    return str(path) if path.is_file() else name
+#fed
+
+def _fresh_dir(
+    path: Path,
+)->Path:
+    """
+    Empties the directory path, creating it if needed, and returns it.
+    """
+    if path.exists():
+        shutil.rmtree(path)
+    #fi
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+#fed
+
+def _artifact_metrics(
+    artifacts: list[Path],
+)->dict:
+    """
+    Returns the number and total size in bytes of artifacts.
+    """
+    return {
+        'artifact_count': len(artifacts),
+        'artifact_bytes': sum(artifact.stat().st_size for artifact in artifacts),
+    }
+#fed
+
+def _measured_merge_and_report(
+    merge_argv: list[str],
+    report_argv: list[str],
+    cwd: Path,
+    timeout: float = None,
+)->dict:
+    """
+    Runs merge_argv, which merges raw profiles, and then report_argv, each killed after timeout seconds,
+    and combines their measurements, keeping the wall time of the merge as merge_time.
+    """
+    merge_metrics = _measured_run(merge_argv, cwd=cwd, timeout=timeout)
+    metrics = _combine_metrics([merge_metrics, _measured_run(report_argv, cwd=cwd, timeout=timeout)])
+    metrics['merge_time'] = merge_metrics['wall_time']
+    return metrics
+#fed
+
+def _test_threads_args(
+    threads: int,
+)->list[str]:
+    """
+    Returns the libtest arguments that run the tests on threads threads, none for its default with 0.
+    """
+    return [f"--test-threads={threads}"] if threads else []
+#fed
+
+def _test_filter_args(
+    tests: list[str],
+)->list[str]:
+    """
+    Returns the libtest arguments that run only the tests of the names in tests, none to run all of them.
+    """
+    return [*tests, "--exact"] if tests else []
+#fed
+
+def _llvm_covered_lines(
+    merge_argv: list[str],
+    export_argv: list[str],
+    build_dir: Path,
+    sources: list[str],
+    timeout: float = None,
+)->dict:
+    """
+    Runs merge_argv, which merges raw profiles, and export_argv, which exports them as lcov, each killed after
+    timeout seconds, and returns the set of lines with a count of every source in sources, keyed by source.
+    """
+    subprocess.run(merge_argv, cwd=build_dir, capture_output=True, check=True, timeout=timeout)
+    lcov = subprocess.run(export_argv, cwd=build_dir, capture_output=True, text=True, check=True, timeout=timeout).stdout
+    lines: dict = {source: set() for source in sources}
+    source = None
+    for record in lcov.splitlines():
+        if record.startswith("SF:"):
+            path = Path(record[len("SF:"):])
+            source = next((source for source in sources if path == build_dir / source or path.as_posix().endswith(f"/{source}")), None)
+        elif record.startswith("DA:") and source:
+            number, count = record[len("DA:"):].split(",")[:2]
+            if int(count) > 0:
+                lines[source].add(int(number))
+            #fi
+        #fi
+    #rof
+    return lines
+#fed
+
+class CoverageAdapter(abc.ABC):
+    """
+    Builds, runs and reports the tests of one language with one coverage tool, or without coverage for
+    a baseline. Every phase runs in the build directory of a variant and returns its measurements.
+    Adapters implement the abstract methods, so an incomplete one fails when COVERAGE_ADAPTERS instantiates it.
+    """
+    # Name of the tool on the command line and in the results store.
+    name: str = 'none'
+    language: str = None
+    # Tool without coverage, built with the same compiler, that the overhead of this tool is relative to.
+    # Baselines have none.
+    baseline: str = None
+    # Flags that, with the sources and the toolchain version, identify a build in the build cache.
+    flags: str = ""
+    version_cmd: str = ""
+    # Command installing the tool, or None if it comes with the toolchain.
+    install_cmd: str = None
+    # Whether the coverage data the tests write can be redirected to TMPFS_DIR.
+    relocatable_artifacts: bool = False
+    # Dimension values of the builds and runs, set by configured.
+    configuration: dict = DIMENSIONS
+    # Whether the test phase counts hardware events, set by configured.
+    counters: bool = False
+    # Seconds after which a build, test or report run is killed, set by configured.
+    timeout: float = None
+    # Whether the lines a single test covers can be read back after running it alone, for a coverage index.
+    per_test_coverage: bool = False
+    # Sources, relative to the build directory, whose lines a coverage index maps to the tests covering them.
+    impact_sources: list[str] = []
+
+    def configured(self, configuration: dict)->'CoverageAdapter':
+        """
+        Returns a copy of the adapter that builds and runs in configuration, which has a value for every
+        dimension and may set a timeout.
+        """
+        adapter = copy.copy(self)
+        adapter.configuration = {dimension: configuration[dimension] for dimension in DIMENSIONS}
+        adapter.counters = configuration['counters'] == 'perf'
+        adapter.timeout = configuration.get('timeout')
+        return adapter
+    #fed
+
+    def build_flags(self)->str:
+        """
+        Returns the flags that, with the sources and the toolchain version, identify a build in this
+        configuration in the build cache.
+        """
+        return self.flags
+    #fed
+
+    def supports(self)->bool:
+        """
+        Checks whether the tool can run in its configuration. Baselines write no coverage data, so they run anywhere.
+        """
+        return not self.baseline or self.relocatable_artifacts or self.configuration['artifact_dir'] == DIMENSIONS['artifact_dir']
+    #fed
+
+    def artifact_root(self, build_dir: Path)->Path:
+        """
+        Returns the directory the tests write coverage data to: build_dir, or its own directory on tmpfs.
+        """
+        if self.configuration['artifact_dir'] == 'tmpfs':
+            root = TMPFS_DIR / build_dir.name
+            root.mkdir(parents=True, exist_ok=True)
+            return root
+        #fi
+        return build_dir
+    #fed
+
+    @abc.abstractmethod
+    def spec(self)->dict:
+        """
+        Returns the source directory and sources of a build.
+        """
+    #fed
+
+    def env(self, build_dir: Path)->dict:
+        """
+        Returns the environment added to every phase.
+        """
+        return {}
+    #fed
+
+    @abc.abstractmethod
+    def build(self, build_dir: Path)->dict:
+        """
+        Builds the tests in build_dir, incrementally if it was built before.
+        """
+    #fed
+
+    @abc.abstractmethod
+    def edit_target(self, build_dir: Path, target: str)->Path:
+        """
+        Returns the file in build_dir that a scripted edit of target, one of REBUILD_TARGETS, changes.
+        """
+    #fed
+
+    @abc.abstractmethod
+    def test(self, build_dir: Path, threads: int = 0, tests: list[str] = None)->dict:
+        """
+        Runs the tests on threads threads or processes, or as the test framework does by default with 0.
+        With tests, only the tests of these names run.
+        """
+    #fed
+
+    def covered_lines(self, build_dir: Path)->dict:
+        """
+        Returns the set of lines of every impact source that the last test run covered, keyed by source.
+        Baselines are not coverage tools, and the tools without per_test_coverage cannot read back the
+        coverage of a single test.
+        """
+        raise ValueError(f"{self.language} {self.name} is not a coverage tool" if not self.baseline
+                         else f"{self.language} {self.name} cannot read back the lines a single test covers")
+    #fed
+
+    def profiles(self, build_dir: Path)->list[Path]:
+        """
+        Returns the raw LLVM profiles the last test run wrote to PROFILE_DIR of the artifact root, none for
+        tools that write no raw profiles.
+        """
+        return sorted((self.artifact_root(build_dir) / PROFILE_DIR).glob("*.profraw"))
+    #fed
+
+    def report(self, build_dir: Path)->dict:
+        """
+        Produces the coverage report of the last test run, or returns None without a separate report phase.
+        """
+        return None
+    #fed
+
+    def binaries(self, build_dir: Path)->list[Path]:
+        """
+        Returns the test binaries the test phase runs, or none if they are not known.
+        """
+        return []
+    #fed
+
+    def test_latencies(self, build_dir: Path)->dict:
+        """
+        Returns the duration in seconds of every test of the last test run, keyed by test name, from the
+        results the test framework wrote, or nothing if it wrote none.
+        """
+        return {}
+    #fed
+
+    def suite_time(self, build_dir: Path)->float:
+        """
+        Returns the time in seconds the test framework took for the tests of the last test run, or None if
+        it did not report it.
+        """
+        return None
+    #fed
+
+    def notes(self, build_dir: Path)->list[Path]:
+        """
+        Returns the coverage artifacts the build wrote besides the binaries.
+        """
+        return []
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        """
+        Returns the coverage data and reports that the test and report phases left in build_dir.
+        """
+        return []
+    #fed
+
+    def clean(self, build_dir: Path)->None:
+        """
+        Removes the artifacts of earlier runs, which would otherwise be merged into the next run's coverage.
+        """
+        for artifact in self.artifacts(build_dir):
+            artifact.unlink()
+        #rof
+    #fed
+#ssalc
+
+class RustAdapter(CoverageAdapter):
+    """
+    Builds the tests with cargo and launches the test executables directly, without coverage.
+    """
+    language = 'Rust'
+    flags = "cargo test"
+    version_cmd = "rustc --version"
+    # Whether the tool counts coverage with LLVM instrumentation, whose counter updates can be made atomic.
+    llvm_counters = False
+    impact_sources = ["src/tasks.rs"]
+
+    def spec(self)->dict:
+        return {'source_dir': RUST_DIR, 'sources': _rust_sources()}
+    #fed
+
+    def edit_target(self, build_dir: Path, target: str)->Path:
+        if target == 'source':
+            return build_dir / "src/tasks.rs"
+        #fi
+        shards = sorted((build_dir / "src/tests").glob("shard_*.rs"), key=lambda shard: int(shard.stem.split("_")[1]))
+        return shards[0] if shards else build_dir / "src/tests.rs"
+    #fed
+
+    def build_flags(self)->str:
+        env = self.profile_env()
+        return " ".join([f"{name}='{value}'" for name, value in sorted(env.items())] + [self.flags])
+    #fed
+
+    def profile_env(self)->dict:
+        """
+        Returns the environment that sets the optimization level and counter updates of the configuration.
+        """
+        env: dict = {}
+        if self.configuration['opt_level'] != DIMENSIONS['opt_level']:
+            env['CARGO_PROFILE_DEV_OPT_LEVEL'] = self.configuration['opt_level']
+            env['CARGO_PROFILE_TEST_OPT_LEVEL'] = self.configuration['opt_level']
+        #fi
+        if self.llvm_counters and self.configuration['counter_update'] in ['atomic', 'prefer-atomic']:
+            env['RUSTFLAGS'] = "-C llvm-args=-instrprof-atomic-counter-update-all"
+        #fi
+        return env
+    #fed
+
+    def coverage_env(self, build_dir: Path)->dict:
+        """
+        Returns the environment that instruments the build for coverage.
+        """
+        return {}
+    #fed
+
+    def env(self, build_dir: Path)->dict:
+        env = self.coverage_env(build_dir)
+        for name, value in self.profile_env().items():
+            env[name] = f"{env[name]} {value}" if name == 'RUSTFLAGS' and env.get(name) else value
+        #rof
+        return env
+    #fed
+
+    def build(self, build_dir: Path)->dict:
+        return _measured_run(["cargo", "test", "--no-run"], cwd=build_dir, env=self.env(build_dir), timeout=self.timeout)
+    #fed
+
+    def test(self, build_dir: Path, threads: int = 0, tests: list[str] = None)->dict:
+        """
+        Runs the test executables one after another, each writing libtest's JSON events with the time of every
+        test to its own file in TEST_RESULTS_DIR.
+        """
+        env = self.env(build_dir)
+        executables = _rust_test_executables(build_dir, env, timeout=self.timeout)
+        results_dir = _fresh_dir(build_dir / TEST_RESULTS_DIR)
+        # Lets the stable test harness take the unstable JSON format; cargo would rebuild with it set.
+        env['RUSTC_BOOTSTRAP'] = "1"
+        return _combine_metrics([
+            _measured_run([executable, *_test_threads_args(threads), "-Z", "unstable-options", "--format", "json", "--report-time",
+                           *_test_filter_args(tests)],
+                          cwd=build_dir, env=env, stdout=results_dir / f"{k}.json", counters=self.counters,
+                          timeout=self.timeout)
+            for k, executable in enumerate(executables)
+        ])
+    #fed
+
+    def test_latencies(self, build_dir: Path)->dict:
+        latencies: dict = {}
+        for results in sorted((build_dir / TEST_RESULTS_DIR).glob("*.json")):
+            with open(results) as f:
+                for line in f:
+                    event = json.loads(line)
+                    if event.get('type') == 'test' and 'exec_time' in event:
+                        latencies[event['name']] = event['exec_time']
+                    #fi
+                #rof
+            #htiw
+        #rof
+        return latencies
+    #fed
+
+    def suite_time(self, build_dir: Path)->float:
+        """
+        Returns the sum of the suite times of the test executables, which run one after another.
+        """
+        times: list[float] = []
+        for results in sorted((build_dir / TEST_RESULTS_DIR).glob("*.json")):
+            with open(results) as f:
+                times.extend(event['exec_time'] for event in map(json.loads, f)
+                             if event.get('type') == 'suite' and 'exec_time' in event)
+            #htiw
+        #rof
+        return sum(times) if times else None
+    #fed
+
+    def binaries(self, build_dir: Path)->list[Path]:
+        return [Path(executable) for executable in _rust_test_executables(build_dir, self.env(build_dir), timeout=self.timeout)]
+    #fed
+#ssalc
+
+class LlvmCovAdapter(RustAdapter):
+    """
+    cargo-llvm-cov: source-based coverage set up and reported by cargo-llvm-cov.
+    """
+    name = 'llvm-cov'
+    baseline = 'none'
+    flags = "cargo llvm-cov"
+    version_cmd = "rustc --version && cargo llvm-cov --version"
+    install_cmd = "cargo install cargo-llvm-cov"
+    llvm_counters = True
+
+    def coverage_env(self, build_dir: Path)->dict:
+        return _llvm_cov_env(build_dir, timeout=self.timeout)
+    #fed
+
+    def report(self, build_dir: Path)->dict:
+        return _measured_run(["cargo", "llvm-cov", "report"], cwd=build_dir, env=self.env(build_dir), timeout=self.timeout)
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        return list(build_dir.glob("target/**/*.profraw"))
+    #fed
+#ssalc
+
+class TarpaulinAdapter(RustAdapter):
+    """
+    cargo-tarpaulin: runs the tests under its own tracer and reports coverage while running them.
+    """
+    name = 'tarpaulin'
+    baseline = 'none'
+    flags = "cargo tarpaulin"
+    version_cmd = "rustc --version && cargo tarpaulin --version"
+    install_cmd = "cargo install cargo-tarpaulin"
+
+    def build(self, build_dir: Path)->dict:
+        return _measured_run(["cargo", "tarpaulin", "--tests", "--no-run"], cwd=build_dir, env=self.env(build_dir), timeout=self.timeout)
+    #fed
+
+    def test(self, build_dir: Path, threads: int = 0, tests: list[str] = None)->dict:
+        return _measured_run(["cargo", "tarpaulin", "--tests", "--skip-clean", "--", *_test_threads_args(threads), *_test_filter_args(tests)],
+                             cwd=build_dir, env=self.env(build_dir), counters=self.counters, timeout=self.timeout)
+    #fed
+
+    def binaries(self, build_dir: Path)->list[Path]:
+        # Asking cargo for the test executables would rebuild them without tarpaulin's flags.
+        return []
+    #fed
+#ssalc
+
+class InstrumentCoverageAdapter(RustAdapter):
+    """
+    rustc's -C instrument-coverage without a wrapper, reported with llvm-profdata and llvm-cov.
+    """
+    name = 'instrument-coverage'
+    baseline = 'none'
+    flags = "RUSTFLAGS='-C instrument-coverage' cargo test"
+    version_cmd = "rustc --version"
+    install_cmd = "rustup component add llvm-tools-preview"
+    llvm_counters = True
+    relocatable_artifacts = True
+    per_test_coverage = True
+
+    def coverage_env(self, build_dir: Path)->dict:
+        return {
+            'RUSTFLAGS': "-C instrument-coverage",
+            'LLVM_PROFILE_FILE': str(self.artifact_root(build_dir) / PROFILE_DIR / "%p-%m.profraw"),
+        }
+    #fed
+
+    def report(self, build_dir: Path)->dict:
+        executables = _rust_test_executables(build_dir, self.env(build_dir), timeout=self.timeout)
+        return _measured_merge_and_report(
+            [_rust_llvm_tool("llvm-profdata"), "merge", "-sparse", *(str(profile) for profile in self.profiles(build_dir)),
+             "-o", "tests.profdata"],
+            [_rust_llvm_tool("llvm-cov"), "report", "--instr-profile=tests.profdata",
+             "--ignore-filename-regex=/.cargo/registry|/rustc/", *(f"--object={executable}" for executable in executables)],
+            cwd=build_dir,
+            timeout=self.timeout
+        )
+    #fed
+
+    def covered_lines(self, build_dir: Path)->dict:
+        executables = _rust_test_executables(build_dir, self.env(build_dir), timeout=self.timeout)
+        return _llvm_covered_lines(
+            [_rust_llvm_tool("llvm-profdata"), "merge", "-sparse", *(str(profile) for profile in self.profiles(build_dir)),
+             "-o", "tests.profdata"],
+            [_rust_llvm_tool("llvm-cov"), "export", "--format=lcov", "--instr-profile=tests.profdata",
+             *(f"--object={executable}" for executable in executables)],
+            build_dir,
+            self.impact_sources,
+            timeout=self.timeout
+        )
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        return self.profiles(build_dir) + [path for path in [build_dir / "tests.profdata"] if path.is_file()]
+    #fed
+#ssalc
+
+class GrcovAdapter(InstrumentCoverageAdapter):
+    """
+    rustc's -C instrument-coverage, reported as lcov with grcov.
+    """
+    name = 'grcov'
+    flags = "RUSTFLAGS='-C instrument-coverage' cargo test grcov"
+    version_cmd = "rustc --version && grcov --version"
+    install_cmd = "cargo install grcov"
+
+    def report(self, build_dir: Path)->dict:
+        llvm_path: list[str] = []
+        if Path(_rust_llvm_tool("llvm-profdata")).is_absolute():
+            llvm_path = ["--llvm-path", str(Path(_rust_llvm_tool("llvm-profdata")).parent)]
+        #fi
+        return _measured_run(
+            ["grcov", str(self.artifact_root(build_dir) / PROFILE_DIR), "--binary-path", "target/debug/deps", "--source-dir", ".", *llvm_path,
+             "--output-type", "lcov", "--ignore-not-existing", "--output-path", "lcov.info"],
+            cwd=build_dir,
+            timeout=self.timeout
+        )
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        return self.profiles(build_dir) + [path for path in [build_dir / "lcov.info"] if path.is_file()]
+    #fed
+#ssalc
+
+class CppAdapter(CoverageAdapter):
+    """
+    Builds the gtest tests with g++ and runs them without coverage.
+    """
+    language = 'Cpp'
+    compiler = "g++"
+    flags = CPP_FLAGS
+    version_cmd = "g++ --version"
+    impact_sources = ["Task.cpp", "TaskManager.cpp"]
+
+    def spec(self)->dict:
+        return {'source_dir': CPP_SRC_DIR, 'sources': _cpp_sources()}
+    #fed
+
+    def edit_target(self, build_dir: Path, target: str)->Path:
+        if target == 'source':
+            return build_dir / "Task.cpp"
+        #fi
+        shards = sorted(build_dir.glob("tests_*.cpp"), key=lambda shard: int(shard.stem.split("_")[1]))
+        return shards[0] if shards else build_dir / "tests.cpp"
+    #fed
+
+    def build_flags(self)->str:
+        flags: list[str] = [self.flags]
+        if self.configuration['opt_level'] != DIMENSIONS['opt_level']:
+            flags.append(f"-O{self.configuration['opt_level']}")
+        #fi
+        # Builds without coverage have no counters to update.
+        if self.baseline and self.configuration['counter_update'] != DIMENSIONS['counter_update']:
+            flags.append(f"-fprofile-update={self.configuration['counter_update']}")
+        #fi
+        return " ".join(flags)
+    #fed
+
+    def build(self, build_dir: Path)->dict:
+        return _measured_cpp_build(build_dir, self.build_flags(), self.compiler, self.timeout)
+    #fed
+
+    def binaries(self, build_dir: Path)->list[Path]:
+        return [build_dir / "tests"]
+    #fed
+
+    def test(self, build_dir: Path, threads: int = 0, tests: list[str] = None)->dict:
+        """
+        Runs the tests in one process or, with more than one thread, as that many gtest shards at the same time.
+        Selected tests always run in one process.
+        """
+        results_dir = _fresh_dir(build_dir / TEST_RESULTS_DIR)
+        if threads <= 1 or tests:
+            test_filter: list[str] = [f"--gtest_filter={':'.join(tests)}"] if tests else []
+            return _measured_run(["./tests", f"--gtest_output=json:{results_dir / '0.json'}", *test_filter], cwd=build_dir,
+                                 env={**self.env(build_dir), LATENCIES_ENV: str(results_dir / "0.latencies")},
+                                 counters=self.counters, timeout=self.timeout)
+        #fi
+        return _measured_concurrent_runs(
+            [["./tests", f"--gtest_output=json:{results_dir / f'{k}.json'}"] for k in range(threads)],
+            cwd=build_dir,
+            envs=[{**self.env(build_dir), LATENCIES_ENV: str(results_dir / f"{k}.latencies"),
+                   'GTEST_TOTAL_SHARDS': str(threads), 'GTEST_SHARD_INDEX': str(k)} for k in range(threads)],
+            counters=self.counters,
+            timeout=self.timeout
+        )
+    #fed
+
+    def test_latencies(self, build_dir: Path)->dict:
+        """
+        Returns the per-test durations in nanoseconds the latency listener wrote, or, from builds without it,
+        from gtest's JSON output, which has millisecond resolution.
+        """
+        latencies: dict = {}
+        for results in sorted((build_dir / TEST_RESULTS_DIR).glob("*.latencies")):
+            with open(results) as f:
+                for line in f:
+                    test, duration = line.rsplit(" ", 1)
+                    latencies[test] = int(duration) / 1e9
+                #rof
+            #htiw
+        #rof
+        if latencies:
+            return latencies
+        #fi
+        for results in sorted((build_dir / TEST_RESULTS_DIR).glob("*.json")):
+            with open(results) as f:
+                for suite in json.load(f).get('testsuites', []):
+                    for test in suite.get('testsuite', []):
+                        if test.get('status', 'RUN') == 'RUN':
+                            latencies[f"{suite['name']}.{test['name']}"] = float(test['time'].rstrip('s'))
+                        #fi
+                    #rof
+                #rof
+            #htiw
+        #rof
+        return latencies
+    #fed
+
+    def suite_time(self, build_dir: Path)->float:
+        """
+        Returns the longest suite time of the gtest shards, which run at the same time.
+        """
+        times: list[float] = []
+        for results in sorted((build_dir / TEST_RESULTS_DIR).glob("*.json")):
+            with open(results) as f:
+                times.append(float(json.load(f)['time'].rstrip('s')))
+            #htiw
+        #rof
+        return max(times) if times else None
+    #fed
+#ssalc
+
+class GcovAdapter(CppAdapter):
+    """
+    gcc's --coverage instrumentation, reported with gcov.
+    """
+    name = 'gcov'
+    baseline = 'none'
+    flags = f"{CPP_FLAGS} --coverage"
+    relocatable_artifacts = True
+    per_test_coverage = True
+
+    def env(self, build_dir: Path)->dict:
+        """
+        Redirects the .gcda files to the artifact root, flat, with GCOV_PREFIX.
+        """
+        if self.artifact_root(build_dir) == build_dir:
+            return {}
+        #fi
+        return {'GCOV_PREFIX': str(self.artifact_root(build_dir)), 'GCOV_PREFIX_STRIP': str(len(build_dir.parts) - 1)}
+    #fed
+
+    def data_dir(self, build_dir: Path)->Path:
+        """
+        Returns the directory that holds the .gcda files and, linked if they were redirected, the .gcno files
+        of the build, which gcov and lcov read together.
+        """
+        root = self.artifact_root(build_dir)
+        if root != build_dir:
+            for gcno in self.notes(build_dir):
+                if not (root / gcno.name).exists():
+                    (root / gcno.name).symlink_to(gcno)
+                #fi
+            #rof
+        #fi
+        return root
+    #fed
+
+    def report(self, build_dir: Path)->dict:
+        data_dir = self.data_dir(build_dir)
+        object_dir: list[str] = [] if data_dir == build_dir else ["-o", str(data_dir)]
+        return _measured_run(["gcov", "-n", *object_dir, *sorted(str(gcno.name) for gcno in self.notes(build_dir))], cwd=build_dir,
+                             timeout=self.timeout)
+    #fed
+
+    def covered_lines(self, build_dir: Path)->dict:
+        """
+        Reads the covered lines from the sources gcov annotates with execution counts on stdout with -t.
+        """
+        data_dir = self.data_dir(build_dir)
+        object_dir: list[str] = [] if data_dir == build_dir else ["-o", str(data_dir)]
+        output = subprocess.run(["gcov", "-t", *object_dir, *self.impact_sources], cwd=build_dir, capture_output=True, text=True,
+                                check=True, timeout=self.timeout).stdout
+        lines: dict = {source: set() for source in self.impact_sources}
+        source = None
+        for line in output.splitlines():
+            fields = line.split(":", 2)
+            if len(fields) < 3:
+                continue
+            #fi
+            count, number = fields[0].strip().rstrip("*"), fields[1].strip()
+            if number == "0" and fields[2].startswith("Source:"):
+                source = Path(fields[2][len("Source:"):]).name
+            elif source in lines and count.isdigit() and int(count) > 0:
+                lines[source].add(int(number))
+            #fi
+        #rof
+        return lines
+    #fed
+
+    def notes(self, build_dir: Path)->list[Path]:
+        return sorted(build_dir.glob("*.gcno"))
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        return list(self.artifact_root(build_dir).glob("*.gcda"))
+    #fed
+#ssalc
+
+class LcovAdapter(GcovAdapter):
+    """
+    gcc's --coverage instrumentation, captured into an lcov tracefile with lcov.
+    """
+    name = 'lcov'
+    version_cmd = "g++ --version && lcov --version"
+    install_cmd = "apt-get install lcov"
+
+    def report(self, build_dir: Path)->dict:
+        return _measured_run(["lcov", "--capture", "--directory", str(self.data_dir(build_dir)), "--output-file", "coverage.info", "--quiet"],
+                             cwd=build_dir, timeout=self.timeout)
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        return super().artifacts(build_dir) + [path for path in [build_dir / "coverage.info"] if path.is_file()]
+    #fed
+#ssalc
+
+class ClangAdapter(CppAdapter):
+    """
+    Builds the gtest tests with clang++ and runs them without coverage, the baseline of clang's coverage.
+    """
+    name = 'clang'
+    compiler = "clang++"
+    version_cmd = "clang++ --version"
+    install_cmd = "apt-get install clang"
+#ssalc
+
+class ClangSourceAdapter(ClangAdapter):
+    """
+    clang's source-based coverage, -fprofile-instr-generate -fcoverage-mapping, reported with llvm-profdata
+    and llvm-cov.
+    """
+    name = 'clang-source'
+    baseline = 'clang'
+    flags = f"{CPP_FLAGS} -fprofile-instr-generate -fcoverage-mapping"
+    version_cmd = "clang++ --version && llvm-cov --version"
+    install_cmd = "apt-get install clang llvm"
+    relocatable_artifacts = True
+    per_test_coverage = True
+
+    def env(self, build_dir: Path)->dict:
+        return {'LLVM_PROFILE_FILE': str(self.artifact_root(build_dir) / PROFILE_DIR / "%p.profraw")}
+    #fed
+
+    def report(self, build_dir: Path)->dict:
+        return _measured_merge_and_report(
+            ["llvm-profdata", "merge", "-sparse", *(str(profile) for profile in self.profiles(build_dir)), "-o", "tests.profdata"],
+            ["llvm-cov", "report", "./tests", "--instr-profile=tests.profdata"],
+            cwd=build_dir,
+            timeout=self.timeout
+        )
+    #fed
+
+    def covered_lines(self, build_dir: Path)->dict:
+        return _llvm_covered_lines(
+            ["llvm-profdata", "merge", "-sparse", *(str(profile) for profile in self.profiles(build_dir)), "-o", "tests.profdata"],
+            ["llvm-cov", "export", "./tests", "--format=lcov", "--instr-profile=tests.profdata"],
+            build_dir,
+            self.impact_sources,
+            timeout=self.timeout
+        )
+    #fed
+
+    def artifacts(self, build_dir: Path)->list[Path]:
+        return self.profiles(build_dir) + [path for path in [build_dir / "tests.profdata"] if path.is_file()]
+    #fed
+#ssalc
+
+# Every supported tool, and the baselines they are measured against, keyed by language and tool, in report order.
+COVERAGE_ADAPTERS: dict = {(adapter.language, adapter.name): adapter for adapter in [
+    RustAdapter(), LlvmCovAdapter(), TarpaulinAdapter(), InstrumentCoverageAdapter(), GrcovAdapter(),
+    CppAdapter(), GcovAdapter(), LcovAdapter(), ClangAdapter(), ClangSourceAdapter(),
+]}
+
+def _adapter(
+    language: str,
+    tool: str,
+)->CoverageAdapter:
+    """
+    Returns the adapter of tool for language.
+    """
+    return COVERAGE_ADAPTERS[(language, tool)]
+#fed
+
+def _language_tools(
+    language: str,
+    tools: list[str],
+)->list[str]:
+    """
+    Returns the coverage tools of language among tools, together with the baselines they need, in report order.
+    """
+    selected = {adapter.name for adapter in COVERAGE_ADAPTERS.values() if adapter.language == language and adapter.name in tools}
+    selected |= {_adapter(language, tool).baseline for tool in selected if _adapter(language, tool).baseline}
+    return [adapter.name for adapter in COVERAGE_ADAPTERS.values() if adapter.language == language and adapter.name in selected]
+#fed
+
+def _build_variant(
+    build: dict,
+)->dict:
+    """
+    Builds a variant in its own build directory. Runs in a worker process of the build farm,
+    so it only reports back and leaves logging to the scheduler.
+    """
+    result: dict = {'build_metrics': None, 'error': None}
+    build_dir = build['build_dir']
+    try:
+        adapter = _adapter(build['language'], build['tool']).configured(build['configuration'])
+        result['build_metrics'] = adapter.build(build_dir)
+        notes = adapter.notes(build_dir)
+        if notes:
+            result['build_metrics'].update(_artifact_metrics(notes))
+        #fi
+        _mark_built(build_dir)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+        result['error'] = f"{e}"
+    #yrt
+    return result
+#fed
+
+def _scripted_edit(
+    path: Path,
+)->None:
+    """
+    Edits path the way a developer would between two builds, by appending a comment line, which
+    replaces the one the previous edit appended so that the file does not grow.
+    """
+    lines = path.read_text().splitlines(keepends=True)
+    if lines and lines[-1].startswith(EDIT_MARKER):
+        lines.pop()
+    #fi
+    lines.append(f"{EDIT_MARKER}{uuid.uuid4().hex}\n")
+    path.write_text("".join(lines))
+#fed
+
+@contextlib.contextmanager
+def _pinned(
+    cpus: list[int],
+):
+    """
+    Pins the calling thread, and so every process it starts, to cpus while the context is active.
+    Without cpus nothing is pinned.
+    """
+    if not cpus:
+        yield
+        return
+    #fi
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+    #yrt
+#fed
+
+def _measure_variant(
+    variant: dict,
+    build_metrics: dict,
+    record: bool = True,
+)->dict:
+    """
+    Runs the test and report phases of a built variant, after editing it and timing the rebuild if the
+    variant has a rebuild target, and, if record is set, records them together
+    with build_metrics, the measurements of building the variant if this run built it, and marks the run
+    done, or failed if a phase failed or timed out, in the session manifest.
+    The run is pinned to the CPUs of the variant, if any.
+    Returns the measurements of every phase, or None if the run failed.
+    """
+    language = variant['language']
+    tool = variant['tool']
+    workload = variant['workload']
+    build_dir = variant['build_dir']
+    logger.info(f"Running test for {language} {tool} with workload {workload} for run {variant['run']}...")
+    with _pinned(variant.get('cpus')):
+        try:
+            phase_metrics: dict = {}
+            if build_metrics is not None:
+                phase_metrics['build'] = build_metrics
+            #fi
+            adapter = _adapter(language, tool).configured(variant)
+            if variant.get('rebuild'):
+                _scripted_edit(adapter.edit_target(build_dir, variant['rebuild']))
+                phase_metrics['rebuild'] = adapter.build(build_dir)
+            #fi
+            adapter.clean(build_dir)
+            phase_metrics['test'] = adapter.test(build_dir, variant['threads'])
+            if workload == NULL_WORKLOAD:
+                phase_metrics['test'][HARNESS_TIME] = _measured_run(["true"], cwd=build_dir)['wall_time']
+            #fi
+            binaries = adapter.binaries(build_dir)
+            if binaries:
+                phase_metrics['test'][BINARY_SIZE] = sum(binary.stat().st_size for binary in binaries)
+            #fi
+            suite_time = adapter.suite_time(build_dir)
+            if suite_time is not None:
+                phase_metrics['test']['exit_time'] = phase_metrics['test']['wall_time'] - suite_time
+            #fi
+            if adapter.baseline:
+                phase_metrics['test'].update(_artifact_metrics(adapter.artifacts(build_dir)))
+            #fi
+            report_metrics = adapter.report(build_dir)
+            if report_metrics is not None:
+                phase_metrics['report'] = {**report_metrics, **_artifact_metrics(adapter.artifacts(build_dir))}
+            #fi
+            if record:
+                _discard_run(variant)
+                _record_phase_metrics(variant, phase_metrics)
+                _record_test_latencies(variant, adapter.test_latencies(build_dir))
+                _record_run_status(variant, 'done')
+            #fi
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.error(f"Running tests for workload {workload} for {language} failed!"
+                         f"{e}")
+            if record:
+                _record_run_status(variant, 'failed', f"{e}")
+            #fi
+            return None
+        #yrt
+    #htiw
+    logger.info(f"Finished running test for {language} {tool} with workload {workload} for run {variant['run']}.")
+    return phase_metrics
+#fed
+
+def _configurations(
+    matrix: dict,
+)->list[dict]:
+    """
+    Returns every combination of the values of the dimensions in matrix.
+    Dimensions missing from matrix take their default value.
+    """
+    values: list[list] = [(matrix or {}).get(dimension) or [default] for dimension, default in DIMENSIONS.items()]
+    return [dict(zip(DIMENSIONS, combination)) for combination in itertools.product(*values)]
+#fed
+
+def _gen_tests(
+    language: str,
+    workload: int,
+    configuration: dict,
+)->None:
+    """
+    Generates the tests of workload for language in the given configuration of the dimensions.
+    """
+    if language == 'Cpp':
+        gen_cpp_tests(workload, shards=configuration['shards'], profile=configuration['profile'])
+    else:
+        gen_rust_tests(workload, shards=configuration['shards'], profile=configuration['profile'])
+    #fi
+#fed
+
+def _run_variants(
+    languages: list[str],
+    workloads: list[int],
+    average: int,
+    use_build_cache: bool,
+    jobs: int,
+    sampling: dict,
+    matrix: dict,
+    tools: list[str],
+    run_id: str,
+)->None:
+    """
+    Builds every (language, tool, workload, configuration, run) variant concurrently on a pool of jobs
+    processes, each in its own build directory, then measures the built variants one at a time so that
+    the measurements do not compete with each other or with the builds. The tools are the coverage tools
+    in tools with their baselines, the configurations all combinations of the dimension values in matrix.
+    With calibrate in sampling, the workloads include NULL_WORKLOAD.
+    The measurements are recorded as the session run_id. Runs it already finished, when it is resumed, are not
+    measured again, nor built unless a later run needs their build, but their samples count.
+    """
+    sampling = {**SAMPLING_DEFAULTS, **(sampling or {})}
+    if sampling['calibrate'] and NULL_WORKLOAD not in workloads:
+        workloads = [NULL_WORKLOAD, *workloads]
+    #fi
+    if sampling['counters']:
+        # The times and rusage of runs under perf stat include its own overhead, so they are recorded as a
+        # configuration of their own. Hosts without perf fall back to unwrapped runs, recorded as such.
+        matrix = {**(matrix or {}), 'counters': ['perf' if _perf_available() else 'none']}
+    #fi
+    finished = _finished_runs(run_id)
+    if finished:
+        logger.warning(f"Resuming session {run_id}, skipping the {len(finished)} runs it finished.")
+    #fi
+    tools = tools or DEFAULT_COVERAGE_TOOLS
+    # The rebuild edits the sources of a build, so its builds are cached apart from unedited ones.
+    scenario = f"edit-{sampling['rebuild']}" if sampling['rebuild'] else None
+    builds: dict = {}
+    variants: list[dict] = []
+    for language in languages:
+        for workload in workloads:
+            for configuration in _configurations(matrix):
+                _gen_tests(language, workload, configuration)
+                prepared: dict = {}
+                language_tools: list[str] = []
+                for tool in _language_tools(language, tools):
+                    if _adapter(language, tool).configured(configuration).supports():
+                        language_tools.append(tool)
+                    else:
+                        logger.warning(f"Skipping {language} {tool} in {configuration}, it does not support it.")
+                    #fi
+                #rof
+                for i in range(1, average + 1):
+                    for tool in language_tools:
+                        # With the build cache all runs of a tool share one build.
+                        if use_build_cache and tool in prepared:
+                            build_dir = prepared[tool]
+                        else:
+                            adapter = _adapter(language, tool).configured(configuration)
+                            spec = adapter.spec()
+                            build_dir, is_built = _prepare_build_dir(language, tool, adapter.build_flags(), adapter.version_cmd,
+                                                                     spec['source_dir'], spec['sources'],
+                                                                     use_build_cache, run=i, scenario=scenario)
+                            prepared[tool] = build_dir
+                        #fi
+                        if build_dir not in builds:
+                            builds[build_dir] = {
+                                'language': language,
+                                'tool': tool,
+                                'configuration': {**configuration, 'timeout': sampling['timeout']},
+                                'build_dir': build_dir,
+                                'is_built': is_built,
+                            }
+                        #fi
+                        variants.append({
+                            'language': language,
+                            'tool': tool,
+                            'workload': workload,
+                            **configuration,
+                            'run': i,
+                            'build_dir': build_dir,
+                            'cpus': sampling['cpus'],
+                            'timeout': sampling['timeout'],
+                            'run_id': run_id,
+                            'rebuild': sampling['rebuild'],
+                        })
+                    #rof
+                #rof
+            #rof
+        #rof
+    #rof
+
+    cells: dict = {}
+    for variant in variants:
+        cells.setdefault(_cell_key(variant), []).append(variant)
+    #rof
+    # Builds all of whose runs the session finished are skipped, except the last build of every tool of a cell that
+    # warmup or top-up runs may still measure.
+    needed: set[Path] = {variant['build_dir'] for variant in variants if _run_key(variant) not in finished}
+    for cell in cells.values():
+        if sampling['ci_target'] is not None or any(_run_key(variant) not in finished for variant in cell):
+            needed |= {variant['build_dir'] for variant in {variant['tool']: variant for variant in cell}.values()}
+        #fi
+    #rof
+    pending: list[dict] = [build for build in builds.values() if not build['is_built'] and build['build_dir'] in needed]
+    logger.info(f"Building {len(pending)} variants on {jobs} processes...")
+    if jobs > 1 and pending:
+        logger.warning(f"Building on {jobs} processes at once, build times are contended and not recorded.")
+    #fi
+    build_results: dict = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(_build_variant, build): build['build_dir'] for build in pending}
+        for future in concurrent.futures.as_completed(futures):
+            build_dir = futures[future]
+            build_results[build_dir] = future.result()
+            if build_results[build_dir]['error'] is not None:
+                logger.error(f"Building {build_dir} failed!"
+                             f"{build_results[build_dir]['error']}")
+            #fi
+        #rof
+    #htiw
+    logger.info(f"Finished building {len(pending)} variants.")
+
+    built_cells: list[list[dict]] = [cell for cell in (_built_variants(cell, build_results, finished) for cell in cells.values()) if cell]
+    deadline = time.monotonic() + sampling['time_budget'] if sampling['time_budget'] else math.inf
+    sequence = itertools.count(_last_sequence(run_id) + 1)
+    recorded = _query_times([], [run_id])[2]
+    samples: dict = {}
+    for variant in variants:
+        samples.setdefault(_cell_key(variant), {})[variant['tool']] = list(recorded.get(
+            (variant['workload'], variant['language'], tuple(variant[dimension] for dimension in DIMENSIONS), variant['tool'], 'test'), []))
+    #rof
+    # Configurations whose build flags are the same share a build, whose cost is recorded with the first
+    # run of each of them. Builds on more than one process are contended and not recorded.
+    attributed: set[tuple] = set()
+    # The fixed order measures cell after cell, the others interleave the runs of all cells.
+    groups: list[list] = [[cell] for cell in built_cells] if sampling['order'] == 'fixed' else [built_cells]
+    for group in groups:
+        for cell in group:
+            if any(_run_key(variant) not in finished for variant in cell):
+                _warm_up(cell, sampling)
+            #fi
+        #rof
+        for variant in _schedule(group, sampling):
+            if _run_key(variant) in finished:
+                continue
+            #fi
+            build_metrics = None
+            if jobs == 1 and variant['build_dir'] in build_results and (variant['build_dir'], *_cell_key(variant)) not in attributed:
+                build_metrics = build_results[variant['build_dir']]['build_metrics']
+                attributed.add((variant['build_dir'], *_cell_key(variant)))
+            #fi
+            phase_metrics = _measure_variant({**variant, 'sequence': next(sequence)}, build_metrics)
+            if phase_metrics is not None:
+                samples[_cell_key(variant)][variant['tool']].append(phase_metrics['test']['wall_time'])
+            #fi
+        #rof
+        for cell in group:
+            _top_up(cell, samples[_cell_key(cell[0])], sampling, deadline, sequence, finished)
+        #rof
+    #rof
+#fed
+
+def _cell_key(
+    variant: dict,
+)->tuple:
+    """
+    Returns the cell of a variant, its language, workload and dimension values, whose tools are compared.
+    """
+    return (variant['language'], variant['workload'], *(variant[dimension] for dimension in DIMENSIONS))
+#fed
+
+def _built_variants(
+    cell: list[dict],
+    build_results: dict,
+    finished: set[tuple] = None,
+)->list[dict]:
+    """
+    Returns the variants of cell whose builds succeeded, marking the others failed in the session manifest.
+    Runs in finished whose builds were skipped are left out without being marked.
+    """
+    built: list[dict] = []
+    for variant in cell:
+        build_dir = variant['build_dir']
+        if build_dir not in build_results and not (build_dir / BUILD_STAMP).is_file() and _run_key(variant) in (finished or set()):
+            continue
+        #fi
+        if build_results.get(build_dir, {}).get('error') is not None or not (build_dir / BUILD_STAMP).is_file():
+            logger.error(f"Skipping {variant['language']} {variant['tool']} with workload {variant['workload']} for run {variant['run']}, its build failed!")
+            _record_run_status(variant, 'failed', build_results.get(build_dir, {}).get('error') or "build failed")
+            continue
+        #fi
+        built.append(variant)
+    #rof
+    return built
+#fed
+
+def _order_repetition(
+    repetition: list[dict],
+    run: int,
+    sampling: dict,
+)->list[dict]:
+    """
+    Orders the variants of one repetition, the run-th, by the order of sampling: fixed keeps their order,
+    random shuffles them, abba reverses every other repetition and latin rotates them by one position per
+    repetition, so that over the repetitions every variant takes every position.
+    """
+    repetition = list(repetition)
+    if sampling['order'] == 'random':
+        random.Random(f"{sampling['seed']}:{run}").shuffle(repetition)
+    elif sampling['order'] == 'abba' and run % 2 == 0:
+        repetition.reverse()
+    elif sampling['order'] == 'latin' and repetition:
+        shift = (run - 1) % len(repetition)
+        repetition = repetition[shift:] + repetition[:shift]
+    #fi
+    return repetition
+#fed
+
+def _schedule(
+    cells: list[list[dict]],
+    sampling: dict,
+)->list[dict]:
+    """
+    Returns the prepared runs of cells in the order they are measured: repetition after repetition, with
+    the variants of all cells in each repetition ordered by _order_repetition.
+    """
+    if sampling['order'] == 'fixed':
+        return [variant for cell in cells for variant in cell]
+    #fi
+    schedule: list[dict] = []
+    for run in sorted({variant['run'] for cell in cells for variant in cell}):
+        schedule.extend(_order_repetition([variant for cell in cells for variant in cell if variant['run'] == run], run, sampling))
+    #rof
+    return schedule
+#fed
+
+def _warm_up(
+    built: list[dict],
+    sampling: dict,
+)->None:
+    """
+    Runs the last prepared run of every tool in built, the variants of one cell, the number of warmup
+    times of sampling without recording them.
+    """
+    last_run: dict = {variant['tool']: variant for variant in built}
+    for i in range(sampling['warmup']):
+        logger.info(f"Warmup run {i + 1} for {built[0]['language']} with workload {built[0]['workload']}...")
+        for variant in _order_repetition(list(last_run.values()), i + 1, sampling):
+            _measure_variant(variant, None, record=False)
+        #rof
+    #rof
+#fed
+
+def _top_up(
+    built: list[dict],
+    samples: dict,
+    sampling: dict,
+    deadline: float,
+    sequence: itertools.count,
+    finished: set[tuple],
+)->None:
+    """
+    With a CI target, measures further runs of the tools of built, the variants of one cell, on their last
+    builds until the overhead ratios of their test execution times in samples, keyed by tool, are precise
+    enough, the run limit is reached or the time budget runs out. Runs in finished are already in samples.
+    """
+    # Without a baseline there is no overhead ratio to converge.
+    language = built[0]['language']
+    if sampling['ci_target'] is None or not any(_adapter(language, tool).baseline in samples for tool in samples):
+        return
+    #fi
+    last_run: dict = {variant['tool']: variant for variant in built}
+    run = max(variant['run'] for variant in built)
+    while not _is_converged(language, samples, sampling):
+        if run >= sampling['max_runs'] or time.monotonic() >= deadline:
+            logger.warning(f"Overhead of {language} with workload {built[0]['workload']} did not reach "
+                           f"the CI target after {run} runs.")
+            return
+        #fi
+        run += 1
+        for variant in _order_repetition([{**variant, 'run': run} for variant in last_run.values()], run, sampling):
+            if _run_key(variant) in finished:
+                continue
+            #fi
+            phase_metrics = _measure_variant({**variant, 'sequence': next(sequence)}, None)
+            if phase_metrics is not None:
+                samples.setdefault(variant['tool'], []).append(phase_metrics['test']['wall_time'])
+            #fi
+        #rof
+    #elihw
+    logger.info(f"Overhead of {language} with workload {built[0]['workload']} reached the CI target after {run} runs.")
+#fed
+
+def collect_coverage_overhead_rust(
+    workloads: list[int],
+    average: int,
+    should_process_results: bool,
+    use_build_cache: bool = True,
+    jobs: int = 1,
+    sampling: dict = None,
+    extrapolate: list[int] = None,
+    matrix: dict = None,
+    tools: list[str] = None,
+    run_id: str = None,
+)->None:
+    run_id = run_id or _new_run_id()
+    logger.info(f"Collecting coverage for {workloads} for rust over {average} runs...")
+    _run_variants(['Rust'], workloads, average, use_build_cache, jobs, sampling, matrix, tools, run_id)
+    logger.info(f"Finished collecting coverage for {workloads} for rust over {average} runs")
+
+    if should_process_results:
+        logger.info("Processing results...")
+        process_results(workloads=workloads, run_ids=[run_id], sampling=sampling, extrapolate=extrapolate)
+        logger.info("Finishing...")
+    #fi
+#fed
+
+def collect_coverage_overhead_cpp(
+    workloads: list[int],
+    average: int,
+    should_process_results: bool,
+    use_build_cache: bool = True,
+    jobs: int = 1,
+    sampling: dict = None,
+    extrapolate: list[int] = None,
+    matrix: dict = None,
+    tools: list[str] = None,
+    run_id: str = None,
+)->None:
+    run_id = run_id or _new_run_id()
+    logger.info(f"Collecting coverage for {workloads} for cpp over {average} runs...")
+    _install_gtest()
+    _run_variants(['Cpp'], workloads, average, use_build_cache, jobs, sampling, matrix, tools, run_id)
+    logger.info(f"Finished collecting coverage for {workloads} for cpp over {average} runs")
+
+    if should_process_results:
+        logger.info("Processing results...")
+        process_results(workloads=workloads, run_ids=[run_id], sampling=sampling, extrapolate=extrapolate)
+        logger.info("Finishing...")
+    #fi
+#fed
+
+def collect_coverage_overhead(
+    workloads: list[int],
+    average: int,
+    use_build_cache: bool = True,
+    jobs: int = 1,
+    sampling: dict = None,
+    extrapolate: list[int] = None,
+    matrix: dict = None,
+    tools: list[str] = None,
+    run_id: str = None,
+)->None:
+    run_id = run_id or _new_run_id()
+    logger.info(f"Collecting coverage for {workloads} for rust and cpp over {average} runs...")
+    _install_gtest()
+    _run_variants(['Rust', 'Cpp'], workloads, average, use_build_cache, jobs, sampling, matrix, tools, run_id)
+    logger.info(f"Finished collecting coverage for {workloads} for rust and cpp over {average} runs")
+
+    logger.info("Processing results...")
+    process_results(workloads=workloads, run_ids=[run_id], sampling=sampling, extrapolate=extrapolate)
+    logger.info("Finishing...")
+#fed
+
+def _encode_lines(
+    lines: set[int],
+)->str:
+    """
+    Returns lines as a hex bitmap with the bit of every line number set.
+    """
+    return format(sum(1 << line for line in lines), "x")
+#fed
+
+def _decode_lines(
+    bitmap: str,
+)->set[int]:
+    """
+    Returns the line numbers of a bitmap from _encode_lines.
+    """
+    value = int(bitmap, 16)
+    return {line for line in range(value.bit_length()) if value >> line & 1}
+#fed
+
+def _save_coverage_index(
+    build_dir: Path,
+    index: dict,
+)->int:
+    """
+    Writes index, with the text of every impact source as indexed under 'sources' and the lines every test
+    covers in each under 'tests', to COVERAGE_INDEX in build_dir and returns its size in bytes.
+    """
+    path = build_dir / COVERAGE_INDEX
+    with gzip.open(path, "wt") as f:
+        json.dump({
+            'sources': index['sources'],
+            'tests': {test: {source: _encode_lines(lines) for source, lines in covered.items() if lines}
+                      for test, covered in index['tests'].items()},
+        }, f)
+    #htiw
+    return path.stat().st_size
+#fed
+
+def _load_coverage_index(
+    build_dir: Path,
+)->dict:
+    """
+    Reads the index _save_coverage_index wrote to build_dir.
+    """
+    with gzip.open(build_dir / COVERAGE_INDEX, "rt") as f:
+        index = json.load(f)
+    #htiw
+    index['tests'] = {test: {source: _decode_lines(bitmap) for source, bitmap in covered.items()}
+                      for test, covered in index['tests'].items()}
+    return index
+#fed
+
+def _covered_by_test(
+    adapter: CoverageAdapter,
+    build_dir: Path,
+    test: str,
+)->dict:
+    """
+    Runs test alone with the coverage of adapter and returns the lines it covers in every impact source.
+    """
+    adapter.clean(build_dir)
+    adapter.test(build_dir, tests=[test])
+    return adapter.covered_lines(build_dir)
+#fed
+
+def _build_coverage_index(
+    adapter: CoverageAdapter,
+    build_dir: Path,
+    tests: list[str],
+)->dict:
+    """
+    Returns the coverage index of the impact sources in build_dir, running every test of tests alone.
+    """
+    return {
+        'sources': {source: (build_dir / source).read_text() for source in adapter.impact_sources},
+        'tests': {test: _covered_by_test(adapter, build_dir, test) for test in tests},
+    }
+#fed
+
+def _changed_lines(
+    old: str,
+    new: str,
+)->tuple[set[int], dict]:
+    """
+    Diffs the text old against new. Returns the lines of old that were changed or deleted, together with
+    the lines around an insertion, and the line number in new of every line of old that did not change.
+    """
+    changed: set[int] = set()
+    moved: dict = {}
+    matcher = difflib.SequenceMatcher(a=old.splitlines(), b=new.splitlines(), autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            moved.update(zip(range(i1 + 1, i2 + 1), range(j1 + 1, j2 + 1)))
+        else:
+            changed.update(range(i1 + 1, i2 + 1) if i2 > i1 else [i1, i1 + 1])
+        #fi
+    #rof
+    return changed, moved
+#fed
+
+def _select_tests(
+    index: dict,
+    build_dir: Path,
+)->tuple[list[str], dict]:
+    """
+    Returns the tests of index that cover a line of an impact source that changed in build_dir since it was
+    indexed, and the changed lines and moved lines from _changed_lines of every changed source.
+    """
+    diffs: dict = {}
+    for source, text in index['sources'].items():
+        current = (build_dir / source).read_text()
+        if current != text:
+            diffs[source] = _changed_lines(text, current)
+        #fi
+    #rof
+    selected: list[str] = [
+        test for test, covered in index['tests'].items()
+        if any(covered.get(source, set()) & changed for source, (changed, moved) in diffs.items())
+    ]
+    return selected, diffs
+#fed
+
+def _update_coverage_index(
+    adapter: CoverageAdapter,
+    build_dir: Path,
+    index: dict,
+    selected: list[str],
+    diffs: dict,
+)->None:
+    """
+    Brings index up to date with the impact sources in build_dir after _select_tests returned selected and
+    diffs: the lines of the other tests move to their new numbers and the selected tests are indexed again.
+    """
+    for covered in index['tests'].values():
+        for source, (changed, moved) in diffs.items():
+            covered[source] = {moved[line] for line in covered.get(source, set()) if line in moved}
+        #rof
+    #rof
+    for test in selected:
+        index['tests'][test] = _covered_by_test(adapter, build_dir, test)
+    #rof
+    index['sources'] = {source: (build_dir / source).read_text() for source in adapter.impact_sources}
+#fed
+
+def _impact_edit(
+    build_dir: Path,
+    index: dict,
+    rng: random.Random,
+)->bool:
+    """
+    Edits a line of an impact source in build_dir that a test of index covers, chosen with rng, by appending
+    a comment, which replaces the one a previous edit appended so that the line does not grow.
+    Returns whether index has a covered line to edit.
+    """
+    covered: set[tuple] = {(source, line) for lines in index['tests'].values() for source in lines for line in lines[source]}
+    if not covered:
+        return False
+    #fi
+    source, number = rng.choice(sorted(covered))
+    path = build_dir / source
+    lines = path.read_text().splitlines(keepends=True)
+    code = lines[number - 1].rstrip("\n").split(IMPACT_MARKER)[0]
+    lines[number - 1] = f"{code}{IMPACT_MARKER}{rng.getrandbits(64):016x}\n"
+    path.write_text("".join(lines))
+    return True
+#fed
+
+def _measure_test_impact(
+    variant: dict,
+    average: int,
+    sampling: dict,
+    use_build_cache: bool,
+)->None:
+    """
+    Builds variant and its baseline, runs all its tests once to learn their names and builds the coverage
+    index by running every test alone with coverage. Then, average times, edits a covered line of an impact
+    source, rebuilds and runs all tests both with coverage and, with the same edit, without, selects the tests
+    covering the edit from the stored index, runs only those and updates the index, and records the impact
+    phase of every repetition.
+    """
+    language = variant['language']
+    tool = variant['tool']
+    workload = variant['workload']
+    adapter = _adapter(language, tool).configured(variant)
+    baseline = _adapter(language, adapter.baseline).configured(variant)
+    build_dirs: list[Path] = []
+    for build_adapter in [adapter, baseline]:
+        spec = build_adapter.spec()
+        # The edits change the sources of the build, so it is cached apart from unedited ones.
+        build_dir, is_built = _prepare_build_dir(language, build_adapter.name, build_adapter.build_flags(), build_adapter.version_cmd,
+                                                 spec['source_dir'], spec['sources'], use_build_cache, scenario=IMPACT_PHASE)
+        if not is_built:
+            build_result = _build_variant({'language': language, 'tool': build_adapter.name, 'configuration': variant, 'build_dir': build_dir})
+            if build_result['error'] is not None:
+                logger.error(f"Building {build_dir} failed!"
+                             f"{build_result['error']}")
+                return
+            #fi
+        #fi
+        build_dirs.append(build_dir)
+    #rof
+    build_dir, baseline_dir = build_dirs
+    logger.info(f"Measuring test impact selection for {language} {tool} with workload {workload}...")
+    with _pinned(variant.get('cpus')):
+        try:
+            adapter.clean(build_dir)
+            adapter.test(build_dir)
+            tests = sorted(adapter.test_latencies(build_dir))
+            start = time.monotonic_ns()
+            index = _build_coverage_index(adapter, build_dir, tests)
+            index_bytes = _save_coverage_index(build_dir, index)
+            index_time = (time.monotonic_ns() - start) / 1e9
+            rng = random.Random(f"{sampling['seed']}:{language}:{tool}:{workload}")
+            for run in range(1, average + 1):
+                if not _impact_edit(build_dir, index, rng):
+                    logger.warning(f"Skipping test impact selection for {language} {tool} with workload {workload}, its tests cover no line of {', '.join(adapter.impact_sources)}.")
+                    return
+                #fi
+                # The plain loop rebuilds the same edit without coverage.
+                for source in adapter.impact_sources:
+                    text = (build_dir / source).read_text()
+                    if (baseline_dir / source).read_text() != text:
+                        (baseline_dir / source).write_text(text)
+                    #fi
+                #rof
+                plain_rebuild_time = baseline.build(baseline_dir)['wall_time']
+                plain_time = baseline.test(baseline_dir)['wall_time']
+                rebuild_time = adapter.build(build_dir)['wall_time']
+                adapter.clean(build_dir)
+                full_time = adapter.test(build_dir)['wall_time']
+                start = time.monotonic_ns()
+                index = _load_coverage_index(build_dir)
+                selected, diffs = _select_tests(index, build_dir)
+                select_time = (time.monotonic_ns() - start) / 1e9
+                metrics: dict = {}
+                if selected:
+                    adapter.clean(build_dir)
+                    metrics['selective_time'] = adapter.test(build_dir, tests=selected)['wall_time']
+                #fi
+                start = time.monotonic_ns()
+                _update_coverage_index(adapter, build_dir, index, selected, diffs)
+                index_bytes = _save_coverage_index(build_dir, index)
+                index_update_time = (time.monotonic_ns() - start) / 1e9
+                _record_phase_metrics({**variant, 'run': run}, {IMPACT_PHASE: {
+                    **metrics,
+                    'full_time': full_time,
+                    'plain_time': plain_time,
+                    'select_time': select_time,
+                    'index_update_time': index_update_time,
+                    'rebuild_time': rebuild_time,
+                    'plain_rebuild_time': plain_rebuild_time,
+                    'full_cycle_time': rebuild_time + full_time,
+                    'plain_cycle_time': plain_rebuild_time + plain_time,
+                    'selective_cycle_time': rebuild_time + select_time + metrics.get('selective_time', 0.0) + index_update_time,
+                    'tests': len(tests),
+                    'selected_tests': len(selected),
+                    'index_time': index_time,
+                    'index_bytes': index_bytes,
+                }})
+            #rof
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.error(f"Measuring test impact selection for workload {workload} for {language} {tool} failed!"
+                         f"{e}")
+            return
+        #yrt
+    #htiw
+    logger.info(f"Finished measuring test impact selection for {language} {tool} with workload {workload}.")
+#fed
+
+def test_impact(
+    workloads: list[int],
     average: int,
-    should_process_log_file: bool,
+    languages: list[str] = ('Rust', 'Cpp'),
+    use_build_cache: bool = True,
+    sampling: dict = None,
+    matrix: dict = None,
+    tools: list[str] = None,
+    run_id: str = None,
+)->None:
+    """
+    Benchmarks coverage-driven test impact selection with every tool of languages among tools that can read
+    back the coverage of a single test, in every configuration of matrix, and prints how much of the plain
+    edit-rebuild-test loop, all tests without coverage, selecting the tests affected by an edit saves and what
+    keeping the coverage index current costs.
+    """
+    run_id = run_id or _new_run_id()
+    sampling = {**SAMPLING_DEFAULTS, **(sampling or {})}
+    tools = tools or DEFAULT_COVERAGE_TOOLS
+    logger.info(f"Measuring test impact selection for {workloads} for {', '.join(languages)} over {average} runs...")
+    if 'Cpp' in languages:
+        _install_gtest()
+    #fi
+    for language in languages:
+        for workload in workloads:
+            for configuration in _configurations(matrix):
+                _gen_tests(language, workload, configuration)
+                for tool in _language_tools(language, tools):
+                    adapter = _adapter(language, tool).configured(configuration)
+                    if not adapter.baseline:
+                        continue
+                    elif not adapter.per_test_coverage:
+                        logger.warning(f"Skipping {language} {tool}, the coverage of a single test cannot be read back from it.")
+                        continue
+                    elif not adapter.supports():
+                        logger.warning(f"Skipping {language} {tool} in {configuration}, it does not support it.")
+                        continue
+                    #fi
+                    _measure_test_impact({
+                        'language': language,
+                        'tool': tool,
+                        'workload': workload,
+                        **configuration,
+                        'cpus': sampling['cpus'],
+                        'timeout': sampling['timeout'],
+                        'run_id': run_id,
+                    }, average, sampling, use_build_cache)
+                #rof
+            #rof
+        #rof
+    #rof
+    logger.info(f"Finished measuring test impact selection for {workloads} for {', '.join(languages)} over {average} runs")
+    _print_test_impact(workloads, [run_id], sampling)
+#fed
+
+class BenchmarkSession:
+    """
+    A session of coverage overhead measurements driven from Python, e.g. by orchestration code that builds
+    its matrices in memory, instead of through the command line. Importing the harness has no side effects:
+    logging, with its log file, is set up when the first session collects, and seutil and tabulate are only
+    imported when used. sampling and matrix take the keys of SAMPLING_DEFAULTS and DIMENSIONS, the latter
+    with lists of values, and run_id continues an earlier session like --resume.
+    The test generators gen_rust_tests and gen_cpp_tests can be called directly as well.
+    """
+    def __init__(
+        self,
+        run_id: str = None,
+        sampling: dict = None,
+        matrix: dict = None,
+        tools: list[str] = None,
+        jobs: int = 1,
+        use_build_cache: bool = True,
+    )->None:
+        self.run_id = run_id or _new_run_id()
+        self.sampling = {**SAMPLING_DEFAULTS, **(sampling or {})}
+        self.matrix = matrix or {}
+        self.tools = tools
+        self.jobs = jobs
+        self.use_build_cache = use_build_cache
+    #fed
+
+    def collect(
+        self,
+        workloads: list[int],
+        languages: list[str] = ('Rust', 'Cpp'),
+        average: int = 5,
+    )->None:
+        """
+        Measures every tool, configuration and workload of languages average times into the results store.
+        """
+        _setup_logging()
+        logger.info(f"Collecting coverage for {workloads} for {', '.join(languages)} over {average} runs in session {self.run_id}...")
+        if 'Cpp' in languages:
+            _install_gtest()
+        #fi
+        _run_variants(list(languages), workloads, average, self.use_build_cache, self.jobs, self.sampling, self.matrix, self.tools, self.run_id)
+        logger.info(f"Finished collecting coverage for {workloads} for {', '.join(languages)} over {average} runs in session {self.run_id}")
+    #fed
+
+    def test_impact(
+        self,
+        workloads: list[int],
+        languages: list[str] = ('Rust', 'Cpp'),
+        average: int = 5,
+    )->None:
+        """
+        Benchmarks coverage-driven test impact selection like --test-impact into the results store.
+        """
+        _setup_logging()
+        test_impact(workloads, average, languages=list(languages), use_build_cache=self.use_build_cache, sampling=self.sampling,
+                    matrix=self.matrix, tools=self.tools, run_id=self.run_id)
+    #fed
+
+    def results(
+        self,
+        metric: str = 'wall_time',
+        extrapolate: list[int] = None,
+        export_dir: Path = None,
+    )->None:
+        """
+        Prints metric and its coverage overhead for the measurements of the session, and exports them to export_dir if given.
+        """
+        process_results(workloads=[], run_ids=[self.run_id], metric=metric, sampling=self.sampling, extrapolate=extrapolate,
+                        export_dir=export_dir)
+    #fed
+
+    def compare(
+        self,
+        baseline_run_ids: list[str],
+        metric: str = 'wall_time',
+        threshold: float = REGRESSION_THRESHOLD,
+    )->bool:
+        """
+        Compares the overhead ratios of the session with those of the sessions baseline_run_ids and returns whether any regressed.
+        """
+        return compare_results(baseline_run_ids, [self.run_id], metric=metric, sampling=self.sampling, threshold=threshold)
+    #fed
+#ssalc
+
+def _estimate(
+    samples: list[float],
+    estimator: str,
+)->float:
+    """
+    Estimates the location of samples with the mean, the median or the mean of the samples
+    left after trimming TRIM_FRACTION of them from either end.
+    """
+    if not samples:
+        return math.nan
+    #fi
+    if estimator == 'median':
+        return median(samples)
+    elif estimator == 'trimmed':
+        trim = int(len(samples) * TRIM_FRACTION)
+        return mean(sorted(samples)[trim:len(samples) - trim])
+    else:
+        return mean(samples)
+    #fi
+#fed
+
+def _bootstrap_ratio_ci(
+    numerator: list[float],
+    denominator: list[float],
+    sampling: dict,
+)->tuple[float, float]:
+    """
+    Returns the bootstrap percentile confidence interval of the ratio of the estimates of
+    numerator and denominator, resampling both independently.
+    """
+    if len(numerator) < 2 or len(denominator) < 2:
+        return math.nan, math.nan
+    #fi
+    rng = random.Random(sampling['seed'])
+    ratios: list[float] = []
+    for _ in range(sampling['bootstrap']):
+        resampled_denominator = _estimate(rng.choices(denominator, k=len(denominator)), sampling['estimator'])
+        if resampled_denominator:
+            ratios.append(_estimate(rng.choices(numerator, k=len(numerator)), sampling['estimator']) / resampled_denominator)
+        #fi
+    #rof
+    if not ratios:
+        return math.nan, math.nan
+    #fi
+    ratios.sort()
+    alpha = (1 - sampling['confidence']) / 2
+    return ratios[int(alpha * (len(ratios) - 1))], ratios[int((1 - alpha) * (len(ratios) - 1))]
+#fed
+
+def _bootstrap_ratio_change(
+    baseline: tuple[list[float], list[float]],
+    candidate: tuple[list[float], list[float]],
+    sampling: dict,
+)->tuple[float, float, float]:
+    """
+    Returns the bootstrap percentile confidence interval of the change of an overhead ratio, the ratio of the
+    candidate over the ratio of the baseline, each given as the samples with and without coverage, and the
+    two-sided bootstrap p-value of no change. All four samples are resampled independently.
+    """
+    if min(len(samples) for samples in [*baseline, *candidate]) < 2:
+        return math.nan, math.nan, math.nan
+    #fi
+    rng = random.Random(sampling['seed'])
+    changes: list[float] = []
+    for _ in range(sampling['bootstrap']):
+        estimates = [_estimate(rng.choices(samples, k=len(samples)), sampling['estimator']) for samples in [*baseline, *candidate]]
+        if estimates[1] and estimates[3] and estimates[0]:
+            changes.append((estimates[2] / estimates[3]) / (estimates[0] / estimates[1]))
+        #fi
+    #rof
+    if not changes:
+        return math.nan, math.nan, math.nan
+    #fi
+    changes.sort()
+    alpha = (1 - sampling['confidence']) / 2
+    p_value = min(1.0, 2 * min(sum(change <= 1 for change in changes), sum(change >= 1 for change in changes)) / len(changes))
+    return changes[int(alpha * (len(changes) - 1))], changes[int((1 - alpha) * (len(changes) - 1))], p_value
+#fed
+
+def _is_converged(
+    language: str,
+    samples: dict,
+    sampling: dict,
+)->bool:
+    """
+    Checks whether the confidence intervals of the overhead ratios of every tool of language in samples,
+    the test execution times of a cell keyed by tool, are narrower than the target relative width.
+    """
+    for tool, tool_samples in samples.items():
+        baseline_tool = _adapter(language, tool).baseline
+        if baseline_tool not in samples:
+            continue
+        #fi
+        baseline = _estimate(samples[baseline_tool], sampling['estimator'])
+        low, high = _bootstrap_ratio_ci(tool_samples, samples[baseline_tool], sampling)
+        if not baseline or math.isnan(low) or (high - low) * baseline / _estimate(tool_samples, sampling['estimator']) > sampling['ci_target']:
+            return False
+        #fi
+    #rof
+    return True
+#fed
+
+def _summarize_times(
+    times: list[float],
+    sampling: dict,
+)->dict:
+    """
+    Estimates the times of one phase of a tool and workload with the estimator of sampling.
+    """
+    summary: dict = {'avg': math.nan, 'stdev': math.nan, 'samples': times}
+    if times:
+        summary['avg'] = _estimate(times, sampling['estimator'])
+        summary['stdev'] = stdev(times) if len(times) > 1 else 0.0
+    #fi
+    return summary
+#fed
+
+def _cached_build(
+    phases: dict,
+    phase: str,
+)->bool:
+    """
+    Returns whether phase has no samples in phases, the summaries of every phase of a tool, because all its
+    runs reused a build from an earlier session or a contended one, which leaves them without a build and a total.
+    """
+    return phase in ['build', 'total'] and not phases[phase]['samples'] and bool(phases['test']['samples'])
+#fed
+
+def _ratio(
+    numerator: float,
+    denominator: float,
+)->float:
+    """
+    Returns numerator over denominator, or nan if the denominator is 0 or either is nan, e.g. for a metric
+    such as major_faults that every sample counts as 0.
+    """
+    if not denominator or math.isnan(denominator) or math.isnan(numerator):
+        return math.nan
+    #fi
+    return numerator / denominator
+#fed
+
+def _overhead_ratio(
+    with_coverage: dict,
+    without_coverage: dict,
+    sampling: dict,
+)->tuple[float, float, float]:
+    """
+    Returns the overhead ratio of with_coverage over without_coverage and its bootstrap confidence interval,
+    nan where they cannot be estimated.
+    """
+    ratio = _ratio(with_coverage['avg'], without_coverage['avg'])
+    if math.isnan(ratio):
+        return math.nan, math.nan, math.nan
+    #fi
+    return ratio, *_bootstrap_ratio_ci(with_coverage['samples'], without_coverage['samples'], sampling)
+#fed
+
+def _overhead(
+    with_coverage: dict,
+    without_coverage: dict,
+    sampling: dict,
+)->str:
+    """
+    Formats the overhead ratio of with_coverage over without_coverage with its bootstrap confidence interval.
+    """
+    ratio, low, high = _overhead_ratio(with_coverage, without_coverage, sampling)
+    if math.isnan(ratio):
+        return f"{math.nan}"
+    #fi
+    if math.isnan(low):
+        return f"{round(ratio, 2)}"
+    #fi
+    return f"{round(ratio, 2)} [{round(low, 2)}, {round(high, 2)}]"
+#fed
+
+def _query_times(
+    workloads: list[int],
+    run_ids: list[str],
+    metric: str = 'wall_time',
+)->tuple[list[int], list[tuple], dict]:
+    """
+    Queries the results store for metric of every phase, tool, configuration and workload. Configurations
+    are tuples of the values of the dimensions, in the order of DIMENSIONS.
+    Without workloads all recorded workloads are used, without run_ids all recorded sessions.
+    """
+    query = f"SELECT workload, language, tool, phase, value, {', '.join(DIMENSIONS)} FROM measurements WHERE metric = ?"
+    params: list = [metric]
+    if workloads:
+        query += f" AND workload IN ({', '.join('?' * len(workloads))})"
+        params.extend(workloads)
+    #fi
+    if run_ids:
+        query += f" AND run_id IN ({', '.join('?' * len(run_ids))})"
+        params.extend(run_ids)
+    #fi
+    times: dict = {}
+    with contextlib.closing(_connect_results()) as conn:
+        for workload, language, tool, phase, value, *configuration in conn.execute(query, params):
+            times.setdefault((workload, language, tuple(configuration), tool, phase), []).append(value)
+        #rof
+    #htiw
+    if not workloads:
+        workloads = sorted({key[0] for key in times})
+    #fi
+    configurations: list[tuple] = sorted({key[2] for key in times}) or [tuple(DIMENSIONS.values())]
+    return workloads, configurations, times
+#fed
+
+def _print_counter_overheads(
+    counts: dict,
+    workloads: list[int],
+    configurations: list[tuple],
+    tools: dict,
+    sampling: dict,
 )->None:
-    logger.info(f"Collecting coverage for {workloads} for cpp over {average} runs...")
-    _install_gtest()
-    for workload in workloads:
-        for i in range(1, average + 1):
-            logger.info(f"Collecting coverage for cpp workload {workload} for run {i}")
-            gen_cpp_tests(workload)
-            _run_test_without_coverage_cpp(workload=workload)
-            _run_test_with_coverage_cpp(workload=workload)
-            logger.info(f"Finished collecting coverage for cpp workload {workload} for run {i}!")
+    """
+    Prints the coverage overhead of every tool as a ratio of each hardware event count of the test phase
+    with and without coverage. counts holds the times queried for every metric of PERF_EVENTS.
+    """
+    headers: list[str] = ['Tool', '#Tests'] + list(counts)
+    rows: list[list] = []
+    for language in tools:
+        for configuration in configurations:
+            for tool in tools[language]:
+                baseline = _adapter(language, tool).baseline
+                for workload in workloads:
+                    row: list = [_label(language, tool, configuration, configurations), workload]
+                    for times in counts.values():
+                        row.append(_overhead(
+                            _summarize_times(times.get((workload, language, configuration, tool, 'test'), []), sampling),
+                            _summarize_times(times.get((workload, language, configuration, baseline, 'test'), []), sampling),
+                            sampling
+                        ))
+                    #rof
+                    rows.append(row)
+                #rof
+            #rof
         #rof
     #rof
-    logger.info(f"Finished collecting coverage for {workloads} for cpp over {average} runs")
+    print(f"Test execution coverage overhead as a ratio of hardware event counts with and without coverage "
+          f"({sampling['estimator']}, {round(sampling['confidence'] * 100)}% CI)")
+    print(tabulate(rows, headers=headers, tablefmt="simple_outline"))
+    print("\n")
+#fed
 
-    if should_process_log_file:
-        logger.info("Processing log file...")
-        process_log_file(log_file=log_file, workloads=workloads)
-        logger.info("Finishing...")
+def _net_of_null_run(
+    samples: list[float],
+    null_run: dict,
+)->list[float]:
+    """
+    Returns samples less the estimate of null_run, the summary of the null runs of the same tool, which is the
+    fixed cost of starting and exiting its test binary.
+    """
+    return [value - null_run['avg'] for value in samples]
+#fed
+
+def _print_calibration(
+    null_times: dict,
+    harness_times: dict,
+    times: dict,
+    workloads: list[int],
+    configurations: list[tuple],
+    tools: dict,
+    baselines: dict,
+    metric: str,
+    sampling: dict,
+)->None:
+    """
+    Prints the calibration of the test execution phase from the null runs in null_times: the harness
+    overhead, the time of measuring a command that does nothing, and the metric of the null run of every
+    tool, the fixed cost of starting and exiting a test binary without tests. Then prints the net coverage
+    overhead at every workload, the ratio of the metric in times with and without coverage after
+    subtracting the null run of each from its samples.
+    """
+    harness = _summarize_times([time for samples in harness_times.values() for time in samples], sampling)
+    calibration_rows: list[list] = [["Harness (null command, s)", f"{round(harness['avg'], 6)} ± {round(harness['stdev'], 6)}", ""]]
+    net_rows: list[list] = []
+    for language in baselines:
+        for configuration in configurations:
+            for tool in baselines[language] + tools.get(language, []):
+                null_run = _summarize_times(null_times.get((NULL_WORKLOAD, language, configuration, tool, 'test'), []), sampling)
+                baseline = _adapter(language, tool).baseline
+                null_baseline = _summarize_times(null_times.get((NULL_WORKLOAD, language, configuration, baseline, 'test'), []), sampling)
+                calibration_rows.append([
+                    _label(language, None if tool == 'none' else tool, configuration, configurations),
+                    f"{round(null_run['avg'], 6)} ± {round(null_run['stdev'], 6)}",
+                    _overhead(null_run, null_baseline, sampling) if baseline else "",
+                ])
+                if not baseline or math.isnan(null_run['avg']) or math.isnan(null_baseline['avg']):
+                    continue
+                #fi
+                net_rows.append([_label(language, tool, configuration, configurations)])
+                for workload in workloads:
+                    with_coverage = _net_of_null_run(times.get((workload, language, configuration, tool, 'test'), []), null_run)
+                    without_coverage = _net_of_null_run(times.get((workload, language, configuration, baseline, 'test'), []), null_baseline)
+                    net_rows[-1].append(_overhead(_summarize_times(with_coverage, sampling), _summarize_times(without_coverage, sampling), sampling))
+                #rof
+            #rof
+        #rof
+    #rof
+    print(f"Calibration of the test execution phase: {metric} of null runs without tests")
+    print(tabulate(calibration_rows, headers=['Tool', 'Null run', 'Null run ratio'], tablefmt="simple_outline"))
+    print(f"\n\nNet test execution coverage overhead as a ratio of {metric} with and without coverage, each less its null run "
+          f"({sampling['estimator']}, {round(sampling['confidence'] * 100)}% CI)")
+    print(tabulate(net_rows, headers=['#Tests'] + [str(workload) for workload in workloads], tablefmt="simple_outline"))
+    print("\n")
+#fed
+
+def _print_compile_costs(
+    costs: dict,
+    workloads: list[int],
+    configurations: list[tuple],
+    tools: dict,
+    sampling: dict,
+)->None:
+    """
+    Prints what instrumentation costs the compiler: the build and, if any were timed, rebuild times and
+    compiler peak memory of every tool, without and with coverage, and their overhead ratios. costs holds
+    the times queried for wall_time and max_rss.
+    """
+    compile_phases: list[str] = ['build']
+    if any(key[4] == 'rebuild' for key in costs['wall_time']):
+        compile_phases.append('rebuild')
+    #fi
+    headers: list[str] = ['Tool', '#Tests']
+    for phase in compile_phases:
+        headers.extend([f'{phase.capitalize()} time (s)', f'{phase.capitalize()} time ratio',
+                        f'{phase.capitalize()} peak memory (MB)', f'{phase.capitalize()} peak memory ratio'])
+    #rof
+    rows: list[list] = []
+    for language in tools:
+        for configuration in configurations:
+            for tool in tools[language]:
+                baseline = _adapter(language, tool).baseline
+                for workload in workloads:
+                    row: list = [_label(language, tool, configuration, configurations), workload]
+                    for phase in compile_phases:
+                        for metric, scale in [('wall_time', 1), ('max_rss', 1 / 1024)]:
+                            with_coverage, without_coverage = [
+                                {summary_phase: _summarize_times(costs[metric].get((workload, language, configuration, summary_tool, summary_phase), []), sampling)
+                                 for summary_phase in [phase, 'test']}
+                                for summary_tool in [tool, baseline]]
+                            if _cached_build(with_coverage, phase) or _cached_build(without_coverage, phase):
+                                row.extend([CACHED, CACHED])
+                                continue
+                            #fi
+                            row.append(f"{round(without_coverage[phase]['avg'] * scale, 2)} / {round(with_coverage[phase]['avg'] * scale, 2)}")
+                            row.append(_overhead(with_coverage[phase], without_coverage[phase], sampling))
+                        #rof
+                    #rof
+                    rows.append(row)
+                #rof
+            #rof
+        #rof
+    #rof
+    print(f"Compile-time instrumentation cost, without / with coverage, of clean builds"
+          f"{' and of rebuilds after an edit' if 'rebuild' in compile_phases else ''} "
+          f"({sampling['estimator']}, {round(sampling['confidence'] * 100)}% CI)")
+    print(tabulate(rows, headers=headers, tablefmt="simple_outline"))
+    if any(CACHED in row for row in rows):
+        print(f"{CACHED}: every run reused a build from an earlier session or built with --jobs above 1; "
+              "--no-build-cache --jobs 1 times clean builds.")
     #fi
+    print("\n")
 #fed
 
-def collect_coverage_overhead(
+def _print_test_impact(
     workloads: list[int],
-    average: int,
+    run_ids: list[str],
+    sampling: dict,
 )->None:
-    collect_coverage_overhead_rust(
-        workloads=workloads,
-        average=average,
-        should_process_log_file=False,
-    )
-    collect_coverage_overhead_cpp(
-        workloads=workloads,
-        average=average,
-        should_process_log_file=False,
-    )
-
-    logger.info("Processing log file...")
-    process_log_file(log_file=log_file, workloads=workloads)
-    logger.info("Finishing...")
+    """
+    Prints the test impact selection runs of run_ids: the tests selected after an edit, the rebuild times and
+    the times of running all tests without and with coverage against that of selecting and running only the
+    selected ones, the costs of updating the coverage index after the edit and of building it, and the share of
+    the plain edit-rebuild-test loop, all tests without coverage, that the loop with the selected ones, index
+    update included, saves.
+    """
+    impact: dict = {metric: _query_times(workloads, run_ids, metric)[2] for metric in IMPACT_METRICS}
+    keys: set[tuple] = {key[:4] for times in impact.values() for key in times if key[4] == IMPACT_PHASE}
+    if not keys:
+        return
+    #fi
+    configurations: list[tuple] = sorted({key[2] for key in keys})
+    headers: list[str] = ['Tool', '#Tests', 'Selected tests', 'Rebuild plain / coverage (s)', 'Full run plain / coverage (s)',
+                          'Selection (s)', 'Selective run (s)', 'Index update (s)', 'Saved (%)', 'Index build (s)', 'Index size (KB)']
+    rows: list[list] = []
+    for (language, tool) in COVERAGE_ADAPTERS:
+        for configuration in configurations:
+            for workload in sorted({key[0] for key in keys if key[1:] == (language, configuration, tool)}):
+                summary: dict = {metric: _summarize_times(times.get((workload, language, configuration, tool, IMPACT_PHASE), []), sampling)
+                                 for metric, times in impact.items()}
+                selective = summary['selective_cycle_time']['avg']
+                plain = summary['plain_cycle_time']['avg']
+                rows.append([
+                    _label(language, tool, configuration, configurations),
+                    workload,
+                    f"{round(summary['selected_tests']['avg'], 1)} ± {round(summary['selected_tests']['stdev'], 1)}",
+                    f"{round(summary['plain_rebuild_time']['avg'], 4)} / {round(summary['rebuild_time']['avg'], 4)}",
+                    f"{round(summary['plain_time']['avg'], 4)} / {round(summary['full_time']['avg'], 4)}",
+                    f"{round(summary['select_time']['avg'], 4)} ± {round(summary['select_time']['stdev'], 4)}",
+                    f"{round(summary['selective_time']['avg'], 4)} ± {round(summary['selective_time']['stdev'], 4)}"
+                    if summary['selective_time']['samples'] else "no tests run",
+                    f"{round(summary['index_update_time']['avg'], 4)} ± {round(summary['index_update_time']['stdev'], 4)}",
+                    round((1 - _ratio(selective, plain)) * 100, 1),
+                    round(summary['index_time']['avg'], 4),
+                    round(summary['index_bytes']['avg'] / 1024, 1),
+                ])
+            #rof
+        #rof
+    #rof
+    print(f"Coverage-driven test impact selection after an edit of a covered line, all tests against the tests covering it; "
+          f"Saved compares the loop with the selected tests, index update included, with the plain edit-rebuild-test loop "
+          f"with all tests and no coverage ({sampling['estimator']})")
+    print(tabulate(rows, headers=headers, tablefmt="simple_outline"))
+    print("\n")
+#fed
+
+def _query_test_latencies(
+    workloads: list[int],
+    run_ids: list[str],
+)->dict:
+    """
+    Queries the results store for the per-test durations of every tool, configuration and workload, keyed
+    by (workload, language, configuration, tool) and then by test, with the durations of all repetitions.
+    """
+    query = f"SELECT workload, language, tool, test, duration, {', '.join(DIMENSIONS)} FROM test_latencies WHERE 1"
+    params: list = []
+    if workloads:
+        query += f" AND workload IN ({', '.join('?' * len(workloads))})"
+        params.extend(workloads)
+    #fi
+    if run_ids:
+        query += f" AND run_id IN ({', '.join('?' * len(run_ids))})"
+        params.extend(run_ids)
+    #fi
+    latencies: dict = {}
+    with contextlib.closing(_connect_results()) as conn:
+        for workload, language, tool, test, duration, *configuration in conn.execute(query, params):
+            latencies.setdefault((workload, language, tuple(configuration), tool), {}).setdefault(test, []).append(duration)
+        #rof
+    #htiw
+    return latencies
+#fed
+
+def _percentile(
+    values: list[float],
+    q: float,
+)->float:
+    """
+    Returns the q-th percentile of values, interpolated linearly between the closest ranks, or nan without values.
+    """
+    if not values:
+        return math.nan
+    #fi
+    values = sorted(values)
+    rank = (len(values) - 1) * q / 100
+    low = math.floor(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
 #fed
 
-def process_log_file(
-    log_file: Path,
+def _print_test_latencies(
+    latencies: dict,
     workloads: list[int],
+    configurations: list[tuple],
+    tools: dict,
+    baselines: dict,
 )->None:
-    data: dict = {}
-    with open(log_file, "r+") as file:
-        file_contents = file.read()
-        for workload in workloads:
-            data[workload] = {}
-            data[workload]['Rust'] = {}
-            data[workload]['Rust']['avg'] = math.nan
-            data[workload]['Rust']['stdev'] = math.nan
-            data[workload]['Cpp'] = {}
-            data[workload]['Cpp']['avg'] = math.nan
-            data[workload]['Cpp']['stdev'] = math.nan
-            data[workload]['Cpp']['gcov'] = {}
-            data[workload]['Cpp']['gcov']['avg'] = math.nan
-            data[workload]['Cpp']['gcov']['stdev'] = math.nan
-            for tool in RUST_COVERAGE_TOOLS:
-                data[workload]['Rust'][tool] = {}
-                data[workload]['Rust'][tool]['avg'] = math.nan
-                data[workload]['Rust'][tool]['stdev'] = math.nan 
-                match = re.findall(f'Rust_With_Coverage_{tool}_{workload}_exec_time:\s+([\d.]+)s', file_contents)
-                if match:
-                    exec_times: list[float] = [float(i) for i in match]
-                    data[workload]['Rust'][tool]['avg'] = mean(exec_times)
-                    data[workload]['Rust'][tool]['stdev'] = stdev(exec_times)
-                #fi
+    """
+    Prints the LATENCY_PERCENTILES of the per-test latencies with and without coverage, and of the per-test
+    overhead ratios, the mean duration of each test with a tool over its mean duration with the baseline.
+    Evenly spread overhead gives similar ratio percentiles, overhead concentrated in a few tests a long tail.
+    """
+    percentiles = " / ".join(f"p{q}" for q in LATENCY_PERCENTILES)
+    headers: list[str] = ['#Tests'] + [str(workload) for workload in workloads]
+    latency_rows: list[list] = []
+    ratio_rows: list[list] = []
+    for language in baselines:
+        for configuration in configurations:
+            for tool in baselines[language] + tools.get(language, []):
+                label = _label(language, None if tool == 'none' else tool, configuration, configurations)
+                latency_rows.append([label])
+                for workload in workloads:
+                    durations = [duration for test_durations in latencies.get((workload, language, configuration, tool), {}).values()
+                                 for duration in test_durations]
+                    latency_rows[-1].append(" / ".join(str(round(_percentile(durations, q) * 1e6, 1)) for q in LATENCY_PERCENTILES))
+                #rof
+            #rof
+            for tool in tools.get(language, []):
+                ratio_rows.append([_label(language, tool, configuration, configurations)])
+                for workload in workloads:
+                    with_coverage = latencies.get((workload, language, configuration, tool), {})
+                    without_coverage = latencies.get((workload, language, configuration, _adapter(language, tool).baseline), {})
+                    ratios: list[float] = [mean(with_coverage[test]) / mean(without_coverage[test])
+                                           for test in with_coverage.keys() & without_coverage.keys() if mean(without_coverage[test])]
+                    ratio_rows[-1].append(" / ".join(str(round(_percentile(ratios, q), 2)) for q in LATENCY_PERCENTILES))
+                #rof
+            #rof
+        #rof
+    #rof
+    print(f"Per-test latency {percentiles} in microseconds")
+    print(tabulate(latency_rows, headers=headers, tablefmt="simple_outline"))
+    print(f"\n\nPer-test coverage overhead {percentiles} as a ratio of per-test latency with and without coverage")
+    print(tabulate(ratio_rows, headers=headers, tablefmt="simple_outline"))
+    print("\n")
+#fed
+
+def _query_sequences(
+    workloads: list[int],
+    run_ids: list[str],
+    metric: str = 'wall_time',
+)->dict:
+    """
+    Queries the results store for metric of the test phase of every run measured at a known position
+    of its session, keyed by (workload, language, configuration, tool) and then by that position.
+    """
+    query = (f"SELECT workload, language, tool, sequence, value, {', '.join(DIMENSIONS)} FROM measurements "
+             f"WHERE metric = ? AND phase = 'test' AND sequence > 0")
+    params: list = [metric]
+    if workloads:
+        query += f" AND workload IN ({', '.join('?' * len(workloads))})"
+        params.extend(workloads)
+    #fi
+    if run_ids:
+        query += f" AND run_id IN ({', '.join('?' * len(run_ids))})"
+        params.extend(run_ids)
+    #fi
+    sequences: dict = {}
+    with contextlib.closing(_connect_results()) as conn:
+        for workload, language, tool, sequence, value, *configuration in conn.execute(query, params):
+            sequences.setdefault((workload, language, tuple(configuration), tool), {}).setdefault(sequence, []).append(value)
+        #rof
+    #htiw
+    return sequences
+#fed
+
+def _print_drift(
+    sequences: dict,
+    workloads: list[int],
+    configurations: list[tuple],
+    tools: dict,
+    baselines: dict,
+)->None:
+    """
+    Prints the drift of the test phase of every tool, the slope of its samples over their position in the
+    measurement order relative to their mean, with its t-value. Interleaved orders cancel linear drift in the
+    overhead ratios, a fixed order leaves it in them, so |t| well above 2 under a fixed order calls for
+    --order abba or latin. Sessions are pooled, pass a single RUN_ID to check one session.
+    """
+    headers: list[str] = ['Tool', '#Tests', 'Runs', 'Drift per run (%)', 't']
+    rows: list[list] = []
+    for language in baselines:
+        for configuration in configurations:
+            for tool in baselines[language] + tools.get(language, []):
+                for workload in workloads:
+                    samples = sequences.get((workload, language, configuration, tool), {})
+                    if not samples:
+                        continue
+                    #fi
+                    fit = _fit_cost_model(samples)
+                    level = mean(value for values in samples.values() for value in values)
+                    rows.append([
+                        _label(language, None if tool == 'none' else tool, configuration, configurations), workload,
+                        sum(len(values) for values in samples.values()),
+                        round(fit['per_test'] / level * 100, 3) if level else math.nan,
+                        round(fit['per_test'] / fit['per_test_se'], 2) if fit['per_test_se'] else math.nan,
+                    ])
+                #rof
             #rof
-            match = re.findall(f'Rust_Without_Coverage_{workload}_exec_time:\s+([\d.]+)s', file_contents)
-            if match:
-                exec_times: list[float] = [float(i) for i in match]
-                data[workload]['Rust']['avg'] = mean(exec_times)
-                data[workload]['Rust']['stdev'] = stdev(exec_times)
+        #rof
+    #rof
+    print("Test execution drift: slope over the measurement order relative to the mean")
+    print(tabulate(rows, headers=headers, tablefmt="simple_outline"))
+    print("\n")
+#fed
+
+def _query_tool_versions(
+    run_ids: list[str],
+)->dict:
+    """
+    Queries the results store for the toolchain versions the sessions run_ids measured with, keyed by
+    (language, tool), each shortened to the first line of its version output.
+    """
+    query = "SELECT DISTINCT language, tool, tool_version FROM measurements WHERE 1"
+    if run_ids:
+        query += f" AND run_id IN ({', '.join('?' * len(run_ids))})"
+    #fi
+    versions: dict = {}
+    with contextlib.closing(_connect_results()) as conn:
+        for language, tool, tool_version in conn.execute(query, run_ids or []):
+            versions.setdefault((language, tool), set()).add(tool_version.splitlines()[0] if tool_version else "unknown")
+        #rof
+    #htiw
+    return {key: ", ".join(sorted(values)) for key, values in versions.items()}
+#fed
+
+def compare_results(
+    baseline_run_ids: list[str],
+    candidate_run_ids: list[str],
+    metric: str = 'wall_time',
+    sampling: dict = None,
+    threshold: float = REGRESSION_THRESHOLD,
+)->bool:
+    """
+    Compares the coverage overhead ratios of metric recorded by the sessions candidate_run_ids with those of
+    the sessions baseline_run_ids, e.g. before and after a toolchain upgrade, for every phase, tool,
+    configuration and workload both recorded. Prints the toolchain versions of both and the change of every
+    ratio with its bootstrap confidence interval and p-value. Returns whether any ratio regressed, i.e. grew
+    by more than threshold with a confidence interval above no change.
+    """
+    sampling = {**SAMPLING_DEFAULTS, **(sampling or {})}
+    _, baseline_configurations, baseline_times = _query_times([], baseline_run_ids, metric)
+    _, candidate_configurations, candidate_times = _query_times([], candidate_run_ids, metric)
+    configurations: list[tuple] = sorted(set(baseline_configurations) | set(candidate_configurations))
+
+    baseline_versions = _query_tool_versions(baseline_run_ids)
+    candidate_versions = _query_tool_versions(candidate_run_ids)
+    version_rows: list[list] = []
+    for key in sorted(baseline_versions.keys() | candidate_versions.keys()):
+        if key not in baseline_versions or key not in candidate_versions:
+            status = "missing"
+        else:
+            status = "" if baseline_versions[key] == candidate_versions[key] else "changed"
+        #fi
+        version_rows.append([f"{key[0]} ({key[1]})", baseline_versions.get(key, ""), candidate_versions.get(key, ""), status])
+    #rof
+    print("Toolchain versions")
+    print(tabulate(version_rows, headers=['Tool', 'Baseline', 'Candidate', ''], tablefmt="simple_outline"))
+    print("\n")
+
+    regressed = False
+    compared = 0
+    rows: list[list] = []
+    cells = sorted({key[:4] for key in baseline_times.keys() | candidate_times.keys()})
+    for phase in PHASES + ['total']:
+        for workload, language, configuration, tool in cells:
+            adapter = _adapter(language, tool)
+            if adapter.baseline is None:
+                continue
             #fi
-            match = re.findall(f'Cpp_Without_Coverage_{workload}_exec_time:\s+([\d.]+)s', file_contents)
-            if match:
-                exec_times: list[float] = [float(i) for i in match]
-                data[workload]['Cpp']['avg'] = mean(exec_times)
-                data[workload]['Cpp']['stdev'] = stdev(exec_times)
+            samples: list[list[float]] = [
+                times.get((workload, language, configuration, key_tool, phase), [])
+                for times in [baseline_times, candidate_times]
+                for key_tool in [tool, adapter.baseline]
+            ]
+            label = _label(language, tool, configuration, configurations)
+            if not all(samples):
+                # Rows only one side recorded are listed so that a missing tool or workload is not mistaken for no change.
+                for side, other, ratio_samples in [("baseline", "candidate", samples[:2]), ("candidate", "baseline", samples[2:])]:
+                    if all(ratio_samples):
+                        ratio = round(_ratio(_estimate(ratio_samples[0], sampling['estimator']), _estimate(ratio_samples[1], sampling['estimator'])), 2)
+                        rows.append([label, workload, phase, *([ratio, ""] if side == "baseline" else ["", ratio]), "", "", f"missing in {other}"])
+                    #fi
+                #rof
+                continue
             #fi
-            match = re.findall(f'Cpp_With_Coverage_{workload}_exec_time:\s+([\d.]+)s', file_contents)
-            if match:
-                exec_times: list[float] = [float(i) for i in match]
-                data[workload]['Cpp']['gcov']['avg'] = mean(exec_times)
-                data[workload]['Cpp']['gcov']['stdev'] = stdev(exec_times)
+            baseline_ratio = _ratio(_estimate(samples[0], sampling['estimator']), _estimate(samples[1], sampling['estimator']))
+            candidate_ratio = _ratio(_estimate(samples[2], sampling['estimator']), _estimate(samples[3], sampling['estimator']))
+            change = _ratio(candidate_ratio, baseline_ratio) - 1
+            if math.isnan(change):
+                # A metric that is 0 without coverage, or in the baseline with coverage, has no ratio to compare.
+                rows.append([label, workload, phase, round(baseline_ratio, 2), round(candidate_ratio, 2), "", "", "not comparable"])
+                continue
             #fi
+            compared += 1
+            low, high, p_value = _bootstrap_ratio_change((samples[0], samples[1]), (samples[2], samples[3]), sampling)
+            verdict = ""
+            if low > 1 and change > threshold:
+                verdict = "regressed"
+                regressed = True
+            elif high < 1 and change < -threshold:
+                verdict = "improved"
+            #fi
+            rows.append([
+                label, workload, phase,
+                round(baseline_ratio, 2), round(candidate_ratio, 2),
+                f"{round(change * 100, 1)} [{round((low - 1) * 100, 1)}, {round((high - 1) * 100, 1)}]",
+                round(p_value, 3), verdict,
+            ])
         #rof
-    #htiw
+    #rof
+    print(f"Change of the coverage overhead as a ratio of {metric} with and without coverage, candidate over baseline "
+          f"({sampling['estimator']}, {round(sampling['confidence'] * 100)}% CI, regression threshold {round(threshold * 100, 1)}%)")
+    print(tabulate(rows, headers=['Tool', '#Tests', 'Phase', 'Baseline', 'Candidate', 'Change (%)', 'p', ''], tablefmt="simple_outline"))
+    if not compared:
+        print(f"The sessions share no tool, configuration, workload and phase with {metric} recorded with and without "
+              f"coverage in both, so there is nothing to compare.")
+    #fi
+    print("\n")
+    return regressed
+#fed
 
-    headers: list[str] = [str(i) for i in workloads]
-    headers.insert(0, '#Tests')
-    coverage_overhead: list[list] = [None] * (len(RUST_COVERAGE_TOOLS) + 1)
-    test_times_no_coverage: list[list] = [None] * 2 
-    test_times_with_coverage: list[list] = [None] * (len(RUST_COVERAGE_TOOLS) + 1)
+def _workload(
+    value: str,
+)->int:
+    """
+    Parses a workload, a positive number of tests such as 2500 or 1_000_000, from the command line.
+    """
+    workload = int(value)
+    if workload < 1:
+        raise argparse.ArgumentTypeError(f"workload must be a positive number of tests, not {value}")
+    #fi
+    return workload
+#fed
+
+def _positive_int(
+    value: str,
+)->int:
+    """
+    Parses a positive count, such as a number of shards, from the command line.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive number, not {value}")
+    #fi
+    return number
+#fed
 
-    for idx,tool in enumerate(RUST_COVERAGE_TOOLS):
-        coverage_overhead[idx] = []
-        test_times_with_coverage[idx] = []
+def _non_negative_int(
+    value: str,
+)->int:
+    """
+    Parses a count that may be zero, such as a number of warmup runs, from the command line.
+    """
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, not {value}")
+    #fi
+    return number
+#fed
 
-        coverage_overhead[idx].append(f'Rust ({tool})')
-        test_times_with_coverage[idx].append(f'Rust ({tool})')
+def _confidence_level(
+    value: str,
+)->float:
+    """
+    Parses a confidence level, which lies strictly between 0 and 1, from the command line.
+    """
+    level = float(value)
+    if not 0 < level < 1:
+        raise argparse.ArgumentTypeError(f"must lie strictly between 0 and 1, not {value}")
+    #fi
+    return level
+#fed
 
-        for workload in workloads:
-            coverage_overhead[idx].append(round(data[workload]['Rust'][tool]['avg'] / data[workload]['Rust']['avg'], 2))
-            test_times_with_coverage[idx].append(f"{round(data[workload]['Rust'][tool]['avg'], 4)} \u00B1 {round(data[workload]['Rust'][tool]['stdev'], 4)}")
+def geometric_workloads(
+    start: int,
+    stop: int,
+    points: int,
+)->list[int]:
+    """
+    Returns up to points workloads spaced geometrically from start to stop, both included.
+    """
+    if points < 2 or start == stop:
+        return [start]
+    #fi
+    ratio = (stop / start) ** (1 / (points - 1))
+    return sorted({round(start * ratio ** i) for i in range(points)})
+#fed
+
+def _fit_cost_model(
+    times: dict,
+)->dict:
+    """
+    Fits time = fixed + per_test * workload by least squares to the samples in times, keyed by workload,
+    and returns both coefficients with their standard errors (nan with fewer than three samples).
+    """
+    points: list[tuple] = [(workload, value) for workload, samples in times.items() for value in samples]
+    fit: dict = {'fixed': math.nan, 'per_test': math.nan, 'fixed_se': math.nan, 'per_test_se': math.nan}
+    if len({workload for workload, _ in points}) < 2:
+        return fit
+    #fi
+    n = len(points)
+    mean_x = mean(x for x, _ in points)
+    mean_y = mean(y for _, y in points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    fit['per_test'] = sxy / sxx
+    fit['fixed'] = mean_y - fit['per_test'] * mean_x
+    if n > 2:
+        residual_variance = sum((y - fit['fixed'] - fit['per_test'] * x) ** 2 for x, y in points) / (n - 2)
+        fit['per_test_se'] = math.sqrt(residual_variance / sxx)
+        fit['fixed_se'] = math.sqrt(residual_variance * (1 / n + mean_x ** 2 / sxx))
+    #fi
+    return fit
+#fed
+
+def _label(
+    language: str,
+    tool: str,
+    configuration: tuple,
+    configurations: list[tuple],
+)->str:
+    """
+    Returns the table label of a language, tool and configuration, naming only the dimensions whose
+    values differ between the configurations.
+    """
+    names: list[str] = [tool] if tool else []
+    for i, dimension in enumerate(DIMENSIONS):
+        if len({other[i] for other in configurations}) > 1:
+            names.append(f'{dimension}={configuration[i]}')
+        #fi
+    #rof
+    return f"{language} ({', '.join(names)})" if names else language
+#fed
+
+def _print_cost_models(
+    times: dict,
+    workloads: list[int],
+    configurations: list[tuple],
+    tools: dict,
+    phase: str,
+    extrapolate: list[int],
+)->None:
+    """
+    Prints the fixed and per-test coverage overhead of every tool in phase, from cost models fitted
+    to the times of the tool and of its baseline, and the overhead ratios they predict at the
+    extrapolate workloads.
+    """
+    headers: list[str] = ['Tool', 'Fixed overhead (s)', 'Per-test overhead (µs)', 'Per-test ratio']
+    headers.extend(f'Predicted ratio at {workload}' for workload in extrapolate)
+    rows: list[list] = []
+    for language in tools:
+        for configuration in configurations:
+            for tool in tools[language]:
+                baseline_tool = _adapter(language, tool).baseline
+                baseline = _fit_cost_model({workload: times.get((workload, language, configuration, baseline_tool, phase), []) for workload in workloads})
+                fit = _fit_cost_model({workload: times.get((workload, language, configuration, tool, phase), []) for workload in workloads})
+                row: list = [_label(language, tool, configuration, configurations)]
+                row.append(f"{round(fit['fixed'] - baseline['fixed'], 4)} ± {round(math.hypot(fit['fixed_se'], baseline['fixed_se']), 4)}")
+                row.append(f"{round((fit['per_test'] - baseline['per_test']) * 1e6, 3)} ± {round(math.hypot(fit['per_test_se'], baseline['per_test_se']) * 1e6, 3)}")
+                row.append(round(fit['per_test'] / baseline['per_test'], 2) if baseline['per_test'] else math.nan)
+                for workload in extrapolate:
+                    predicted_baseline = baseline['fixed'] + baseline['per_test'] * workload
+                    row.append(round((fit['fixed'] + fit['per_test'] * workload) / predicted_baseline, 2) if predicted_baseline else math.nan)
+                #rof
+                rows.append(row)
+            #rof
         #rof
     #rof
+    print(f"Cost model of the {phase} phase: time = fixed + per-test × #tests, fitted over {len(workloads)} workloads")
+    print(tabulate(rows, headers=headers, tablefmt="simple_outline"))
+    print("\n")
+#fed
 
-    coverage_overhead[idx+1] = []
-    test_times_with_coverage[idx+1] = []
-    coverage_overhead[idx+1].append('Cpp (gcov)')    
-    test_times_with_coverage[idx+1].append('Cpp (gcov)')
-    for workload in workloads:
-        coverage_overhead[idx+1].append(round(data[workload]['Cpp']['gcov']['avg'] / data[workload]['Cpp']['avg'], 2))
-        test_times_with_coverage[idx+1].append(f"{round(data[workload]['Cpp']['gcov']['avg'], 4)} \u00B1 {round(data[workload]['Cpp']['gcov']['stdev'], 4)}")
+def _svg_chart(
+    path: Path,
+    title: str,
+    y_label: str,
+    series: dict,
+)->None:
+    """
+    Writes a line chart over the workloads, on a logarithmic axis, to the SVG file path. series maps each
+    label to its points, (workload, value, low, high) tuples whose low and high, unless nan, are drawn as
+    an error bar.
+    """
+    width, height = 900, 480
+    left, right, top, bottom = 80, 260, 40, 60
+    points = [point for values in series.values() for point in values if not math.isnan(point[1])]
+    xs = sorted({point[0] for point in points}) or [1]
+    ys = [value for point in points for value in point[1:] if not math.isnan(value)] or [0.0, 1.0]
+    x_min, x_max = math.log10(xs[0]), math.log10(xs[-1])
+    y_min, y_max = min(0.0, min(ys)), max(ys) * 1.05 or 1.0
+    if x_max == x_min:
+        x_min, x_max = x_min - 0.5, x_max + 0.5
+    #fi
+    def x_position(workload: float)->float:
+        return left + (math.log10(workload) - x_min) / (x_max - x_min) * (width - left - right)
+    #fed
+    def y_position(value: float)->float:
+        return height - bottom - (value - y_min) / (y_max - y_min) * (height - top - bottom)
+    #fed
+
+    elements: list[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" font-family="sans-serif" font-size="12">',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        f'<text x="{width / 2}" y="20" text-anchor="middle" font-size="14">{html.escape(title)}</text>',
+        f'<line x1="{left}" y1="{height - bottom}" x2="{width - right}" y2="{height - bottom}" stroke="black"/>',
+        f'<line x1="{left}" y1="{top}" x2="{left}" y2="{height - bottom}" stroke="black"/>',
+        f'<text x="{(left + width - right) / 2}" y="{height - 15}" text-anchor="middle">#Tests</text>',
+        f'<text x="20" y="{(top + height - bottom) / 2}" text-anchor="middle" transform="rotate(-90 20 {(top + height - bottom) / 2})">{html.escape(y_label)}</text>',
+    ]
+    # Dense sweeps get ticks at 1, 2 and 5 times the powers of ten instead of one per workload.
+    ticks = xs if len(xs) <= 10 else [
+        tick for tick in (multiple * 10 ** exponent for exponent in range(math.floor(x_min), math.ceil(x_max) + 1) for multiple in [1, 2, 5])
+        if xs[0] <= tick <= xs[-1]
+    ]
+    for workload in ticks:
+        elements.append(f'<line x1="{x_position(workload):.1f}" y1="{height - bottom}" x2="{x_position(workload):.1f}" y2="{height - bottom + 5}" stroke="black"/>')
+        elements.append(f'<text x="{x_position(workload):.1f}" y="{height - bottom + 18}" text-anchor="middle">{workload}</text>')
     #rof
-    
-    test_times_no_coverage[0] = []
-    test_times_no_coverage[0].append('Rust')
-    for workload in workloads:
-        test_times_no_coverage[0].append(f"{round(data[workload]['Rust']['avg'], 4)} \u00B1 {round(data[workload]['Rust']['stdev'], 4)}")
+    for i in range(6):
+        value = y_min + (y_max - y_min) * i / 5
+        elements.append(f'<line x1="{left}" y1="{y_position(value):.1f}" x2="{width - right}" y2="{y_position(value):.1f}" stroke="#e0e0e0"/>')
+        elements.append(f'<text x="{left - 6}" y="{y_position(value) + 4:.1f}" text-anchor="end">{value:.3g}</text>')
+    #rof
+    for i, (label, values) in enumerate(series.items()):
+        color = CHART_COLORS[i % len(CHART_COLORS)]
+        values = sorted(point for point in values if not math.isnan(point[1]))
+        if len(values) > 1:
+            coordinates = " ".join(f"{x_position(x):.1f},{y_position(y):.1f}" for x, y, _, _ in values)
+            elements.append(f'<polyline points="{coordinates}" fill="none" stroke="{color}" stroke-width="2"/>')
+        #fi
+        for x, y, low, high in values:
+            if not math.isnan(low) and not math.isnan(high):
+                elements.append(f'<line x1="{x_position(x):.1f}" y1="{y_position(low):.1f}" x2="{x_position(x):.1f}" y2="{y_position(high):.1f}" stroke="{color}"/>')
+            #fi
+            elements.append(f'<circle cx="{x_position(x):.1f}" cy="{y_position(y):.1f}" r="3" fill="{color}"><title>{html.escape(label)}: {y:.6g}</title></circle>')
+        #rof
+        legend_y = top + 10 + 18 * i
+        elements.append(f'<rect x="{width - right + 15}" y="{legend_y - 9}" width="12" height="12" fill="{color}"/>')
+        elements.append(f'<text x="{width - right + 32}" y="{legend_y + 2}">{html.escape(label)}</text>')
+    #rof
+    elements.append('</svg>')
+    path.write_text("\n".join(elements) + "\n")
+#fed
+
+def export_results(
+    data: dict,
+    configurations: list[tuple],
+    tools: dict,
+    baselines: dict,
+    metric: str,
+    sampling: dict,
+    export_dir: Path,
+)->None:
+    """
+    Writes the summaries process_results computed in data to export_dir at full precision: <metric>.csv
+    and <metric>.json with the estimate, standard deviation, overhead ratio and its confidence interval of
+    every workload, language, configuration, tool and phase, the JSON with the raw samples too, the raw
+    samples alone in <metric>_samples.csv, and per phase SVG charts of the metric and of the overhead
+    ratios over the workloads.
+    """
+    export_dir.mkdir(parents=True, exist_ok=True)
+    columns: list[str] = ['workload', 'language', *DIMENSIONS, 'tool', 'baseline', 'phase', 'metric', 'n',
+                          'estimate', 'stdev', 'ratio', 'ratio_ci_low', 'ratio_ci_high']
+    records: list[dict] = []
+    charts: dict = {}
+    for workload, languages in data.items():
+        for language, language_data in languages.items():
+            for configuration, configuration_data in language_data.items():
+                for tool, phases in configuration_data.items():
+                    baseline = _adapter(language, tool).baseline
+                    label = _label(language, None if tool == 'none' else tool, configuration, configurations)
+                    for phase, summary in phases.items():
+                        if not summary['samples']:
+                            continue
+                        #fi
+                        ratio, low, high = _overhead_ratio(summary, configuration_data[baseline][phase], sampling) \
+                            if baseline in configuration_data else (math.nan, math.nan, math.nan)
+                        records.append({
+                            'workload': workload, 'language': language, **dict(zip(DIMENSIONS, configuration)),
+                            'tool': tool, 'baseline': baseline or "", 'phase': phase, 'metric': metric,
+                            'n': len(summary['samples']), 'estimate': summary['avg'], 'stdev': summary['stdev'],
+                            'ratio': ratio, 'ratio_ci_low': low, 'ratio_ci_high': high, 'samples': summary['samples'],
+                        })
+                        charts.setdefault(phase, ({}, {}))[0].setdefault(label, []).append((workload, summary['avg'], math.nan, math.nan))
+                        if baseline:
+                            charts[phase][1].setdefault(label, []).append((workload, ratio, low, high))
+                        #fi
+                    #rof
+                #rof
+            #rof
+        #rof
+    #rof
+
+    with open(export_dir / f"{metric}.csv", 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for record in records:
+            writer.writerow({column: "" if isinstance(value, float) and math.isnan(value) else value for column, value in record.items()})
+        #rof
+    #htiw
+    with open(export_dir / f"{metric}_samples.csv", 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['workload', 'language', *DIMENSIONS, 'tool', 'phase', 'metric', 'sample', 'value'])
+        for record in records:
+            for i, value in enumerate(record['samples']):
+                writer.writerow([record['workload'], record['language'], *(record[dimension] for dimension in DIMENSIONS),
+                                 record['tool'], record['phase'], metric, i, value])
+            #rof
+        #rof
+    #htiw
+    # JSON has no nan, missing values are null.
+    with open(export_dir / f"{metric}.json", 'w') as f:
+        json.dump([{key: None if isinstance(value, float) and math.isnan(value) else value for key, value in record.items()}
+                   for record in records], f, indent=2)
+    #htiw
+    for phase, (values, ratios) in charts.items():
+        _svg_chart(export_dir / f"{metric}_{phase}.svg", f"{phase} {metric}", metric, values)
+        if any(not math.isnan(point[1]) for points in ratios.values() for point in points):
+            _svg_chart(export_dir / f"{metric}_{phase}_overhead.svg",
+                       f"{phase} coverage overhead of {metric} ({round(sampling['confidence'] * 100)}% CI)", "ratio", ratios)
+        #fi
+    #rof
+    logger.info(f"Exported {len(records)} summaries of {metric} to {export_dir}.")
+#fed
+
+def process_results(
+    workloads: list[int],
+    run_ids: list[str],
+    metric: str = 'wall_time',
+    sampling: dict = None,
+    extrapolate: list[int] = None,
+    export_dir: Path = None,
+)->None:
+    """
+    Prints metric and its coverage overhead per phase and configuration from the results store, estimated with the
+    estimator of sampling and with bootstrap confidence intervals for the overhead ratios, followed by
+    the fixed and per-test overhead of the test execution phase and its ratios at the extrapolate workloads,
+    the calibration and net overhead of the test execution phase if null runs were measured,
+    the compile-time cost of the instrumentation, the test impact selection runs of --test-impact,
+    the overhead in hardware event counts, if they were counted, the percentiles of the per-test latencies
+    and the drift of the test execution phase over the measurement order. With export_dir the summaries are
+    also exported there, see export_results.
+    Without workloads all recorded workloads are shown, without run_ids the sessions are combined.
+    """
+    sampling = {**SAMPLING_DEFAULTS, **(sampling or {})}
+    workloads, configurations, times = _query_times(workloads, run_ids, metric)
+    # Null runs are only shown as the calibration.
+    workloads = [workload for workload in workloads if workload != NULL_WORKLOAD]
+    recorded = {(key[1], key[3]) for key in times}
+    tools: dict = {}
+    baselines: dict = {}
+    for (language, tool), adapter in COVERAGE_ADAPTERS.items():
+        if (language, tool) in recorded:
+            if adapter.baseline is None:
+                baselines.setdefault(language, []).append(tool)
+            else:
+                tools.setdefault(language, []).append(tool)
+                baselines.setdefault(language, [])
+            #fi
+        #fi
     #rof
-    test_times_no_coverage[1] = []
-    test_times_no_coverage[1].append('Cpp')
+    data: dict = {}
     for workload in workloads:
-        test_times_no_coverage[1].append(f"{round(data[workload]['Cpp']['avg'], 4)} \u00B1 {round(data[workload]['Cpp']['stdev'], 4)}")
+        data[workload] = {}
+        for language in baselines:
+            data[workload][language] = {}
+            for configuration in configurations:
+                data[workload][language][configuration] = {}
+                for tool in baselines[language] + tools.get(language, []):
+                    data[workload][language][configuration][tool] = {}
+                    for phase in PHASES + ['total']:
+                        data[workload][language][configuration][tool][phase] = _summarize_times(
+                            times.get((workload, language, configuration, tool, phase), []), sampling)
+                    #rof
+                #rof
+            #rof
+        #rof
     #rof
-    
-    print("Execution times in seconds for tests with coverage")
-    print(tabulate(test_times_with_coverage, headers=headers, tablefmt="simple_outline"))
+    if export_dir is not None:
+        export_results(data, configurations, tools, baselines, metric, sampling, export_dir)
+    #fi
 
-    print("\n\nExecution times in seconds for tests without coverage")
-    print(tabulate(test_times_no_coverage, headers=headers, tablefmt="simple_outline"))
+    headers: list[str] = [str(i) for i in workloads]
+    headers.insert(0, '#Tests')
+    phase_names: dict = {
+        'build': 'Build',
+        'rebuild': 'Rebuild after an edit',
+        'test': 'Test execution',
+        'report': 'Coverage report',
+        'total': 'Total',
+    }
+    metric_names: dict = {
+        'wall_time': 'times in seconds',
+        'user_time': 'user CPU times in seconds',
+        'sys_time': 'system CPU times in seconds',
+        'max_rss': 'peak memory in kilobytes',
+        'minor_faults': 'minor page faults',
+        'major_faults': 'major page faults',
+        'voluntary_switches': 'voluntary context switches',
+        'involuntary_switches': 'involuntary context switches',
+        'block_inputs': 'block input operations',
+        'block_outputs': 'block output operations',
+        'instructions': 'instructions',
+        'cycles': 'cycles',
+        'branch_misses': 'branch misses',
+        'cache_misses': 'cache misses',
+        BINARY_SIZE: 'test binary sizes in bytes',
+        'artifact_count': 'numbers of coverage artifacts',
+        'artifact_bytes': 'coverage artifact sizes in bytes',
+        'exit_time': 'times in seconds outside the tests (startup and exit)',
+        'merge_time': 'profile merge times in seconds',
+        HARNESS_TIME: 'harness overhead times in seconds',
+    }
 
-    
-    print("\n\nCoverage overhead as a ratio of execution time with and without coverage")
-    print(tabulate(coverage_overhead, headers=headers, tablefmt="simple_outline"))
+    # Sessions without a rebuild target have no rebuild phase to show.
+    for phase in [phase for phase in PHASES + ['total'] if phase != 'rebuild' or any(key[4] == 'rebuild' for key in times)]:
+        coverage_overhead: list[list] = []
+        test_times_no_coverage: list[list] = []
+        test_times_with_coverage: list[list] = []
+
+        for language in baselines:
+            for configuration in configurations:
+                for tool in tools.get(language, []):
+                    label = _label(language, tool, configuration, configurations)
+                    coverage_overhead.append([label])
+                    test_times_with_coverage.append([label])
+                    for workload in workloads:
+                        phases = data[workload][language][configuration][tool]
+                        summary = phases[phase]
+                        baseline = data[workload][language][configuration].get(_adapter(language, tool).baseline)
+                        if _cached_build(phases, phase) or (baseline and _cached_build(baseline, phase)):
+                            coverage_overhead[-1].append(CACHED)
+                        else:
+                            coverage_overhead[-1].append(_overhead(summary, baseline[phase], sampling) if baseline else math.nan)
+                        #fi
+                        test_times_with_coverage[-1].append(CACHED if _cached_build(phases, phase) else
+                                                            f"{round(summary['avg'], 4)} \u00B1 {round(summary['stdev'], 4)}")
+                    #rof
+                #rof
+                for tool in baselines[language]:
+                    test_times_no_coverage.append([_label(language, None if tool == 'none' else tool, configuration, configurations)])
+                    for workload in workloads:
+                        phases = data[workload][language][configuration][tool]
+                        test_times_no_coverage[-1].append(CACHED if _cached_build(phases, phase) else
+                                                          f"{round(phases[phase]['avg'], 4)} \u00B1 {round(phases[phase]['stdev'], 4)}")
+                    #rof
+                #rof
+            #rof
+        #rof
+
+        print(f"{phase_names[phase]} {metric_names[metric]} for tests with coverage")
+        print(tabulate(test_times_with_coverage, headers=headers, tablefmt="simple_outline"))
+
+        # Runs without coverage have no report phase to compare against.
+        if phase != 'report':
+            print(f"\n\n{phase_names[phase]} {metric_names[metric]} for tests without coverage")
+            print(tabulate(test_times_no_coverage, headers=headers, tablefmt="simple_outline"))
+
+            print(f"\n\n{phase_names[phase]} coverage overhead as a ratio of {metric_names[metric]} with and without coverage "
+                  f"({sampling['estimator']}, {round(sampling['confidence'] * 100)}% CI)")
+            print(tabulate(coverage_overhead, headers=headers, tablefmt="simple_outline"))
+        #fi
+        if any(CACHED in row for row in test_times_with_coverage + test_times_no_coverage):
+            print(f"{CACHED}: every run reused a build from an earlier session or built with --jobs above 1; "
+                  "--no-build-cache --jobs 1 times clean builds.")
+        #fi
+        print("\n")
+    #rof
+
+    null_times = _query_times([NULL_WORKLOAD], run_ids, metric)[2]
+    if null_times:
+        _print_calibration(null_times, _query_times([NULL_WORKLOAD], run_ids, HARNESS_TIME)[2], times, workloads, configurations,
+                           tools, baselines, metric, sampling)
+    #fi
+    if len(workloads) > 1:
+        _print_cost_models(times, workloads, configurations, tools, 'test', extrapolate or [])
+    #fi
+    compile_costs: dict = {metric: _query_times(workloads, run_ids, metric)[2] for metric in ['wall_time', 'max_rss']}
+    if any(key[4] in ['build', 'rebuild'] for times in compile_costs.values() for key in times):
+        _print_compile_costs(compile_costs, workloads, configurations, tools, sampling)
+    #fi
+    _print_test_impact(workloads, run_ids, sampling)
+    counts: dict = {metric: _query_times(workloads, run_ids, metric)[2] for metric in PERF_EVENTS.values()}
+    counts = {metric: times for metric, times in counts.items() if times}
+    if counts:
+        _print_counter_overheads(counts, workloads, configurations, tools, sampling)
+    #fi
+    latencies = _query_test_latencies(workloads, run_ids)
+    if latencies:
+        _print_test_latencies(latencies, workloads, configurations, tools, baselines)
+    #fi
+    sequences = _query_sequences(workloads, run_ids, metric)
+    if sequences:
+        _print_drift(sequences, workloads, configurations, tools, baselines)
+    #fi
     #print(json.dumps(data, indent = 4))
 #fed
 
@@ -525,34 +4222,230 @@ if __name__ == "__main__":
                         action='store_true')
     parser.add_argument("--gen-rust-tests",
                         help=f"Generates tests.rs in {RUST_SRC_DIR}/todo_app/rust/src containing workload number of tests.",
-                        choices=WORKLOAD,
-                        type=int,
+                        type=_workload,
                         nargs=1)
     parser.add_argument("--gen-cpp-tests",
                         help=f"Generates tests.cpp in {CPP_SRC_DIR} containing workload number of tests.",
-                        choices=WORKLOAD,
-                        type=int,
+                        type=_workload,
                         nargs=1)
     parser.add_argument("--collect-coverage-overhead-rust",
                         help=f"Collects coverage overheads for Rust coverage tools.",
-                        choices=WORKLOAD,
-                        type=int,
+                        type=_workload,
                         nargs='*')
     parser.add_argument("--collect-coverage-overhead-cpp",
                         help=f"Collects coverage overheads for Cpp coverage tools.",
-                        choices=WORKLOAD,
-                        type=int,
+                        type=_workload,
                         nargs='*')
     parser.add_argument("--collect-coverage-overhead",
                         help=f"Collects coverage overheads for Cpp and Rust coverage tools.",
-                        choices=WORKLOAD,
-                        type=int,
+                        type=_workload,
                         nargs='*')
+    parser.add_argument("--test-impact",
+                        help="Builds an index of the lines of the task sources every test covers, then, --average times, edits a "
+                             "covered line and times running all tests, without coverage and with it, against selecting and running only the tests covering it, "
+                             "and updating the index. Measures the --tools that can read back the coverage of a single test: "
+                             f"{', '.join(sorted({adapter.name for adapter in COVERAGE_ADAPTERS.values() if adapter.per_test_coverage}))}.",
+                        metavar="WORKLOAD",
+                        type=_workload,
+                        nargs='+')
+    parser.add_argument("--workload-sweep",
+                        help=f"Adds POINTS workloads spaced geometrically from START to STOP tests to the collected workloads.",
+                        metavar=("START", "STOP", "POINTS"),
+                        type=_workload,
+                        nargs=3)
+    parser.add_argument("--extrapolate",
+                        help=f"Workloads at which the fitted cost models predict coverage overhead.",
+                        type=_workload,
+                        nargs='+',
+                        default=[])
+    parser.add_argument("--tools",
+                        help="Coverage tools to measure, each against its baseline without coverage.",
+                        choices=sorted({adapter.name for adapter in COVERAGE_ADAPTERS.values() if adapter.baseline}),
+                        nargs='+',
+                        default=DEFAULT_COVERAGE_TOOLS)
+    parser.add_argument("--shards",
+                        help="Numbers of Rust modules or C++ translation units the generated tests are split into. "
+                             "Every number is measured as a separate configuration.",
+                        type=_positive_int,
+                        nargs='+',
+                        default=[DIMENSIONS['shards']])
+    parser.add_argument("--profile",
+                        help=f"Workload profiles of the generated tests: {', '.join(WORKLOAD_PROFILES)}, or parameters "
+                             "such as loop=10000,branch=0.5,io=2 for the number of tasks every test adds to a TaskManager, "
+                             "the fraction of them it completes and how often it saves and loads them. "
+                             "Every profile is measured as a separate configuration.",
+                        type=_workload_profile,
+                        nargs='+',
+                        default=[DIMENSIONS['profile']])
+    parser.add_argument("--threads",
+                        help="Numbers of threads the Rust tests run on (--test-threads) and of gtest shards the C++ "
+                             "tests run in at the same time. Without it, the tests run as the test framework does by default. "
+                             "Every number is measured as a separate configuration.",
+                        type=_positive_int,
+                        nargs='+',
+                        default=[DIMENSIONS['threads']])
+    parser.add_argument("--opt-level",
+                        help="Optimization levels of the builds: -O<level> for C++ and the opt-level of the cargo "
+                             "test profile for Rust. Every level is measured as a separate configuration.",
+                        choices=OPT_LEVELS,
+                        nargs='+',
+                        default=[DIMENSIONS['opt_level']])
+    parser.add_argument("--counter-update",
+                        help="How instrumented builds update coverage counters: -fprofile-update for gcc and clang, "
+                             "atomic LLVM counters for Rust (prefer-atomic is atomic there). default leaves it to the "
+                             "compiler. Every mode is measured as a separate configuration.",
+                        choices=COUNTER_UPDATES,
+                        nargs='+',
+                        default=[DIMENSIONS['counter_update']])
+    parser.add_argument("--artifact-dir",
+                        help=f"Where the tests write coverage data: the build directory, or tmpfs ({TMPFS_DIR}) to "
+                             "take the disk out of the I/O cost. gcov, lcov and the tools built on raw LLVM profiles "
+                             "support tmpfs. Every choice is measured as a separate configuration.",
+                        choices=ARTIFACT_DIRS,
+                        nargs='+',
+                        default=[DIMENSIONS['artifact_dir']])
+    parser.add_argument("--perf",
+                        help="Counts instructions, cycles, branch misses and cache misses of the test phase with perf stat. "
+                             "Hosts where perf is missing or not permitted record rusage metrics only. The times of runs "
+                             "under perf include its overhead and are recorded as the separate configuration counters=perf.",
+                        action='store_true')
     parser.add_argument("--average",
                         help=f"Averages test runs over specified number while collecting coverage",
-                        type=int,
+                        type=_positive_int,
                         nargs=1)
+    parser.add_argument("--jobs",
+                        help=f"Number of processes building variants concurrently. Measurements always run one at a time, "
+                             f"but concurrent builds compete for the cores, so build times are only recorded with the default of 1.",
+                        type=_positive_int,
+                        default=1)
+    parser.add_argument("--warmup",
+                        help="Unrecorded warmup runs of every variant before measuring it.",
+                        type=_non_negative_int,
+                        default=SAMPLING_DEFAULTS['warmup'])
+    parser.add_argument("--estimator",
+                        help=f"Estimator of the times and overhead ratios; trimmed drops {TRIM_FRACTION:.0%}% of the samples at either end.",
+                        choices=['mean', 'median', 'trimmed'],
+                        default=SAMPLING_DEFAULTS['estimator'])
+    parser.add_argument("--bootstrap",
+                        help="Bootstrap resamples for the confidence intervals of the overhead ratios.",
+                        type=_positive_int,
+                        default=SAMPLING_DEFAULTS['bootstrap'])
+    parser.add_argument("--confidence",
+                        help="Confidence level of the overhead ratio confidence intervals.",
+                        type=_confidence_level,
+                        default=SAMPLING_DEFAULTS['confidence'])
+    parser.add_argument("--ci-target",
+                        help="Keeps sampling after --average runs until the confidence interval of every overhead ratio "
+                             "of the test execution phase is narrower than this fraction of the ratio.",
+                        type=float,
+                        default=SAMPLING_DEFAULTS['ci_target'])
+    parser.add_argument("--max-runs",
+                        help="Most runs of a variant with --ci-target.",
+                        type=_positive_int,
+                        default=SAMPLING_DEFAULTS['max_runs'])
+    parser.add_argument("--time-budget",
+                        help="Seconds after which --ci-target stops taking further runs.",
+                        type=float,
+                        default=SAMPLING_DEFAULTS['time_budget'])
+    parser.add_argument("--order",
+                        help="Order of the measured runs: fixed measures every run of a variant before the next one, "
+                             "random shuffles each repetition across variants, abba reverses every other repetition "
+                             "and latin rotates the variants by one position per repetition.",
+                        choices=ORDERS,
+                        default=SAMPLING_DEFAULTS['order'])
+    parser.add_argument("--cpus",
+                        help="Pins every measured run to these CPUs, e.g. isolated ones.",
+                        metavar="CPU",
+                        type=int,
+                        nargs='+',
+                        default=SAMPLING_DEFAULTS['cpus'])
+    parser.add_argument("--timeout",
+                        help="Seconds after which a build, test or report run is killed and marked failed, so that a hung tool "
+                             "does not stall the sweep.",
+                        type=float,
+                        default=SAMPLING_DEFAULTS['timeout'])
+    parser.add_argument("--resume",
+                        help=f"Continues the session RUN_ID in {RESULTS_DB}, skipping the runs it finished. "
+                             "Pass the same collection options as the interrupted session.",
+                        metavar="RUN_ID")
+    parser.add_argument("--rebuild",
+                        help="Before every test run, edits the task sources (tasks.rs, Task.cpp) or the first generated test "
+                             "shard and times the incremental rebuild. Clean builds are timed with --no-build-cache.",
+                        choices=REBUILD_TARGETS,
+                        default=SAMPLING_DEFAULTS['rebuild'])
+    parser.add_argument("--calibrate",
+                        help="Also measures null runs, test binaries without tests, and a null command, and reports the "
+                             "harness overhead, the null run of every tool and the coverage overhead net of the null runs.",
+                        action='store_true')
+    parser.add_argument("--no-build-cache",
+                        help=f"Rebuilds every run from scratch instead of reusing builds cached in {CACHE_DIR}.",
+                        action='store_true')
+    parser.add_argument("--process-results",
+                        help=f"Prints times and coverage overheads of the given sessions in {RESULTS_DB}, "
+                             f"or of all recorded sessions combined if none are given.",
+                        metavar="RUN_ID",
+                        nargs='*')
+    parser.add_argument("--export",
+                        help="Also exports what --process-results shows, at full precision with the raw samples, "
+                             "as CSV and JSON, and as SVG charts over the workloads, to this directory.",
+                        metavar="DIR",
+                        type=Path)
+    parser.add_argument("--metric",
+                        help="Metric shown by --process-results.",
+                        choices=METRICS + list(PERF_EVENTS.values()) + [BINARY_SIZE] + ARTIFACT_METRICS + [HARNESS_TIME],
+                        default='wall_time')
+    parser.add_argument("--compare",
+                        help=f"Compares the overhead ratios of --metric recorded by the CANDIDATE sessions with those of the BASELINE "
+                             f"sessions in {RESULTS_DB}, each a comma-separated list of RUN_IDs, and exits with 1 if any regressed.",
+                        metavar=('BASELINE', 'CANDIDATE'),
+                        nargs=2)
+    parser.add_argument("--threshold",
+                        help="Relative increase of an overhead ratio that --compare treats as a regression if it is significant.",
+                        type=float,
+                        default=REGRESSION_THRESHOLD)
+    parser.add_argument("--merge-results",
+                        help=f"Merges the sessions in other results stores, e.g. from other machines, into {RESULTS_DB}.",
+                        metavar="RESULTS_DB",
+                        type=Path,
+                        nargs='+')
     args = parser.parse_args()
+    if args.export is not None and args.process_results is None:
+        parser.error("--export exports what --process-results shows and needs it")
+    #fi
+    run_id: str = args.resume or _new_run_id()
+    if any(getattr(args, command) for command in ['install_rust', 'install_rust_coverage_tools', 'install_cpp_coverage_tools', 'merge_results']) \
+            or any(getattr(args, collect) is not None for collect in ['collect_coverage_overhead_rust', 'collect_coverage_overhead_cpp', 'collect_coverage_overhead', 'test_impact']):
+        _setup_logging()
+    #fi
+    sampling: dict = {
+        'warmup': args.warmup,
+        'estimator': args.estimator,
+        'bootstrap': args.bootstrap,
+        'confidence': args.confidence,
+        'ci_target': args.ci_target,
+        'max_runs': args.max_runs,
+        'time_budget': args.time_budget,
+        'counters': args.perf,
+        'order': args.order,
+        'cpus': args.cpus,
+        'timeout': args.timeout,
+        'rebuild': args.rebuild,
+        'calibrate': args.calibrate,
+    }
+    matrix: dict = {
+        'shards': args.shards,
+        'profile': args.profile,
+        'threads': args.threads,
+        'opt_level': args.opt_level,
+        'counter_update': args.counter_update,
+        'artifact_dir': args.artifact_dir,
+    }
+    sweep: list[int] = geometric_workloads(*args.workload_sweep) if args.workload_sweep is not None else []
+    for collect in ['collect_coverage_overhead_rust', 'collect_coverage_overhead_cpp', 'collect_coverage_overhead']:
+        if getattr(args, collect) is not None:
+            setattr(args, collect, sorted(set(getattr(args, collect) or ([] if sweep else WORKLOAD)) | set(sweep)))
+        #fi
+    #rof
     if args.install_rust:
        install_rust()
     #fi
@@ -563,23 +4456,66 @@ if __name__ == "__main__":
        install_cpp_coverage_tools()
     #fi
     if args.gen_rust_tests is not None:
-       gen_rust_tests(args.gen_rust_tests[0])
+       gen_rust_tests(args.gen_rust_tests[0], shards=args.shards[0], profile=args.profile[0])
     #fi
     if args.gen_cpp_tests is not None:
-       gen_cpp_tests(args.gen_cpp_tests[0])
+       gen_cpp_tests(args.gen_cpp_tests[0], shards=args.shards[0], profile=args.profile[0])
     #fi
     if args.collect_coverage_overhead_rust is not None:
        collect_coverage_overhead_rust(workloads=args.collect_coverage_overhead_rust,
                                       average=args.average[0] if args.average is not None else 5,
-                                      should_process_log_file=True)
+                                      should_process_results=True,
+                                      use_build_cache=not args.no_build_cache,
+                                      jobs=args.jobs,
+                                      sampling=sampling,
+                                      extrapolate=args.extrapolate,
+                                      matrix=matrix,
+                                      tools=args.tools,
+                                      run_id=run_id)
     #fi
     if args.collect_coverage_overhead_cpp is not None:
        collect_coverage_overhead_cpp(workloads=args.collect_coverage_overhead_cpp,
                                      average=args.average[0] if args.average is not None else 5,
-                                     should_process_log_file=True)
+                                     should_process_results=True,
+                                     use_build_cache=not args.no_build_cache,
+                                     jobs=args.jobs,
+                                     sampling=sampling,
+                                     extrapolate=args.extrapolate,
+                                     matrix=matrix,
+                                     tools=args.tools,
+                                     run_id=run_id)
     #fi
     if args.collect_coverage_overhead is not None:
        collect_coverage_overhead(workloads=args.collect_coverage_overhead,
-                                 average=args.average[0] if args.average is not None else 5)
+                                 average=args.average[0] if args.average is not None else 5,
+                                 use_build_cache=not args.no_build_cache,
+                                 jobs=args.jobs,
+                                 sampling=sampling,
+                                 extrapolate=args.extrapolate,
+                                 matrix=matrix,
+                                 tools=args.tools,
+                                 run_id=run_id)
+    #fi
+    if args.test_impact is not None:
+       test_impact(workloads=args.test_impact,
+                   average=args.average[0] if args.average is not None else 5,
+                   use_build_cache=not args.no_build_cache,
+                   sampling=sampling,
+                   matrix=matrix,
+                   tools=args.tools,
+                   run_id=run_id)
+    #fi
+    if args.merge_results is not None:
+       merge_results(args.merge_results)
+    #fi
+    if args.process_results is not None:
+       process_results(workloads=[], run_ids=args.process_results, metric=args.metric, sampling=sampling, extrapolate=args.extrapolate,
+                       export_dir=args.export)
+    #fi
+    if args.compare is not None:
+       if compare_results(*(run_ids.split(",") for run_ids in args.compare), metric=args.metric, sampling=sampling, threshold=args.threshold):
+           logger.error("Coverage overhead regressed!")
+           sys.exit(1)
+       #fi
     #fi
 #fi
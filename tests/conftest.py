@@ -0,0 +1,26 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def results_db(tmp_path, monkeypatch):
+    """
+    Points the results store at a fresh database in tmp_path.
+    """
+    results_db = tmp_path / "results.db"
+    monkeypatch.setattr(main, 'RESULTS_DB', results_db)
+    return results_db
+#fed
+
+@pytest.fixture
+def configured():
+    """
+    Returns a factory of the registered adapter of a language and tool, configured with the default dimension
+    values except those given as keywords.
+    """
+    def configure(language, tool, **dimensions):
+        return main._adapter(language, tool).configured({**main.DIMENSIONS, **dimensions})
+    #fed
+    return configure
+#fed
@@ -0,0 +1,79 @@
+import pytest
+
+import main
+
+
+def test_every_tool_has_a_registered_baseline():
+    for (language, tool), adapter in main.COVERAGE_ADAPTERS.items():
+        assert adapter.language == language
+        assert adapter.name == tool
+        if adapter.baseline:
+            assert main._adapter(language, adapter.baseline).baseline is None
+        #fi
+    #rof
+#fed
+
+def test_language_tools_add_the_baselines_in_report_order():
+    assert main._language_tools('Cpp', ['clang-source', 'gcov']) == ['none', 'gcov', 'clang', 'clang-source']
+    assert main._language_tools('Rust', ['gcov']) == []
+#fed
+
+def test_an_incomplete_adapter_cannot_be_instantiated():
+    class IncompleteAdapter(main.CoverageAdapter):
+        def spec(self):
+            return {}
+        #fed
+    #ssalc
+    with pytest.raises(TypeError):
+        IncompleteAdapter()
+    #htiw
+#fed
+
+@pytest.mark.parametrize("language, tool", [('Cpp', 'none'), ('Rust', 'none'), ('Cpp', 'clang')])
+def test_baselines_are_not_coverage_sources(language, tool, tmp_path):
+    with pytest.raises(ValueError, match="not a coverage tool"):
+        main._adapter(language, tool).covered_lines(tmp_path)
+    #htiw
+#fed
+
+def test_tools_without_per_test_coverage_say_so(tmp_path):
+    with pytest.raises(ValueError, match="single test"):
+        main._adapter('Rust', 'tarpaulin').covered_lines(tmp_path)
+    #htiw
+#fed
+
+def test_configurations_combine_the_dimension_values():
+    configurations = main._configurations({'opt_level': ['0', '2'], 'counter_update': ['single', 'atomic']})
+    assert len(configurations) == 4
+    assert {(c['opt_level'], c['counter_update']) for c in configurations} == {('0', 'single'), ('0', 'atomic'), ('2', 'single'), ('2', 'atomic')}
+    assert all(c['shards'] == main.DIMENSIONS['shards'] for c in configurations)
+#fed
+
+def test_cpp_build_flags_of_the_optimization_level_and_counter_updates(configured):
+    assert configured('Cpp', 'gcov').build_flags() == main.GcovAdapter.flags
+    assert configured('Cpp', 'gcov', opt_level='2', counter_update='atomic').build_flags() == \
+        f"{main.GcovAdapter.flags} -O2 -fprofile-update=atomic"
+#fed
+
+def test_cpp_baselines_have_no_counters_to_update(configured):
+    assert configured('Cpp', 'none', counter_update='atomic').build_flags() == main.CppAdapter.flags
+#fed
+
+def test_rust_profile_env_of_the_optimization_level_and_atomic_counters(configured):
+    assert configured('Rust', 'instrument-coverage').profile_env() == {}
+    assert configured('Rust', 'instrument-coverage', opt_level='3', counter_update='prefer-atomic').profile_env() == {
+        'CARGO_PROFILE_DEV_OPT_LEVEL': '3',
+        'CARGO_PROFILE_TEST_OPT_LEVEL': '3',
+        'RUSTFLAGS': "-C llvm-args=-instrprof-atomic-counter-update-all",
+    }
+    assert 'RUSTFLAGS' not in configured('Rust', 'tarpaulin', counter_update='atomic').profile_env()
+#fed
+
+def test_rust_env_appends_atomic_counters_to_the_instrumentation(tmp_path, configured):
+    env = configured('Rust', 'instrument-coverage', counter_update='atomic').env(tmp_path)
+    assert env['RUSTFLAGS'] == "-C instrument-coverage -C llvm-args=-instrprof-atomic-counter-update-all"
+#fed
+
+def test_configured_builds_are_cached_apart(configured):
+    assert configured('Rust', 'none', opt_level='2').build_flags() != configured('Rust', 'none').build_flags()
+#fed
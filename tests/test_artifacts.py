@@ -0,0 +1,63 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def tmpfs(tmp_path, monkeypatch):
+    """
+    Points the tmpfs artifact directory at tmp_path.
+    """
+    monkeypatch.setattr(main, 'TMPFS_DIR', tmp_path / "shm")
+    return tmp_path / "shm"
+#fed
+
+def test_artifact_metrics_count_and_size(tmp_path):
+    (tmp_path / "a.gcda").write_bytes(b"x" * 10)
+    (tmp_path / "b.gcda").write_bytes(b"x" * 5)
+    assert main._artifact_metrics(sorted(tmp_path.glob("*.gcda"))) == {'artifact_count': 2, 'artifact_bytes': 15}
+    assert main._artifact_metrics([]) == {'artifact_count': 0, 'artifact_bytes': 0}
+#fed
+
+def test_only_relocatable_tools_and_baselines_support_tmpfs(configured):
+    assert configured('Cpp', 'gcov', artifact_dir='tmpfs').supports()
+    assert configured('Cpp', 'none', artifact_dir='tmpfs').supports()
+    assert not configured('Rust', 'llvm-cov', artifact_dir='tmpfs').supports()
+    assert configured('Rust', 'llvm-cov').supports()
+#fed
+
+def test_artifact_root_is_the_build_dir_by_default(tmp_path, tmpfs, configured):
+    assert configured('Cpp', 'gcov').artifact_root(tmp_path / "build") == tmp_path / "build"
+    assert not tmpfs.exists()
+#fed
+
+def test_artifact_root_on_tmpfs_is_per_build(tmp_path, tmpfs, configured):
+    root = configured('Cpp', 'gcov', artifact_dir='tmpfs').artifact_root(tmp_path / "gcov-1234")
+    assert root == tmpfs / "gcov-1234"
+    assert root.is_dir()
+#fed
+
+def test_gcov_redirects_gcda_files_to_tmpfs(tmp_path, tmpfs, configured):
+    build_dir = tmp_path / "gcov-1234"
+    assert configured('Cpp', 'gcov').env(build_dir) == {}
+    env = configured('Cpp', 'gcov', artifact_dir='tmpfs').env(build_dir)
+    assert env == {'GCOV_PREFIX': str(tmpfs / "gcov-1234"), 'GCOV_PREFIX_STRIP': str(len(build_dir.parts) - 1)}
+#fed
+
+def test_gcov_data_dir_links_the_notes_next_to_the_data(tmp_path, tmpfs, configured):
+    build_dir = tmp_path / "gcov-1234"
+    build_dir.mkdir()
+    (build_dir / "Task.gcno").write_bytes(b"notes")
+    data_dir = configured('Cpp', 'gcov', artifact_dir='tmpfs').data_dir(build_dir)
+    assert (data_dir / "Task.gcno").read_bytes() == b"notes"
+#fed
+
+def test_clean_removes_the_artifacts_of_the_last_run(tmp_path, configured):
+    (tmp_path / "Task.gcda").touch()
+    (tmp_path / "Task.gcno").touch()
+    adapter = configured('Cpp', 'gcov')
+    assert adapter.artifacts(tmp_path) == [tmp_path / "Task.gcda"]
+    adapter.clean(tmp_path)
+    assert adapter.artifacts(tmp_path) == []
+    assert adapter.notes(tmp_path) == [tmp_path / "Task.gcno"]
+#fed
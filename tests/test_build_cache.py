@@ -0,0 +1,55 @@
+import pytest
+
+import main
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    """
+    Points the build cache at tmp_path and returns a source directory with one source.
+    """
+    monkeypatch.setattr(main, 'CACHE_DIR', tmp_path / "cache")
+    source_dir = tmp_path / "src"
+    source_dir.mkdir()
+    (source_dir / "Task.cpp").write_text("int main() {}\n")
+    return source_dir
+#fed
+
+def _key(source_dir, flags="-O0", tool="gcov"):
+    return main._build_cache_key('Cpp', tool, flags, "true", source_dir, ["Task.cpp"])
+#fed
+
+def test_build_cache_key_is_stable(sources):
+    assert _key(sources) == _key(sources)
+#fed
+
+def test_build_cache_key_changes_with_sources_flags_and_tool(sources):
+    key = _key(sources)
+    assert _key(sources, flags="-O2") != key
+    assert _key(sources, tool="none") != key
+    (sources / "Task.cpp").write_text("int main() { return 0; }\n")
+    assert _key(sources) != key
+#fed
+
+def test_prepare_build_dir_hits_after_a_finished_build(sources):
+    build_dir, is_built = main._prepare_build_dir('Cpp', 'gcov', "-O0", "true", sources, ["Task.cpp"], True)
+    assert not is_built
+    assert (build_dir / "Task.cpp").read_text() == "int main() {}\n"
+    main._mark_built(build_dir)
+    assert main._prepare_build_dir('Cpp', 'gcov', "-O0", "true", sources, ["Task.cpp"], True) == (build_dir, True)
+#fed
+
+def test_prepare_build_dir_rebuilds_an_unfinished_build(sources):
+    build_dir, _ = main._prepare_build_dir('Cpp', 'gcov', "-O0", "true", sources, ["Task.cpp"], True)
+    (build_dir / "Task.o").touch()
+    assert main._prepare_build_dir('Cpp', 'gcov', "-O0", "true", sources, ["Task.cpp"], True) == (build_dir, False)
+    assert not (build_dir / "Task.o").exists()
+#fed
+
+def test_prepare_build_dir_without_cache_gives_every_run_its_own_build(sources):
+    first, _ = main._prepare_build_dir('Cpp', 'gcov', "-O0", "true", sources, ["Task.cpp"], False, run=1)
+    main._mark_built(first)
+    second, is_built = main._prepare_build_dir('Cpp', 'gcov', "-O0", "true", sources, ["Task.cpp"], False, run=2)
+    assert second != first
+    assert not is_built
+#fed
@@ -0,0 +1,90 @@
+import contextlib
+import subprocess
+
+import pytest
+
+import main
+
+
+class _ScriptedAdapter(main.CppAdapter):
+    """
+    Builds by running the shell script in the build directory instead of compiling.
+    """
+    name = 'scripted'
+
+    def build(self, build_dir):
+        return main._measured_run(["sh", "build.sh"], cwd=build_dir, timeout=self.timeout)
+    #fed
+#ssalc
+
+
+@pytest.fixture(autouse=True)
+def scripted_adapter(results_db, monkeypatch):
+    """
+    Registers the scripted adapter, with the results store in a fresh database.
+    """
+    monkeypatch.setitem(main.COVERAGE_ADAPTERS, ('Cpp', 'scripted'), _ScriptedAdapter())
+#fed
+
+def _build(build_dir, script, timeout=None):
+    build_dir.mkdir()
+    (build_dir / "build.sh").write_text(script)
+    return {'language': 'Cpp', 'tool': 'scripted', 'configuration': {**main.DIMENSIONS, 'timeout': timeout}, 'build_dir': build_dir}
+#fed
+
+def _variant(build_dir):
+    return {'run_id': 'session', 'language': 'Cpp', 'tool': 'scripted', 'workload': 100, 'run': 1, **main.DIMENSIONS,
+            'build_dir': build_dir}
+#fed
+
+def test_build_variant_marks_a_finished_build(tmp_path):
+    result = main._build_variant(_build(tmp_path / "build", "true\n"))
+    assert result['error'] is None
+    assert result['build_metrics']['wall_time'] > 0
+    assert (tmp_path / "build" / main.BUILD_STAMP).is_file()
+#fed
+
+def test_build_variant_reports_a_failed_build(tmp_path):
+    result = main._build_variant(_build(tmp_path / "build", "echo broken >&2; exit 1\n"))
+    assert "broken" in result['error']
+    assert result['build_metrics'] is None
+    assert not (tmp_path / "build" / main.BUILD_STAMP).exists()
+#fed
+
+def test_built_variants_skip_failed_builds(tmp_path):
+    build = _build(tmp_path / "build", "exit 1\n")
+    build_results = {build['build_dir']: main._build_variant(build)}
+    assert main._built_variants([_variant(build['build_dir'])], build_results) == []
+    with contextlib.closing(main._connect_results()) as conn:
+        assert conn.execute("SELECT status FROM manifest").fetchall() == [('failed',)]
+    #htiw
+#fed
+
+def test_built_variants_keep_finished_builds(tmp_path):
+    build = _build(tmp_path / "build", "true\n")
+    variant = _variant(build['build_dir'])
+    assert main._built_variants([variant], {build['build_dir']: main._build_variant(build)}) == [variant]
+#fed
+
+def test_build_variant_kills_a_hung_build(tmp_path):
+    result = main._build_variant(_build(tmp_path / "build", "sleep 10\n", timeout=0.2))
+    assert "timed out" in result['error']
+    assert not (tmp_path / "build" / main.BUILD_STAMP).exists()
+#fed
+
+def test_built_variants_leave_out_finished_runs_whose_build_was_skipped(tmp_path):
+    variant = _variant(tmp_path / "build")
+    assert main._built_variants([variant], {}, {main._run_key(variant)}) == []
+    with contextlib.closing(main._connect_results()) as conn:
+        assert conn.execute("SELECT status FROM manifest").fetchall() == []
+    #htiw
+#fed
+
+def test_measure_variant_records_a_missing_tool_as_failed(tmp_path, monkeypatch):
+    monkeypatch.setattr(_ScriptedAdapter, 'test', lambda self, build_dir, threads=0, tests=None: subprocess.run(["no-such-tool"]))
+    (tmp_path / "build").mkdir()
+    assert main._measure_variant(_variant(tmp_path / "build"), None) is None
+    with contextlib.closing(main._connect_results()) as conn:
+        assert conn.execute("SELECT status FROM manifest").fetchall() == [('failed',)]
+    #htiw
+#fed
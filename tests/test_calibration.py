@@ -0,0 +1,43 @@
+import pytest
+
+import main
+
+
+SAMPLING = {**main.SAMPLING_DEFAULTS, 'bootstrap': 200}
+CONFIGURATION = tuple(main.DIMENSIONS.values())
+
+
+def test_net_of_null_run_subtracts_the_fixed_cost():
+    null_run = main._summarize_times([0.5, 0.5], SAMPLING)
+    assert main._net_of_null_run([1.5, 2.5], null_run) == [1.0, 2.0]
+#fed
+
+def test_net_overhead_leaves_out_the_fixed_costs():
+    null_run = main._summarize_times([1.0, 1.0], SAMPLING)
+    null_baseline = main._summarize_times([0.5, 0.5], SAMPLING)
+    with_coverage = main._summarize_times(main._net_of_null_run([5.0, 5.0], null_run), SAMPLING)
+    without_coverage = main._summarize_times(main._net_of_null_run([2.5, 2.5], null_baseline), SAMPLING)
+    assert main._overhead_ratio(with_coverage, without_coverage, SAMPLING)[0] == 2.0
+#fed
+
+def test_toolchain_version_runs_chained_commands_one_by_one():
+    assert main._toolchain_version("echo first && echo second") == "first\nsecond"
+#fed
+
+def test_toolchain_version_of_a_missing_tool():
+    assert main._toolchain_version("coverage-benchmark-missing-tool --version") == ""
+#fed
+
+def test_print_calibration_shows_the_harness_and_net_overhead(capsys):
+    pytest.importorskip("tabulate")
+    null_times = {(main.NULL_WORKLOAD, 'Cpp', CONFIGURATION, 'none', 'test'): [0.5, 0.5],
+                  (main.NULL_WORKLOAD, 'Cpp', CONFIGURATION, 'gcov', 'test'): [1.0, 1.0]}
+    harness_times = {(main.NULL_WORKLOAD, 'Cpp', CONFIGURATION, 'none', 'test'): [0.01, 0.01]}
+    times = {(100, 'Cpp', CONFIGURATION, 'none', 'test'): [2.5, 2.5],
+             (100, 'Cpp', CONFIGURATION, 'gcov', 'test'): [5.0, 5.0]}
+    main._print_calibration(null_times, harness_times, times, [100], [CONFIGURATION], {'Cpp': ['gcov']}, {'Cpp': ['none']},
+                            'wall_time', SAMPLING)
+    output = capsys.readouterr().out
+    assert "Harness (null command, s)" in output
+    assert "2.0 [2.0, 2.0]" in output
+#fed
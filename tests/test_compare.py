@@ -0,0 +1,34 @@
+import pytest
+
+import main
+
+
+pytestmark = pytest.mark.usefixtures("results_db")
+
+
+def _record(run_id, tool, values, metric='major_faults'):
+    for run, value in enumerate(values, start=1):
+        main._record_phase_metrics({'run_id': run_id, 'language': 'Cpp', 'tool': tool, 'workload': 100, 'run': run, **main.DIMENSIONS},
+                                   {'test': {metric: value}})
+    #rof
+#fed
+
+def test_compare_results_of_a_metric_that_is_always_zero(capsys):
+    pytest.importorskip("tabulate")
+    for run_id in ['A', 'B']:
+        _record(run_id, 'gcov', [0, 0, 0])
+        _record(run_id, 'none', [0, 0, 0])
+    #rof
+    assert not main.compare_results(['A'], ['B'], metric='major_faults')
+    assert "not comparable" in capsys.readouterr().out
+#fed
+
+def test_compare_results_flags_a_regression(capsys):
+    pytest.importorskip("tabulate")
+    _record('A', 'gcov', [2.0, 2.1, 1.9, 2.0], 'wall_time')
+    _record('A', 'none', [1.0, 1.05, 0.95, 1.0], 'wall_time')
+    _record('B', 'gcov', [4.0, 4.2, 3.8, 4.0], 'wall_time')
+    _record('B', 'none', [1.0, 1.05, 0.95, 1.0], 'wall_time')
+    assert main.compare_results(['A'], ['B'], sampling={'bootstrap': 200})
+    assert "regressed" in capsys.readouterr().out
+#fed
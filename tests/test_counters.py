@@ -0,0 +1,46 @@
+import main
+
+
+PERF_OUTPUT = """
+# started on Sat Oct 17 22:00:00 2026
+
+1234567,,instructions:u,1000000,100.00,,
+<not counted>,,cycles:u,0,0.00,,
+42,,branch-misses:u,1000000,100.00,,
+<not supported>,,cache-misses:u,0,0.00,,
+"""
+
+
+def test_perf_counts_parse_counted_events():
+    assert main._perf_counts(PERF_OUTPUT) == {'instructions': 1234567.0, 'branch_misses': 42.0}
+#fed
+
+def test_perf_counts_of_fractional_counts():
+    assert main._perf_counts("1.5,,cycles,1000,100.00,,\n") == {'cycles': 1.5}
+#fed
+
+def test_perf_counts_ignore_other_events_and_lines():
+    assert main._perf_counts("12,,page-faults,1000,100.00,,\nnot csv\n") == {}
+#fed
+
+def test_measured_run_falls_back_to_rusage_without_perf(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, '_perf_available', lambda: False)
+    metrics = main._measured_run(["true"], cwd=tmp_path, counters=True)
+    assert set(main.METRICS) <= set(metrics)
+    assert not set(main.PERF_EVENTS.values()) & set(metrics)
+#fed
+
+def test_only_the_perf_configuration_counts_events(configured):
+    assert configured('Cpp', 'gcov', counters='perf').counters
+    assert not configured('Cpp', 'gcov').counters
+#fed
+
+def test_runs_under_perf_are_a_configuration_of_their_own(results_db):
+    for counters, wall_time in [('none', 1.0), ('perf', 1.5)]:
+        main._record_phase_metrics({'run_id': 'A', 'language': 'Cpp', 'tool': 'gcov', 'workload': 100, 'run': 1,
+                                    **main.DIMENSIONS, 'counters': counters}, {'test': {'wall_time': wall_time}})
+    #rof
+    _, configurations, times = main._query_times([], [])
+    assert [configuration[-1] for configuration in configurations] == ['none', 'perf']
+    assert [times[(100, 'Cpp', configuration, 'gcov', 'test')] for configuration in configurations] == [[1.0], [1.5]]
+#fed
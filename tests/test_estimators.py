@@ -0,0 +1,92 @@
+import argparse
+import math
+
+import pytest
+
+import main
+
+
+SAMPLING = {**main.SAMPLING_DEFAULTS, 'bootstrap': 200}
+
+
+def test_estimate_mean():
+    assert main._estimate([1.0, 2.0, 6.0], 'mean') == 3.0
+#fed
+
+def test_estimate_median():
+    assert main._estimate([1.0, 2.0, 60.0], 'median') == 2.0
+#fed
+
+def test_estimate_trimmed_drops_outliers():
+    samples = [1.0] * 8 + [0.0, 100.0]
+    assert main._estimate(samples, 'trimmed') == 1.0
+#fed
+
+def test_estimate_without_samples():
+    assert math.isnan(main._estimate([], 'mean'))
+#fed
+
+def test_bootstrap_ratio_ci_brackets_ratio():
+    low, high = main._bootstrap_ratio_ci([2.0, 2.2, 1.8, 2.1], [1.0, 1.1, 0.9, 1.0], SAMPLING)
+    assert low <= 2.0 <= high
+#fed
+
+def test_bootstrap_ratio_ci_of_constant_samples():
+    assert main._bootstrap_ratio_ci([3.0, 3.0, 3.0], [1.5, 1.5], SAMPLING) == (2.0, 2.0)
+#fed
+
+def test_bootstrap_ratio_ci_is_seeded():
+    numerator, denominator = [2.0, 2.5, 1.5, 2.2], [1.0, 1.2, 0.8]
+    assert main._bootstrap_ratio_ci(numerator, denominator, SAMPLING) == main._bootstrap_ratio_ci(numerator, denominator, SAMPLING)
+#fed
+
+def test_bootstrap_ratio_ci_needs_two_samples():
+    assert all(math.isnan(bound) for bound in main._bootstrap_ratio_ci([2.0], [1.0, 1.0], SAMPLING))
+#fed
+
+def test_bootstrap_ratio_change_of_an_unchanged_ratio():
+    baseline = ([2.0, 2.0, 2.0], [1.0, 1.0, 1.0])
+    assert main._bootstrap_ratio_change(baseline, baseline, SAMPLING) == (1.0, 1.0, 1.0)
+#fed
+
+def test_bootstrap_ratio_change_detects_a_regression():
+    baseline = ([2.0, 2.1, 1.9, 2.0], [1.0, 1.05, 0.95, 1.0])
+    candidate = ([3.0, 3.1, 2.9, 3.0], [1.0, 1.05, 0.95, 1.0])
+    low, high, p_value = main._bootstrap_ratio_change(baseline, candidate, SAMPLING)
+    assert 1.0 < low <= 1.5 <= high
+    assert p_value < 0.05
+#fed
+
+def test_bootstrap_ratio_change_needs_two_samples_of_each():
+    baseline = ([2.0, 2.0], [1.0, 1.0])
+    assert all(math.isnan(value) for value in main._bootstrap_ratio_change(baseline, ([3.0], [1.0, 1.0]), SAMPLING))
+#fed
+
+def test_ratio_of_a_zero_denominator_is_nan():
+    assert main._ratio(2.0, 4.0) == 0.5
+    assert math.isnan(main._ratio(0.0, 0.0))
+    assert math.isnan(main._ratio(1.0, math.nan))
+#fed
+
+def test_overhead_ratio_of_a_metric_that_is_always_zero():
+    zero = main._summarize_times([0.0, 0.0, 0.0], SAMPLING)
+    assert all(math.isnan(value) for value in main._overhead_ratio(zero, zero, SAMPLING))
+#fed
+
+def test_non_negative_int_takes_zero_warmup_runs():
+    assert main._non_negative_int("0") == 0
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._non_negative_int("-1")
+    #htiw
+#fed
+
+@pytest.mark.parametrize("value", ["0", "1", "-0.5", "95"])
+def test_confidence_level_rejects_levels_outside_the_open_unit_interval(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._confidence_level(value)
+    #htiw
+#fed
+
+def test_confidence_level_parses_a_level():
+    assert main._confidence_level("0.9") == 0.9
+#fed
@@ -0,0 +1,75 @@
+import csv
+import json
+import math
+import xml.etree.ElementTree as ElementTree
+
+import main
+
+
+SAMPLING = {**main.SAMPLING_DEFAULTS, 'bootstrap': 200}
+CONFIGURATION = tuple(main.DIMENSIONS.values())
+
+
+def _data():
+    """
+    Returns summaries shaped like those of process_results: gcov and its baseline at two workloads, test phase only.
+    """
+    samples: dict = {(100, 'none'): [1.0, 1.0], (100, 'gcov'): [2.0, 2.0], (1000, 'none'): [4.0, 4.0], (1000, 'gcov'): [6.0, 6.0]}
+    return {
+        workload: {'Cpp': {CONFIGURATION: {
+            tool: {phase: main._summarize_times(samples[(workload, tool)] if phase == 'test' else [], SAMPLING)
+                   for phase in main.PHASES + ['total']}
+            for tool in ['none', 'gcov']
+        }}}
+        for workload in [100, 1000]
+    }
+#fed
+
+def _export(tmp_path):
+    main.export_results(_data(), [CONFIGURATION], {'Cpp': ['gcov']}, {'Cpp': ['none']}, 'wall_time', SAMPLING, tmp_path / "export")
+    return tmp_path / "export"
+#fed
+
+def test_export_csv_has_a_row_per_recorded_phase(tmp_path):
+    with open(_export(tmp_path) / "wall_time.csv") as f:
+        rows = list(csv.DictReader(f))
+    #htiw
+    assert [(row['workload'], row['tool'], row['phase']) for row in rows] == [
+        ('100', 'none', 'test'), ('100', 'gcov', 'test'), ('1000', 'none', 'test'), ('1000', 'gcov', 'test')]
+    gcov = rows[1]
+    assert (gcov['baseline'], float(gcov['estimate']), float(gcov['ratio']), gcov['n']) == ('none', 2.0, 2.0, '2')
+    # The baselines have no ratio, which is left empty rather than written as nan.
+    assert rows[0]['ratio'] == ""
+#fed
+
+def test_export_json_keeps_full_precision_and_samples(tmp_path):
+    with open(_export(tmp_path) / "wall_time.json") as f:
+        records = json.load(f)
+    #htiw
+    gcov = next(record for record in records if record['tool'] == 'gcov' and record['workload'] == 1000)
+    assert gcov['ratio'] == 1.5
+    assert gcov['samples'] == [6.0, 6.0]
+    assert next(record for record in records if record['tool'] == 'none')['ratio'] is None
+#fed
+
+def test_export_samples_csv_has_every_sample(tmp_path):
+    with open(_export(tmp_path) / "wall_time_samples.csv") as f:
+        rows = list(csv.DictReader(f))
+    #htiw
+    assert len(rows) == 8
+    assert {row['sample'] for row in rows} == {'0', '1'}
+#fed
+
+def test_export_writes_parseable_svg_charts(tmp_path):
+    export_dir = _export(tmp_path)
+    assert sorted(path.name for path in export_dir.glob("*.svg")) == ["wall_time_test.svg", "wall_time_test_overhead.svg"]
+    for chart in export_dir.glob("*.svg"):
+        assert ElementTree.parse(chart).getroot().tag.endswith("svg")
+    #rof
+#fed
+
+def test_overhead_ratio_with_confidence_interval():
+    ratio, low, high = main._overhead_ratio(main._summarize_times([3.0, 3.0], SAMPLING), main._summarize_times([1.5, 1.5], SAMPLING), SAMPLING)
+    assert (ratio, low, high) == (2.0, 2.0, 2.0)
+    assert math.isnan(main._overhead_ratio(main._summarize_times([3.0], SAMPLING), main._summarize_times([], SAMPLING), SAMPLING)[0])
+#fed
@@ -0,0 +1,57 @@
+import argparse
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("num_tests, shards", [(10, 3), (7, 7), (3, 5), (1000, 16)])
+def test_shard_ranges_cover_every_test_once(num_tests, shards):
+    ranges = main._shard_ranges(num_tests, shards)
+    assert len(ranges) == shards
+    assert [i for shard in ranges for i in shard] == list(range(1, num_tests + 1))
+    assert max(map(len, ranges)) - min(map(len, ranges)) <= 1
+#fed
+
+def test_shard_ranges_are_contiguous():
+    assert main._shard_ranges(10, 3) == [range(1, 4), range(4, 7), range(7, 11)]
+#fed
+
+def test_positive_int_parses_a_number_of_shards():
+    assert main._positive_int("4") == 4
+#fed
+
+@pytest.mark.parametrize("value", ["0", "-2"])
+def test_positive_int_rejects_non_positive(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._positive_int(value)
+    #htiw
+#fed
+
+def test_workload_profile_accepts_names():
+    assert main._workload_profile('branchy') == 'branchy'
+#fed
+
+def test_workload_profile_fills_in_manager_parameters():
+    assert main._workload_profile('io=2') == 'loop=1000,branch=0.25,io=2'
+    assert main._profile_parameters('loop=10,branch=0.5') == {'loop': 10, 'branch': 0.5, 'io': 0}
+#fed
+
+@pytest.mark.parametrize("value", ["speed=3", "loop=0", "branch=1.5", "io=-1", "loop=many"])
+def test_workload_profile_rejects_invalid_parameters(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._workload_profile(value)
+    #htiw
+#fed
+
+@pytest.mark.parametrize("i, loop, period", [(0, 10, 4), (3, 10, 4), (5, 1000, 1), (2, 1, 3), (7, 13, 2), (4, 5, 0)])
+def test_completed_tasks_counts_the_generated_condition(i, loop, period):
+    expected = sum((j + i) % period == 0 for j in range(loop)) if period else 0
+    assert main._completed_tasks(i, loop, period) == expected
+#fed
+
+def test_completion_period():
+    assert main._completion_period(0.25) == 4
+    assert main._completion_period(0.9) == 1
+    assert main._completion_period(0.0) == 0
+#fed
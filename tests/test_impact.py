@@ -0,0 +1,96 @@
+import random
+from types import SimpleNamespace
+
+import main
+
+
+OLD = "a\nb\nc\nd\n"
+
+
+def test_encode_lines_round_trip():
+    lines = {1, 2, 17, 300}
+    assert main._decode_lines(main._encode_lines(lines)) == lines
+    assert main._encode_lines({0, 3}) == "9"
+    assert main._decode_lines(main._encode_lines(set())) == set()
+#fed
+
+def test_changed_lines_of_an_edit():
+    changed, moved = main._changed_lines(OLD, "a\nB\nc\nd\n")
+    assert changed == {2}
+    assert moved == {1: 1, 3: 3, 4: 4}
+#fed
+
+def test_changed_lines_of_a_deletion():
+    changed, moved = main._changed_lines(OLD, "a\nc\nd\n")
+    assert changed == {2}
+    assert moved == {1: 1, 3: 2, 4: 3}
+#fed
+
+def test_changed_lines_around_an_insertion():
+    changed, moved = main._changed_lines(OLD, "a\nb\nx\nc\nd\n")
+    assert changed == {2, 3}
+    assert moved == {1: 1, 2: 2, 3: 4, 4: 5}
+#fed
+
+def test_changed_lines_of_unchanged_text():
+    assert main._changed_lines(OLD, OLD) == (set(), {1: 1, 2: 2, 3: 3, 4: 4})
+#fed
+
+def _index():
+    return {
+        'sources': {'tasks.rs': OLD, 'other.rs': OLD},
+        'tests': {
+            'covers_b': {'tasks.rs': {1, 2}},
+            'covers_d': {'tasks.rs': {4}, 'other.rs': {2}},
+            'covers_nothing': {},
+        },
+    }
+#fed
+
+def test_select_tests_covering_the_edit(tmp_path):
+    (tmp_path / "tasks.rs").write_text("a\nB\nc\nd\n")
+    (tmp_path / "other.rs").write_text(OLD)
+    selected, diffs = main._select_tests(_index(), tmp_path)
+    assert selected == ['covers_b']
+    assert list(diffs) == ['tasks.rs']
+#fed
+
+def test_select_tests_without_changes(tmp_path):
+    (tmp_path / "tasks.rs").write_text(OLD)
+    (tmp_path / "other.rs").write_text(OLD)
+    assert main._select_tests(_index(), tmp_path) == ([], {})
+#fed
+
+def test_update_coverage_index_moves_lines_of_unselected_tests(tmp_path):
+    (tmp_path / "tasks.rs").write_text("x\na\nb\nc\nd\n")
+    (tmp_path / "other.rs").write_text(OLD)
+    index = _index()
+    selected, diffs = main._select_tests(index, tmp_path)
+    assert selected == ['covers_b']
+    main._update_coverage_index(SimpleNamespace(impact_sources=['tasks.rs', 'other.rs']), tmp_path, index, [], diffs)
+    assert index['tests']['covers_d'] == {'tasks.rs': {5}, 'other.rs': {2}}
+    assert index['sources']['tasks.rs'] == "x\na\nb\nc\nd\n"
+#fed
+
+def test_coverage_index_round_trip(tmp_path):
+    index = _index()
+    assert main._save_coverage_index(tmp_path, index) > 0
+    loaded = main._load_coverage_index(tmp_path)
+    assert loaded['sources'] == index['sources']
+    assert loaded['tests'] == {'covers_b': {'tasks.rs': {1, 2}}, 'covers_d': {'tasks.rs': {4}, 'other.rs': {2}}, 'covers_nothing': {}}
+#fed
+
+def test_impact_edit_replaces_its_previous_edit(tmp_path):
+    (tmp_path / "tasks.rs").write_text(OLD)
+    index = {'sources': {}, 'tests': {'covers_b': {'tasks.rs': {2}}}}
+    rng = random.Random(0)
+    assert main._impact_edit(tmp_path, index, rng)
+    assert main._impact_edit(tmp_path, index, rng)
+    lines = (tmp_path / "tasks.rs").read_text().splitlines()
+    assert lines[0] == "a" and lines[2:] == ["c", "d"]
+    assert lines[1].startswith("b" + main.IMPACT_MARKER) and lines[1].count(main.IMPACT_MARKER) == 1
+#fed
+
+def test_impact_edit_without_covered_lines(tmp_path):
+    assert not main._impact_edit(tmp_path, {'sources': {}, 'tests': {'covers_nothing': {}}}, random.Random(0))
+#fed
@@ -0,0 +1,27 @@
+import json
+import shutil
+import subprocess
+import sys
+
+import main
+
+
+def test_import_has_no_side_effects(tmp_path):
+    """
+    Imports a copy of the harness in a fresh interpreter, so that whatever it creates lands next to the copy.
+    """
+    shutil.copy(main.__file__, tmp_path / "main.py")
+    output = subprocess.run(
+        [sys.executable, "-B", "-c", "import json, sys, main; print(json.dumps(sorted(set(sys.modules) & {'seutil', 'tabulate'})))"],
+        cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+    assert json.loads(output.stdout) == []
+    assert output.stderr == ""
+    assert [path.name for path in tmp_path.iterdir()] == ["main.py"]
+#fed
+
+def test_session_defaults():
+    session = main.BenchmarkSession()
+    assert session.sampling == main.SAMPLING_DEFAULTS
+    assert session.jobs == 1
+#fed
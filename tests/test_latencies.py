@@ -0,0 +1,50 @@
+import json
+import math
+
+import pytest
+
+import main
+
+
+def test_percentile_interpolates_between_ranks():
+    values = [4.0, 1.0, 3.0, 2.0]
+    assert main._percentile(values, 0) == 1.0
+    assert main._percentile(values, 50) == 2.5
+    assert main._percentile(values, 100) == 4.0
+    assert main._percentile(values, 95) == pytest.approx(3.85)
+#fed
+
+def test_percentile_of_one_value():
+    assert main._percentile([7.0], 99) == 7.0
+#fed
+
+def test_percentile_without_values():
+    assert math.isnan(main._percentile([], 50))
+#fed
+
+def test_cpp_test_latencies_prefer_the_listener(tmp_path):
+    results_dir = tmp_path / main.TEST_RESULTS_DIR
+    results_dir.mkdir()
+    (results_dir / "0.latencies").write_text("TaskTest.Add 1500\nTaskTest.Complete 2500000\n")
+    (results_dir / "0.json").write_text(json.dumps({'testsuites': [{'name': 'TaskTest', 'testsuite': [{'name': 'Add', 'time': '0s'}]}]}))
+    latencies = main._adapter('Cpp', 'gcov').test_latencies(tmp_path)
+    assert latencies == {'TaskTest.Add': 1.5e-06, 'TaskTest.Complete': 0.0025}
+#fed
+
+def test_cpp_test_latencies_fall_back_to_gtest_json(tmp_path):
+    results_dir = tmp_path / main.TEST_RESULTS_DIR
+    results_dir.mkdir()
+    (results_dir / "0.json").write_text(json.dumps({'testsuites': [{'name': 'TaskTest', 'testsuite': [
+        {'name': 'Add', 'status': 'RUN', 'time': '0.001s'},
+        {'name': 'Skipped', 'status': 'NOTRUN', 'time': '0s'},
+    ]}]}))
+    assert main._adapter('Cpp', 'gcov').test_latencies(tmp_path) == {'TaskTest.Add': 0.001}
+#fed
+
+def test_rust_test_latencies_read_libtest_events(tmp_path):
+    results_dir = tmp_path / main.TEST_RESULTS_DIR
+    results_dir.mkdir()
+    events = [{'type': 'suite', 'event': 'started'}, {'type': 'test', 'event': 'ok', 'name': 'tests::test1_tasks', 'exec_time': 0.0002}]
+    (results_dir / "0.json").write_text("".join(json.dumps(event) + "\n" for event in events))
+    assert main._adapter('Rust', 'llvm-cov').test_latencies(tmp_path) == {'tests::test1_tasks': 0.0002}
+#fed
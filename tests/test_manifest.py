@@ -0,0 +1,40 @@
+import contextlib
+
+import pytest
+
+import main
+
+
+pytestmark = pytest.mark.usefixtures("results_db")
+
+
+def _variant(run_id='session', tool='gcov', run=1):
+    return {'run_id': run_id, 'language': 'Cpp', 'tool': tool, 'workload': 100, 'run': run, **main.DIMENSIONS}
+#fed
+
+def test_finished_runs_of_an_empty_store():
+    assert main._finished_runs('session') == set()
+#fed
+
+def test_finished_runs_are_the_done_runs_of_the_session():
+    main._record_run_status(_variant(run=1), 'done')
+    main._record_run_status(_variant(run=2), 'failed', "timed out")
+    main._record_run_status(_variant(tool='none', run=1), 'done')
+    main._record_run_status(_variant(run_id='other', run=3), 'done')
+    assert main._finished_runs('session') == {main._run_key(_variant(run=1)), main._run_key(_variant(tool='none', run=1))}
+#fed
+
+def test_run_key_matches_finished_runs():
+    variant = _variant(run=4)
+    main._record_run_status(variant, 'done')
+    assert main._run_key(variant) in main._finished_runs('session')
+#fed
+
+def test_discard_run_keeps_other_runs():
+    main._record_test_latencies(_variant(run=1), {'TaskTest.Add': 0.001})
+    main._record_test_latencies(_variant(run=2), {'TaskTest.Add': 0.002})
+    main._discard_run(_variant(run=1))
+    with contextlib.closing(main._connect_results()) as conn:
+        assert conn.execute("SELECT repetition, duration FROM test_latencies").fetchall() == [(2, 0.002)]
+    #htiw
+#fed
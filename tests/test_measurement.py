@@ -0,0 +1,62 @@
+import subprocess
+
+import pytest
+
+import main
+
+
+def test_measured_run_returns_every_metric(tmp_path):
+    metrics = main._measured_run(["true"], cwd=tmp_path)
+    assert set(main.METRICS) <= set(metrics)
+    assert metrics['wall_time'] > 0
+    assert metrics['max_rss'] > 0
+#fed
+
+def test_measured_run_writes_stdout_with_env(tmp_path):
+    main._measured_run(["sh", "-c", "echo $COVERAGE_BENCHMARK_TEST"], cwd=tmp_path, env={'COVERAGE_BENCHMARK_TEST': "value"},
+                       stdout=tmp_path / "out.txt")
+    assert (tmp_path / "out.txt").read_text() == "value\n"
+#fed
+
+def test_measured_run_raises_on_failure(tmp_path):
+    with pytest.raises(main.MeasuredRunError) as error:
+        main._measured_run(["sh", "-c", "echo broken >&2; exit 3"], cwd=tmp_path)
+    #htiw
+    assert error.value.returncode == 3
+    assert "broken" in str(error.value)
+#fed
+
+def test_measured_run_kills_on_timeout(tmp_path):
+    with pytest.raises(subprocess.TimeoutExpired):
+        main._measured_run(["sleep", "10"], cwd=tmp_path, timeout=0.2)
+    #htiw
+#fed
+
+def test_combine_metrics_adds_times_and_keeps_the_peak_memory():
+    first = {metric: 1.0 for metric in main.METRICS}
+    second = {metric: 2.0 for metric in main.METRICS}
+    combined = main._combine_metrics([first, second])
+    assert combined['wall_time'] == 3.0
+    assert combined['user_time'] == 3.0
+    assert combined['max_rss'] == 2.0
+#fed
+
+def test_combine_metrics_keeps_counts_only_if_every_run_has_them():
+    event = next(iter(main.PERF_EVENTS.values()))
+    first = {**{metric: 1.0 for metric in main.METRICS}, event: 10}
+    second = {metric: 1.0 for metric in main.METRICS}
+    assert event not in main._combine_metrics([first, second])
+    assert main._combine_metrics([first, first])[event] == 20
+#fed
+
+def test_measured_concurrent_runs_overlap(tmp_path):
+    concurrent = main._measured_concurrent_runs([["sleep", "0.3"]] * 3, cwd=tmp_path)
+    serial = main._measured_concurrent_runs([["sleep", "0.3"]] * 3, cwd=tmp_path, jobs=1)
+    assert concurrent['wall_time'] >= 0.3
+    assert concurrent['wall_time'] < serial['wall_time']
+#fed
+
+def test_measured_concurrent_runs_at_most_jobs_at_once(tmp_path):
+    metrics = main._measured_concurrent_runs([["sleep", "0.2"]] * 2, cwd=tmp_path, jobs=1)
+    assert metrics['wall_time'] >= 0.4
+#fed
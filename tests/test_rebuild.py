@@ -0,0 +1,54 @@
+import shutil
+
+import pytest
+
+import main
+
+
+def test_scripted_edit_replaces_its_previous_edit(tmp_path):
+    path = tmp_path / "Task.cpp"
+    path.write_text("int f() { return 1; }\n")
+    main._scripted_edit(path)
+    first = path.read_text()
+    main._scripted_edit(path)
+    lines = path.read_text().splitlines()
+    assert path.read_text() != first
+    assert lines[0] == "int f() { return 1; }"
+    assert len(lines) == 2 and lines[1].startswith(main.EDIT_MARKER)
+#fed
+
+def test_edit_target_of_the_sources(tmp_path, configured):
+    assert configured('Cpp', 'gcov').edit_target(tmp_path, 'source') == tmp_path / "Task.cpp"
+    assert configured('Rust', 'llvm-cov').edit_target(tmp_path, 'source') == tmp_path / "src/tasks.rs"
+#fed
+
+def test_edit_target_of_the_tests_is_the_first_shard(tmp_path, configured):
+    assert configured('Cpp', 'gcov').edit_target(tmp_path, 'test') == tmp_path / "tests.cpp"
+    for k in [10, 2, 0]:
+        (tmp_path / f"tests_{k}.cpp").touch()
+    #rof
+    assert configured('Cpp', 'gcov').edit_target(tmp_path, 'test') == tmp_path / "tests_0.cpp"
+#fed
+
+def test_edit_target_of_the_rust_tests(tmp_path, configured):
+    assert configured('Rust', 'none').edit_target(tmp_path, 'test') == tmp_path / "src/tests.rs"
+    (tmp_path / "src/tests").mkdir(parents=True)
+    for k in [11, 1]:
+        (tmp_path / f"src/tests/shard_{k}.rs").touch()
+    #rof
+    assert configured('Rust', 'none').edit_target(tmp_path, 'test') == tmp_path / "src/tests/shard_1.rs"
+#fed
+
+@pytest.mark.skipif(not shutil.which("g++") or not (main.GTEST_LIB_DIR / "libgtest.a").is_file(), reason="needs g++ and GoogleTest")
+def test_measured_cpp_build_compiles_only_stale_units(tmp_path):
+    (tmp_path / "Task.h").write_text("int f();\n")
+    (tmp_path / "Task.cpp").write_text('#include "Task.h"\nint f() { return 1; }\n')
+    (tmp_path / "main.cpp").write_text('#include "Task.h"\nint main() { return f() - 1; }\n')
+    metrics = main._measured_cpp_build(tmp_path, main.CPP_FLAGS)
+    assert metrics['wall_time'] > 0
+    compiled = {unit: (tmp_path / f"{unit}.o").stat().st_mtime_ns for unit in ["Task", "main"]}
+    main._scripted_edit(tmp_path / "Task.cpp")
+    main._measured_cpp_build(tmp_path, main.CPP_FLAGS)
+    assert (tmp_path / "Task.o").stat().st_mtime_ns > compiled['Task']
+    assert (tmp_path / "main.o").stat().st_mtime_ns == compiled['main']
+#fed
@@ -0,0 +1,69 @@
+import contextlib
+import sqlite3
+
+import pytest
+
+import main
+
+
+pytestmark = pytest.mark.usefixtures("results_db")
+
+
+def _variant(run_id='session', tool='gcov', run=1):
+    return {'run_id': run_id, 'language': 'Cpp', 'tool': tool, 'workload': 100, 'run': run, **main.DIMENSIONS}
+#fed
+
+def test_recorded_phases_are_queried_back():
+    main._record_phase_metrics(_variant(run=1), {'test': {'wall_time': 1.0}, 'report': {'wall_time': 0.5}})
+    main._record_phase_metrics(_variant(run=2), {'test': {'wall_time': 3.0}})
+    workloads, configurations, times = main._query_times([], ['session'])
+    configuration = tuple(main.DIMENSIONS.values())
+    assert workloads == [100]
+    assert configurations == [configuration]
+    assert times[(100, 'Cpp', configuration, 'gcov', 'test')] == [1.0, 3.0]
+    assert times[(100, 'Cpp', configuration, 'gcov', 'report')] == [0.5]
+#fed
+
+def test_total_is_recorded_only_with_a_build():
+    build = {metric: 2.0 for metric in main.METRICS}
+    test = {metric: 1.0 for metric in main.METRICS}
+    main._record_phase_metrics(_variant(run=1), {'build': build, 'test': test})
+    main._record_phase_metrics(_variant(run=2), {'test': test})
+    times = main._query_times([], ['session'])[2]
+    assert times[(100, 'Cpp', tuple(main.DIMENSIONS.values()), 'gcov', 'total')] == [3.0]
+#fed
+
+def test_query_times_of_other_sessions_and_metrics():
+    main._record_phase_metrics(_variant(run_id='first'), {'test': {'wall_time': 1.0, 'max_rss': 10}})
+    main._record_phase_metrics(_variant(run_id='second'), {'test': {'wall_time': 2.0}})
+    assert list(main._query_times([], ['first'])[2].values()) == [[1.0]]
+    assert list(main._query_times([], ['second'], 'max_rss')[2].values()) == []
+#fed
+
+def test_connect_results_adds_the_columns_of_new_dimensions(tmp_path):
+    old_db = tmp_path / "old.db"
+    with contextlib.closing(sqlite3.connect(old_db)) as conn:
+        conn.execute("CREATE TABLE measurements (id INTEGER PRIMARY KEY, run_id TEXT NOT NULL, timestamp TEXT NOT NULL, "
+                     "git_revision TEXT NOT NULL, host TEXT NOT NULL, language TEXT NOT NULL, tool TEXT NOT NULL, "
+                     "tool_version TEXT NOT NULL, workload INTEGER NOT NULL, repetition INTEGER NOT NULL, phase TEXT NOT NULL, "
+                     "metric TEXT NOT NULL, value REAL NOT NULL)")
+        conn.execute("INSERT INTO measurements (run_id, timestamp, git_revision, host, language, tool, tool_version, workload, "
+                     "repetition, phase, metric, value) VALUES ('old', '', '', '', 'Cpp', 'gcov', '', 100, 1, 'test', 'wall_time', 1.0)")
+        conn.commit()
+    #htiw
+    with contextlib.closing(main._connect_results(old_db)) as conn:
+        assert conn.execute(f"SELECT {', '.join(main.DIMENSIONS)} FROM measurements").fetchall() == [tuple(main.DIMENSIONS.values())]
+    #htiw
+#fed
+
+def test_merge_results_skips_sessions_already_in_the_store(tmp_path, monkeypatch, results_db):
+    other_db = tmp_path / "other.db"
+    monkeypatch.setattr(main, 'RESULTS_DB', other_db)
+    main._record_phase_metrics(_variant(run_id='shared'), {'test': {'wall_time': 5.0}})
+    main._record_phase_metrics(_variant(run_id='remote'), {'test': {'wall_time': 2.0}})
+    monkeypatch.setattr(main, 'RESULTS_DB', results_db)
+    main._record_phase_metrics(_variant(run_id='shared'), {'test': {'wall_time': 1.0}})
+    main.merge_results([other_db])
+    assert list(main._query_times([], ['shared'])[2].values()) == [[1.0]]
+    assert list(main._query_times([], ['remote'])[2].values()) == [[2.0]]
+#fed
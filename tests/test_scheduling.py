@@ -0,0 +1,45 @@
+import main
+
+
+def _sampling(order):
+    return {**main.SAMPLING_DEFAULTS, 'order': order}
+#fed
+
+def _cells(tools, runs):
+    return [[{'tool': tool, 'run': run} for run in range(1, runs + 1)] for tool in tools]
+#fed
+
+def test_order_repetition_fixed():
+    assert main._order_repetition(['a', 'b', 'c'], 2, _sampling('fixed')) == ['a', 'b', 'c']
+#fed
+
+def test_order_repetition_abba_reverses_even_runs():
+    assert main._order_repetition(['a', 'b'], 1, _sampling('abba')) == ['a', 'b']
+    assert main._order_repetition(['a', 'b'], 2, _sampling('abba')) == ['b', 'a']
+#fed
+
+def test_order_repetition_latin_puts_every_variant_in_every_position():
+    orders = [main._order_repetition(['a', 'b', 'c'], run, _sampling('latin')) for run in range(1, 4)]
+    assert orders == [['a', 'b', 'c'], ['b', 'c', 'a'], ['c', 'a', 'b']]
+    for position in range(3):
+        assert {order[position] for order in orders} == {'a', 'b', 'c'}
+    #rof
+#fed
+
+def test_order_repetition_random_is_a_seeded_permutation():
+    repetition = list(range(10))
+    order = main._order_repetition(repetition, 3, _sampling('random'))
+    assert sorted(order) == repetition
+    assert order == main._order_repetition(repetition, 3, _sampling('random'))
+    assert repetition == list(range(10))
+#fed
+
+def test_schedule_fixed_keeps_cells_together():
+    schedule = main._schedule(_cells(['gcov', 'none'], 2), _sampling('fixed'))
+    assert [(variant['tool'], variant['run']) for variant in schedule] == [('gcov', 1), ('gcov', 2), ('none', 1), ('none', 2)]
+#fed
+
+def test_schedule_interleaves_repetitions():
+    schedule = main._schedule(_cells(['gcov', 'none'], 2), _sampling('abba'))
+    assert [(variant['tool'], variant['run']) for variant in schedule] == [('gcov', 1), ('none', 1), ('none', 2), ('gcov', 2)]
+#fed
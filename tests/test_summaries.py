@@ -0,0 +1,38 @@
+import math
+
+import main
+
+
+SAMPLING = {**main.SAMPLING_DEFAULTS, 'bootstrap': 200}
+
+
+def test_summarize_times_of_one_phase():
+    summary = main._summarize_times([1.0, 2.0, 3.0], SAMPLING)
+    assert summary['avg'] == 2.0
+    assert summary['stdev'] == 1.0
+    assert summary['samples'] == [1.0, 2.0, 3.0]
+#fed
+
+def test_summarize_times_of_one_sample():
+    assert main._summarize_times([4.0], SAMPLING)['stdev'] == 0.0
+#fed
+
+def test_summarize_times_without_samples():
+    summary = main._summarize_times([], SAMPLING)
+    assert math.isnan(summary['avg'])
+    assert math.isnan(summary['stdev'])
+#fed
+
+def test_overhead_with_confidence_interval():
+    with_coverage = main._summarize_times([3.0, 3.0, 3.0], SAMPLING)
+    without_coverage = main._summarize_times([1.5, 1.5], SAMPLING)
+    assert main._overhead(with_coverage, without_coverage, SAMPLING) == "2.0 [2.0, 2.0]"
+#fed
+
+def test_overhead_of_single_samples_has_no_confidence_interval():
+    assert main._overhead(main._summarize_times([3.0], SAMPLING), main._summarize_times([2.0], SAMPLING), SAMPLING) == "1.5"
+#fed
+
+def test_overhead_of_a_phase_without_baseline_samples():
+    assert main._overhead(main._summarize_times([3.0], SAMPLING), main._summarize_times([], SAMPLING), SAMPLING) == "nan"
+#fed
@@ -0,0 +1,57 @@
+import argparse
+import math
+
+import pytest
+
+import main
+
+
+def test_workload_parses_underscores():
+    assert main._workload("1_000_000") == 1000000
+#fed
+
+@pytest.mark.parametrize("value", ["0", "-5"])
+def test_workload_rejects_non_positive(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        main._workload(value)
+    #htiw
+#fed
+
+def test_geometric_workloads_spans_start_to_stop():
+    assert main.geometric_workloads(10, 1000, 3) == [10, 100, 1000]
+#fed
+
+def test_geometric_workloads_drops_duplicates():
+    assert main.geometric_workloads(1, 3, 5) == [1, 2, 3]
+#fed
+
+def test_geometric_workloads_single_point():
+    assert main.geometric_workloads(100, 1000, 1) == [100]
+#fed
+
+def test_fit_cost_model_recovers_exact_line():
+    fit = main._fit_cost_model({workload: [0.5 + 0.001 * workload] * 2 for workload in [100, 1000, 10000]})
+    assert fit['fixed'] == pytest.approx(0.5)
+    assert fit['per_test'] == pytest.approx(0.001)
+    assert fit['fixed_se'] == pytest.approx(0.0, abs=1e-9)
+    assert fit['per_test_se'] == pytest.approx(0.0, abs=1e-9)
+#fed
+
+def test_fit_cost_model_standard_errors_of_noisy_samples():
+    fit = main._fit_cost_model({1: [1.0, 3.0], 3: [3.0, 5.0]})
+    assert fit['per_test'] == pytest.approx(1.0)
+    assert fit['fixed'] == pytest.approx(1.0)
+    assert fit['per_test_se'] == pytest.approx(math.sqrt(2.0 / 4))
+    assert fit['fixed_se'] == pytest.approx(math.sqrt(2.0 * (1 / 4 + 4 / 4)))
+#fed
+
+def test_fit_cost_model_needs_two_workloads():
+    fit = main._fit_cost_model({100: [1.0, 1.1, 0.9]})
+    assert all(math.isnan(value) for value in fit.values())
+#fed
+
+def test_fit_cost_model_without_standard_errors_for_two_samples():
+    fit = main._fit_cost_model({1: [2.0], 2: [3.0]})
+    assert fit['per_test'] == pytest.approx(1.0)
+    assert math.isnan(fit['per_test_se'])
+#fed